@@ -27,14 +27,41 @@ if _HAS_HOMEASSISTANT:
     from datetime import datetime
     from pathlib import Path
 
-    from .const import DOMAIN, CONF_PORT, CONF_PASSWORD, DEFAULT_PORT
+    from .const import (
+        DOMAIN,
+        CONF_PORT,
+        CONF_PASSWORD,
+        CONF_HISTORY,
+        CONF_REFRESH_WINDOW,
+        CONF_FRAME_EVENT_COMMANDS,
+        CONF_FRAME_EVENT_RATE,
+        CONF_FRAME_EVENT_BATCH,
+        CONF_CAPTURE,
+        DEFAULT_PORT,
+        DEFAULT_HISTORY,
+        DEFAULT_REFRESH_WINDOW,
+        DEFAULT_FRAME_EVENT_COMMANDS,
+        DEFAULT_FRAME_EVENT_RATE,
+        DEFAULT_FRAME_EVENT_BATCH,
+        DEFAULT_CAPTURE,
+        CAPTURE_DIRECTORY,
+        HISTORY_DIRECTORY,
+        HISTORY_MAX_SEGMENTS,
+        STORAGE_KEY,
+        STORAGE_VERSION,
+    )
     from .coordinator import AMTCoordinator
+    from .event_bridge import FrameEventBridge, parse_command_list
+    from .panels import AMTPanelManager, async_remove_panel_storage
 
     _LOGGER = logging.getLogger(__name__)
 
     # Importa da biblioteca local
     from .lib.server import AMTServer, AMTServerConfig
     from .lib.protocol.isecnet import ISECNetFrame
+    from .lib.protocol.events import PanelEvent, EVENT_COMMAND
+    from .lib.history import SnapshotLogRecorder, SnapshotLogWriter
+    from homeassistant.helpers.storage import Store
 
     PLATFORMS: list[Platform] = [
         Platform.ALARM_CONTROL_PANEL,
@@ -54,11 +81,20 @@ if _HAS_HOMEASSISTANT:
         port = entry.data.get(CONF_PORT, DEFAULT_PORT)
         password = entry.data.get(CONF_PASSWORD, "")
         
+        # Captura de tráfego (diagnóstico): um arquivo por início da integração
+        capture_path: str | None = None
+        if entry.options.get(CONF_CAPTURE, DEFAULT_CAPTURE):
+            capture_path = hass.config.path(
+                CAPTURE_DIRECTORY,
+                f"{entry.entry_id}-{datetime.now():%Y%m%d-%H%M%S}.amtcap",
+            )
+        
         # Cria configuração do servidor
         config = AMTServerConfig(
             host="0.0.0.0",
             port=port,
             auto_ack_heartbeat=True,
+            capture_path=capture_path,
         )
         
         # Cria o servidor
@@ -71,34 +107,68 @@ if _HAS_HOMEASSISTANT:
             connection_id=None,  # Será atualizado quando conectar
             password=password,
             entry_id=entry.entry_id,
+            refresh_window=entry.options.get(CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW),
+        )
+        
+        # Modelo detectado e zonas vistas em execuções anteriores
+        await coordinator.async_load_storage()
+        
+        # Histórico binário de status (opcional): a central principal grava em
+        # <entry_id>/, as adicionais em subdiretórios criados pelo AMTPanelManager
+        history: SnapshotLogRecorder | None = None
+        history_directory: str | None = None
+        if entry.options.get(CONF_HISTORY, DEFAULT_HISTORY):
+            history_directory = hass.config.path(HISTORY_DIRECTORY, entry.entry_id)
+            history = SnapshotLogRecorder(
+                SnapshotLogWriter(history_directory, max_segments=HISTORY_MAX_SEGMENTS)
+            )
+            history.start()
+            # Registrado já: se o setup falhar depois (ex.: porta em uso), o HA
+            # não chama async_unload_entry, mas roda os callbacks de unload
+            entry.async_on_unload(history.stop)
+            coordinator.history = history
+            _LOGGER.info("Histórico de status habilitado")
+        
+        # Um coordinator por central conectada (o principal fica com a primeira)
+        panels = AMTPanelManager(hass, entry, server, coordinator, history_directory)
+        await panels.async_load()
+        entry.async_on_unload(panels.async_shutdown)
+        
+        # Publicação dos frames recebidos no barramento do HA
+        frame_events = FrameEventBridge(
+            hass,
+            commands=parse_command_list(
+                entry.options.get(CONF_FRAME_EVENT_COMMANDS, DEFAULT_FRAME_EVENT_COMMANDS)
+            ),
+            rate=entry.options.get(CONF_FRAME_EVENT_RATE, DEFAULT_FRAME_EVENT_RATE),
+            batch_window=entry.options.get(CONF_FRAME_EVENT_BATCH, DEFAULT_FRAME_EVENT_BATCH),
         )
+        entry.async_on_unload(frame_events.async_shutdown)
         
         # Callbacks para eventos
         @server.on_connect
         async def on_central_connect(conn):
             """Chamado quando uma central conecta."""
             _LOGGER.info(f"Central AMT conectada: {conn.id}")
-            entry_data = hass.data[DOMAIN][entry.entry_id]
-            entry_data["connected"] = True
-            entry_data["connection_id"] = conn.id
-            entry_data["connected_at"] = datetime.now()
             
-            # Atualiza o coordinator com a nova conexão
-            coordinator.connection_id = conn.id
+            # O coordinator da central é escolhido quando ela se identificar (0x94)
+            await panels.async_connected(conn)
             
             # Dispara evento no HA
             hass.bus.async_fire(f"{DOMAIN}_connected", {"connection_id": conn.id})
         
+        @server.on_identify
+        async def on_central_identify(conn):
+            """Chamado quando uma central se identifica (0x94)."""
+            await panels.async_identified(conn)
+        
         @server.on_disconnect
         async def on_central_disconnect(conn):
             """Chamado quando uma central desconecta."""
             _LOGGER.warning(f"Central AMT desconectada: {conn.id}")
-            entry_data = hass.data[DOMAIN][entry.entry_id]
-            entry_data["connected"] = False
-            entry_data["connection_id"] = None
             
-            # Atualiza o coordinator
-            coordinator.connection_id = None
+            # Desliga o coordinator da central
+            await panels.async_disconnected(conn)
             
             # Dispara evento no HA
             hass.bus.async_fire(f"{DOMAIN}_disconnected", {"connection_id": conn.id})
@@ -106,22 +176,32 @@ if _HAS_HOMEASSISTANT:
         @server.on_frame
         async def on_frame_received(conn, frame: ISECNetFrame):
             """Chamado quando um frame é recebido (exceto heartbeat)."""
-            _LOGGER.debug(f"Frame recebido de {conn.id}: {frame}")
+            # Log por frame só com debug ligado (logger: custom_components.intelbras_amt)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Frame recebido de {conn.id}: {frame}")
+            
+            # Eventos da central atualizam o status sem esperar a próxima consulta
+            event: PanelEvent | None = None
+            if frame.command == EVENT_COMMAND:
+                event = PanelEvent.try_parse(frame.content)
+                panel = panels.coordinator_for(conn.id)
+                if event and panel:
+                    _LOGGER.info(f"Evento da central {panel.panel_key or conn.id}: {event}")
+                    await panel.async_handle_event(event)
+                elif event:
+                    _LOGGER.info(f"Evento de central ainda não identificada: {event}")
+                else:
+                    _LOGGER.warning(f"Evento não reconhecido: {frame.content.hex()}")
             
-            # Dispara evento no HA para que entidades possam reagir
-            hass.bus.async_fire(f"{DOMAIN}_frame_received", {
-                "connection_id": conn.id,
-                "command": frame.command,
-                "content": frame.content.hex(),
-            })
+            # Dispara evento no HA (filtrado, limitado e já decodificado)
+            frame_events.async_publish(conn.id, frame, event)
         
         # Armazena dados no hass.data por entry_id
         hass.data[DOMAIN][entry.entry_id] = {
             "server": server,
             "password": password,
             "coordinator": coordinator,
-            "connected": False,
-            "connection_id": None,
+            "panels": panels,
         }
         
         # Inicia o servidor em background
@@ -131,8 +211,20 @@ if _HAS_HOMEASSISTANT:
         # Configura as plataformas (alarm_control_panel, binary_sensor, switch, sensor)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         
+        # Recarrega a integração quando as opções mudam
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+        
         return True
 
+    async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Recarrega a integração após mudança nas opções."""
+        await hass.config_entries.async_reload(entry.entry_id)
+
+    async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Remove os dados persistidos da integração."""
+        await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
+        await async_remove_panel_storage(hass, entry.entry_id)
+
     async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """Descarrega a integração.
         
@@ -11,17 +11,17 @@ from homeassistant.components.alarm_control_panel import (
     CodeFormat,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 # Importa da biblioteca local
-from .lib.server import AMTServer
 from .lib.protocol.commands import ActivationCommand, DeactivationCommand
 from .lib.const import PartitionCode
 
 from .const import DOMAIN, CONF_PASSWORD, ATTR_CONNECTED, ATTR_LAST_HEARTBEAT
 from .coordinator import AMTCoordinator
+from .entity import AMTEntity
+from .panels import AMTPanelManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,11 +32,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Configura a entidade alarm_control_panel."""
-    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    async_add_entities([IntelbrasAMTAlarm(hass, entry, coordinator)])
+    panels: AMTPanelManager = hass.data[DOMAIN][entry.entry_id]["panels"]
+    
+    @callback
+    def async_add_panel(coordinator: AMTCoordinator) -> None:
+        """Cria o painel de alarme de uma central."""
+        async_add_entities([IntelbrasAMTAlarm(hass, entry, coordinator)])
+    
+    entry.async_on_unload(panels.async_add_panel_listener(async_add_panel))
 
 
-class IntelbrasAMTAlarm(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEntity):
+class IntelbrasAMTAlarm(AMTEntity, AlarmControlPanelEntity):
     """Representa o painel de alarme Intelbras AMT 2018 / 4010."""
 
     _attr_has_entity_name = True
@@ -59,26 +65,12 @@ class IntelbrasAMTAlarm(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEnti
         super().__init__(coordinator)
         self.hass = hass
         self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_alarm"
+        self._attr_unique_id = f"{coordinator.unique_prefix}_alarm"
         
-    @property
-    def device_info(self):
-        """Informações do dispositivo."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Intelbras AMT 2018 / 4010",
-            "manufacturer": "Intelbras",
-            "model": "AMT 2018 / 4010",
-        }
-
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Retorna o estado atual do alarme usando a nova API."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        if not entry_data.get("connected", False):
-            return None
-        
-        if not self.coordinator.data:
+        if not self.coordinator.connection_id or not self.coordinator.data:
             return None
         
         status = self.coordinator.data
@@ -104,10 +96,9 @@ class IntelbrasAMTAlarm(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEnti
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Atributos extras."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
         attrs = {
-            ATTR_CONNECTED: entry_data.get("connected", False),
-            "connection_id": entry_data.get("connection_id"),
+            ATTR_CONNECTED: self.coordinator.connection_id is not None,
+            "connection_id": self.coordinator.connection_id,
         }
         
         if self.coordinator.data:
@@ -131,45 +122,13 @@ class IntelbrasAMTAlarm(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEnti
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Desarma o alarme."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        server: AMTServer = entry_data.get("server")
-        connection_id = entry_data.get("connection_id")
-        password = entry_data.get("password", "")
-        
-        if not server or not connection_id:
-            _LOGGER.error("Central não conectada, não é possível desarmar")
-            return
-        
-        try:
-            # Desarma todas as áreas
-            cmd = DeactivationCommand.disarm_all(password)
-            response = await server.send_command(
-                connection_id,
-                cmd.build_net_frame(),
-                wait_response=True,
-            )
-            
-            if response.is_success:
-                _LOGGER.info("Alarme desarmado com sucesso!")
-                await self.coordinator.async_request_refresh()
-            else:
-                _LOGGER.error(f"Erro ao desarmar alarme: {response.message}")
-                
-        except TimeoutError:
-            _LOGGER.error("Timeout aguardando resposta da central")
-        except Exception as e:
-            _LOGGER.error(f"Erro ao enviar comando: {e}")
+        # Desarma todas as áreas
+        cmd = DeactivationCommand.disarm_all(self.coordinator.password)
+        await self._async_send_command(cmd, "desarmar alarme")
 
     async def _arm_alarm(self, partition: PartitionCode | None = None) -> None:
         """Envia comando de ativação para a central."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        server: AMTServer = entry_data.get("server")
-        connection_id = entry_data.get("connection_id")
-        password = entry_data.get("password", "")
-        
-        if not server or not connection_id:
-            _LOGGER.error("Central não conectada, não é possível armar")
-            return
+        password = self.coordinator.password
         
         # Cria comando de ativação
         if partition:
@@ -177,22 +136,4 @@ class IntelbrasAMTAlarm(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEnti
         else:
             cmd = ActivationCommand.arm_all(password=password)
         
-        try:
-            # Envia comando e aguarda resposta
-            response = await server.send_command(
-                connection_id,
-                cmd.build_net_frame(),
-                wait_response=True,
-            )
-            
-            if response.is_success:
-                _LOGGER.info("Alarme armado com sucesso!")
-                await self.coordinator.async_request_refresh()
-            else:
-                _LOGGER.error(f"Erro ao armar alarme: {response.message}")
-                
-        except TimeoutError:
-            _LOGGER.error("Timeout aguardando resposta da central")
-        except Exception as e:
-            _LOGGER.error(f"Erro ao enviar comando: {e}")
-
+        await self._async_send_command(cmd, "armar alarme")
@@ -10,55 +10,136 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import AMTCoordinator
-from .const import DOMAIN
+from .entity import AMTEntity
+from .panels import AMTPanelManager
+from .const import (
+    DOMAIN,
+    CONF_AGGREGATE_ZONES,
+    CONF_LIMIT_ZONES_TO_MODEL,
+    CONF_ZONES,
+    DEFAULT_AGGREGATE_ZONES,
+    DEFAULT_LIMIT_ZONES_TO_MODEL,
+    DEFAULT_ZONES,
+)
+from .lib.const import CentralModel
+from .zones import ZONE_TYPES, parse_zone_list
 
 _LOGGER = logging.getLogger(__name__)
 
 
+PROBLEM_TYPES: dict[str, str] = {
+    "energia": "ac_failure",
+    "bateria_baixa": "low_battery",
+    "bateria_ausente": "battery_absent",
+    "bateria_curto": "battery_short",
+    "sobrecarga_aux": "aux_overload",
+    "sirene_cortada": "siren_wire_cut",
+    "sirene_curto": "siren_short",
+    "telefone_cortado": "phone_line_cut",
+    "falha_comunicacao": "event_comm_failure",
+}
+"""Tipo de sensor de problema -> atributo de ``SystemProblems``."""
+
+ZONE_TYPE_LIMITS: dict[str, int] = {
+    "tamper": 18,
+    "curto_circuito": 18,
+    "bateria_baixa": 40,
+}
+"""Última zona com sensor de cada tipo (os demais tipos vão até o limite do modelo)."""
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Configura os binary sensors."""
-    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    """Configura os binary sensors.
     
-    entities: list[BinarySensorEntity] = []
+    Os sensores de zona são criados sob demanda: zonas configuradas nas
+    opções, zonas já vistas ativas em execuções anteriores e, depois, cada
+    zona na primeira vez em que aparece ativa no status.
     
-    # Cria entidades para todas as zonas (sempre cria todas, mesmo que não estejam ativas)
-    # Zonas abertas, violadas e bypass (1-48)
-    for zone_num in range(1, 49):
-        entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, "aberta"))
-        entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, "violada"))
-        entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, "bypass"))
+    No modo agregado, as zonas ficam nos sensores de mapa de zonas e só
+    as zonas configuradas nas opções ganham binary sensors.
     
-    # Zonas com tamper e curto-circuito (1-18)
-    for zone_num in range(1, 19):
-        entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, "tamper"))
-        entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, "curto_circuito"))
+    Cada central conectada (ver ``AMTPanelManager``) ganha o seu conjunto
+    de sensores.
+    """
+    panels: AMTPanelManager = hass.data[DOMAIN][entry.entry_id]["panels"]
+    limit_to_model = entry.options.get(CONF_LIMIT_ZONES_TO_MODEL, DEFAULT_LIMIT_ZONES_TO_MODEL)
+    aggregate = entry.options.get(CONF_AGGREGATE_ZONES, DEFAULT_AGGREGATE_ZONES)
+    configured_zones = parse_zone_list(entry.options.get(CONF_ZONES, DEFAULT_ZONES))
     
-    # Bateria baixa em sensores sem fio (1-40)
-    for zone_num in range(1, 41):
-        entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, "bateria_baixa"))
-    
-    # Cria entidades de problemas do sistema
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "energia", "Falta de Energia"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "bateria_baixa", "Bateria Baixa"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "bateria_ausente", "Bateria Ausente"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "bateria_curto", "Bateria em Curto"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "sobrecarga_aux", "Sobrecarga Auxiliar"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "sirene_cortada", "Fio Sirene Cortado"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "sirene_curto", "Curto Sirene"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "telefone_cortado", "Linha Telefônica Cortada"))
-    entities.append(AMTProblemBinarySensor(coordinator, entry, "falha_comunicacao", "Falha Comunicação"))
+    @callback
+    def async_add_panel(coordinator: AMTCoordinator) -> None:
+        """Cria os binary sensors de uma central."""
+        entities: list[BinarySensorEntity] = []
+        provisioned: set[int] = set()
+        
+        def zone_entities(zones: set[int]) -> list[BinarySensorEntity]:
+            """Cria os sensores das zonas ainda não provisionadas."""
+            max_zone = CentralModel.max_zones(
+                coordinator.detected_model if limit_to_model else None
+            )
+            new_entities: list[BinarySensorEntity] = []
+            for zone_num in sorted(zones - provisioned):
+                if zone_num > max_zone:
+                    continue
+                provisioned.add(zone_num)
+                for zone_type in ZONE_TYPES:
+                    if zone_num <= ZONE_TYPE_LIMITS.get(zone_type, max_zone):
+                        new_entities.append(AMTZoneBinarySensor(coordinator, entry, zone_num, zone_type))
+            return new_entities
+        
+        # Zonas configuradas nas opções + zonas já vistas ativas em execuções anteriores
+        zones = set(configured_zones)
+        if not aggregate:
+            zones |= coordinator.seen_zones
+        entities.extend(zone_entities(zones))
+        
+        # Cria entidades de problemas do sistema
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "energia", "Falta de Energia"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "bateria_baixa", "Bateria Baixa"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "bateria_ausente", "Bateria Ausente"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "bateria_curto", "Bateria em Curto"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "sobrecarga_aux", "Sobrecarga Auxiliar"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "sirene_cortada", "Fio Sirene Cortado"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "sirene_curto", "Curto Sirene"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "telefone_cortado", "Linha Telefônica Cortada"))
+        entities.append(AMTProblemBinarySensor(coordinator, entry, "falha_comunicacao", "Falha Comunicação"))
+        
+        async_add_entities(entities)
+        
+        if aggregate:
+            return
+        
+        @callback
+        def _async_add_active_zones() -> None:
+            """Cria sensores para zonas vistas ativas pela primeira vez."""
+            status = coordinator.data
+            if not status:
+                return
+            
+            active: set[int] = set()
+            for attribute in ZONE_TYPES.values():
+                active.update(getattr(status.zones, attribute))
+            
+            coordinator.mark_zones_seen(active)
+            new_entities = zone_entities(active)
+            if new_entities:
+                _LOGGER.info(
+                    f"Novas zonas detectadas: {sorted({e.zone_number for e in new_entities})}"
+                )
+                async_add_entities(new_entities)
+        
+        entry.async_on_unload(coordinator.async_add_listener(_async_add_active_zones))
     
-    async_add_entities(entities)
+    entry.async_on_unload(panels.async_add_panel_listener(async_add_panel))
 
 
-class AMTZoneBinarySensor(CoordinatorEntity[AMTCoordinator], BinarySensorEntity):
+class AMTZoneBinarySensor(AMTEntity, BinarySensorEntity):
     """Binary sensor para uma zona específica."""
     
     _attr_has_entity_name = True
@@ -84,7 +165,12 @@ class AMTZoneBinarySensor(CoordinatorEntity[AMTCoordinator], BinarySensorEntity)
         self._entry = entry
         
         # Define unique_id e name
-        self._attr_unique_id = f"{entry.entry_id}_zona_{zone_number:02d}_{zone_type}"
+        self._attr_unique_id = f"{coordinator.unique_prefix}_zona_{zone_number:02d}_{zone_type}"
+        
+        bitmap_name = ZONE_TYPES[zone_type]
+        self._resolve_status_bit(
+            lambda layout: layout.zone_bitmap(bitmap_name).bit(zone_number)
+        )
         
         # Nome baseado no tipo
         type_names = {
@@ -107,38 +193,10 @@ class AMTZoneBinarySensor(CoordinatorEntity[AMTCoordinator], BinarySensorEntity)
         else:
             self._attr_device_class = None
     
-    @property
-    def device_info(self):
-        """Informações do dispositivo."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Intelbras AMT 2018 / 4010",
-            "manufacturer": "Intelbras",
-            "model": "AMT 2018 / 4010",
-        }
-    
     @property
     def is_on(self) -> bool:
         """Retorna se a zona está ativa."""
-        if not self.coordinator.data:
-            return False
-        
-        status = self.coordinator.data
-        
-        if self.zone_type == "aberta":
-            return self.zone_number in status.zones.open_zones
-        elif self.zone_type == "violada":
-            return self.zone_number in status.zones.violated_zones
-        elif self.zone_type == "bypass":
-            return self.zone_number in status.zones.bypassed_zones
-        elif self.zone_type == "tamper":
-            return self.zone_number in status.zones.tamper_zones
-        elif self.zone_type == "curto_circuito":
-            return self.zone_number in status.zones.short_circuit_zones
-        elif self.zone_type == "bateria_baixa":
-            return self.zone_number in status.zones.low_battery_zones
-        
-        return False
+        return self._status_bit()
     
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -147,9 +205,13 @@ class AMTZoneBinarySensor(CoordinatorEntity[AMTCoordinator], BinarySensorEntity)
             "zone_number": self.zone_number,
             "zone_type": self.zone_type,
         }
+    
+    def _state_fingerprint(self) -> tuple[bool, bool]:
+        """Atributos são fixos, só o estado da zona importa."""
+        return self.available, self.is_on
 
 
-class AMTProblemBinarySensor(CoordinatorEntity[AMTCoordinator], BinarySensorEntity):
+class AMTProblemBinarySensor(AMTEntity, BinarySensorEntity):
     """Binary sensor para problemas do sistema."""
     
     _attr_has_entity_name = True
@@ -173,45 +235,13 @@ class AMTProblemBinarySensor(CoordinatorEntity[AMTCoordinator], BinarySensorEnti
         super().__init__(coordinator)
         self.problem_type = problem_type
         self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_problema_{problem_type}"
+        self._attr_unique_id = f"{coordinator.unique_prefix}_problema_{problem_type}"
         self._attr_name = problem_name
-    
-    @property
-    def device_info(self):
-        """Informações do dispositivo."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Intelbras AMT 2018 / 4010",
-            "manufacturer": "Intelbras",
-            "model": "AMT 2018 / 4010",
-        }
+        
+        problem_attribute = PROBLEM_TYPES[problem_type]
+        self._resolve_status_bit(lambda layout: layout.problems.get(problem_attribute))
     
     @property
     def is_on(self) -> bool:
         """Retorna se o problema está ativo."""
-        if not self.coordinator.data:
-            return False
-        
-        problems = self.coordinator.data.problems
-        
-        if self.problem_type == "energia":
-            return problems.ac_failure
-        elif self.problem_type == "bateria_baixa":
-            return problems.low_battery
-        elif self.problem_type == "bateria_ausente":
-            return problems.battery_absent
-        elif self.problem_type == "bateria_curto":
-            return problems.battery_short
-        elif self.problem_type == "sobrecarga_aux":
-            return problems.aux_overload
-        elif self.problem_type == "sirene_cortada":
-            return problems.siren_wire_cut
-        elif self.problem_type == "sirene_curto":
-            return problems.siren_short
-        elif self.problem_type == "telefone_cortado":
-            return problems.phone_line_cut
-        elif self.problem_type == "falha_comunicacao":
-            return problems.event_comm_failure
-        
-        return False
-
+        return self._status_bit()
@@ -7,10 +7,35 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CONF_PASSWORD, CONF_PORT, DEFAULT_PORT
+from .const import (
+    DOMAIN,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_HISTORY,
+    CONF_REFRESH_WINDOW,
+    CONF_ZONES,
+    CONF_LIMIT_ZONES_TO_MODEL,
+    CONF_AGGREGATE_ZONES,
+    CONF_FRAME_EVENT_COMMANDS,
+    CONF_FRAME_EVENT_RATE,
+    CONF_FRAME_EVENT_BATCH,
+    CONF_CAPTURE,
+    DEFAULT_PORT,
+    DEFAULT_HISTORY,
+    DEFAULT_REFRESH_WINDOW,
+    DEFAULT_ZONES,
+    DEFAULT_LIMIT_ZONES_TO_MODEL,
+    DEFAULT_AGGREGATE_ZONES,
+    DEFAULT_FRAME_EVENT_COMMANDS,
+    DEFAULT_FRAME_EVENT_RATE,
+    DEFAULT_FRAME_EVENT_BATCH,
+    DEFAULT_CAPTURE,
+)
+from .event_bridge import parse_command_list
+from .zones import parse_zone_list
 
 
 class IntelbrasAMTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -18,6 +43,14 @@ class IntelbrasAMTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Retorna o fluxo de opções."""
+        return IntelbrasAMTOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -63,4 +96,71 @@ class IntelbrasAMTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class IntelbrasAMTOptionsFlow(config_entries.OptionsFlow):
+    """Options flow para ajustes da integração após a configuração."""
 
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Formulário de opções."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            try:
+                parse_zone_list(user_input.get(CONF_ZONES, DEFAULT_ZONES))
+            except ValueError:
+                errors[CONF_ZONES] = "invalid_zones"
+            try:
+                parse_command_list(
+                    user_input.get(CONF_FRAME_EVENT_COMMANDS, DEFAULT_FRAME_EVENT_COMMANDS)
+                )
+            except ValueError:
+                errors[CONF_FRAME_EVENT_COMMANDS] = "invalid_commands"
+            
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+        
+        options = user_input or self.config_entry.options
+        
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_HISTORY,
+                    default=options.get(CONF_HISTORY, DEFAULT_HISTORY),
+                ): bool,
+                vol.Optional(
+                    CONF_REFRESH_WINDOW,
+                    default=options.get(CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Optional(
+                    CONF_ZONES,
+                    default=options.get(CONF_ZONES, DEFAULT_ZONES),
+                ): str,
+                vol.Optional(
+                    CONF_LIMIT_ZONES_TO_MODEL,
+                    default=options.get(CONF_LIMIT_ZONES_TO_MODEL, DEFAULT_LIMIT_ZONES_TO_MODEL),
+                ): bool,
+                vol.Optional(
+                    CONF_AGGREGATE_ZONES,
+                    default=options.get(CONF_AGGREGATE_ZONES, DEFAULT_AGGREGATE_ZONES),
+                ): bool,
+                vol.Optional(
+                    CONF_FRAME_EVENT_COMMANDS,
+                    default=options.get(CONF_FRAME_EVENT_COMMANDS, DEFAULT_FRAME_EVENT_COMMANDS),
+                ): str,
+                vol.Optional(
+                    CONF_FRAME_EVENT_RATE,
+                    default=options.get(CONF_FRAME_EVENT_RATE, DEFAULT_FRAME_EVENT_RATE),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_FRAME_EVENT_BATCH,
+                    default=options.get(CONF_FRAME_EVENT_BATCH, DEFAULT_FRAME_EVENT_BATCH),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                vol.Optional(
+                    CONF_CAPTURE,
+                    default=options.get(CONF_CAPTURE, DEFAULT_CAPTURE),
+                ): bool,
+            }),
+            errors=errors,
+        )
@@ -6,8 +6,46 @@ DOMAIN = "intelbras_amt"
 CONF_PORT = "port"
 CONF_PASSWORD = "password"
 
+# Opções
+CONF_HISTORY = "history"
+CONF_REFRESH_WINDOW = "refresh_window"
+CONF_ZONES = "zones"
+CONF_LIMIT_ZONES_TO_MODEL = "limit_zones_to_model"
+CONF_AGGREGATE_ZONES = "aggregate_zones"
+CONF_FRAME_EVENT_COMMANDS = "frame_event_commands"
+CONF_FRAME_EVENT_RATE = "frame_event_rate"
+CONF_FRAME_EVENT_BATCH = "frame_event_batch"
+CONF_CAPTURE = "capture"
+
 # Defaults
 DEFAULT_PORT = 9009
+DEFAULT_HISTORY = False
+DEFAULT_REFRESH_WINDOW = 1.0
+DEFAULT_ZONES = ""
+DEFAULT_LIMIT_ZONES_TO_MODEL = True
+DEFAULT_AGGREGATE_ZONES = False
+DEFAULT_FRAME_EVENT_COMMANDS = "*"
+DEFAULT_FRAME_EVENT_RATE = 5.0
+DEFAULT_FRAME_EVENT_BATCH = 0.0
+DEFAULT_CAPTURE = False
+
+# Histórico de status
+HISTORY_DIRECTORY = "intelbras_amt_history"
+"""Diretório (dentro da config do HA) com o histórico binário de status."""
+
+HISTORY_MAX_SEGMENTS = 24
+"""Segmentos de histórico mantidos por entry (~3 semanas cada a 30s/poll)."""
+
+# Captura de tráfego
+CAPTURE_DIRECTORY = "intelbras_amt_captures"
+"""Diretório (dentro da config do HA) com as capturas de tráfego (diagnóstico)."""
+
+# Armazenamento
+STORAGE_KEY = "intelbras_amt.models"
+"""Chave base do Store da entry (modelo de cada central, zonas já vistas)."""
+
+STORAGE_VERSION = 1
+"""Versão do formato do Store."""
 
 # Atributos
 ATTR_CONNECTED = "connected"
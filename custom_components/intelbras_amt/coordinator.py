@@ -1,27 +1,109 @@
 """Coordinator para atualização periódica do status da central."""
 
 import logging
-from datetime import timedelta
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import slugify
 
 # Importa da biblioteca local
 from .lib.server import AMTServer
 from .lib.protocol.commands import (
+    ActivationCommand,
+    Command,
     PartialStatusRequestCommand,
     StatusRequestCommand,
     PartialCentralStatus,
     CentralStatus,
+    STATUS_LAYOUTS,
 )
-from .lib.protocol.responses import ResponseType
+from .lib.protocol.events import PanelEvent
+from .lib.protocol.responses import Response, ResponseType
 from .lib.const import CentralModel
+from .lib.history import SnapshotLogRecorder
+from .const import DOMAIN, DEFAULT_REFRESH_WINDOW, STORAGE_KEY, STORAGE_VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(seconds=30)
 """Intervalo de atualização do status (30 segundos)."""
 
+FAST_UPDATE_INTERVAL = timedelta(seconds=5)
+"""Intervalo durante disparo, sirene ligada ou contagem de arme."""
+
+SLOW_UPDATE_INTERVAL = timedelta(minutes=10)
+"""Intervalo com a central desarmada e sem mudanças há muito tempo."""
+
+IDLE_THRESHOLD = timedelta(minutes=10)
+"""Tempo sem mudanças no status para considerar a central ociosa."""
+
+ARMING_COUNTDOWN = timedelta(seconds=60)
+"""Janela de consulta rápida após um arme (tempo de saída da central)."""
+
+VERIFY_DELAY = timedelta(seconds=3)
+"""Atraso da consulta que confirma o estado previsto após um comando."""
+
+QUEUE_RETRY_DELAY = 0.5
+"""Espera (segundos) antes de reavaliar uma consulta adiada por comandos na fila."""
+
+POLL_JITTER = 0.1
+"""Variação aleatória do intervalo (±10%), evita consultas sincronizadas."""
+
+PUSH_UPDATE_INTERVAL = timedelta(minutes=5)
+"""Intervalo de consulta quando a central envia eventos (0xB0).
+
+Com eventos chegando em tempo real, a consulta periódica serve apenas
+para corrigir eventuais divergências (eventos sem efeito conhecido,
+eventos perdidos durante uma reconexão).
+"""
+
+
+@dataclass
+class CommandStats:
+    """Estatísticas de execução de um tipo de comando.
+    
+    Attributes:
+        sent: Comandos enviados.
+        succeeded: Comandos confirmados pela central (ACK).
+        rejected: Comandos recusados pela central (NACK).
+        timeouts: Comandos sem resposta dentro do timeout.
+        errors: Comandos que falharam por outros erros (conexão, etc).
+        last_latency: Latência (segundos) do último comando respondido.
+        max_latency: Maior latência (segundos) observada.
+        total_latency: Soma das latências (para a média).
+    """
+
+    sent: int = 0
+    succeeded: int = 0
+    rejected: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    last_latency: float | None = None
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float | None:
+        """Latência média (segundos) dos comandos respondidos."""
+        answered = self.succeeded + self.rejected
+        if not answered:
+            return None
+        return self.total_latency / answered
+
+    def record_latency(self, latency: float) -> None:
+        """Registra a latência de um comando respondido."""
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_latency += latency
+
 
 class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus | None]):
     """Coordinator para atualizar status da central periodicamente.
@@ -38,6 +120,8 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
         connection_id: str | None,
         password: str,
         entry_id: str,
+        refresh_window: float = DEFAULT_REFRESH_WINDOW,
+        panel_key: str | None = None,
     ) -> None:
         """Inicializa o coordinator.
         
@@ -47,21 +131,129 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
             connection_id: ID da conexão ativa.
             password: Senha da central.
             entry_id: ID da config entry.
+            refresh_window: Janela (segundos) de agrupamento de pedidos de
+                atualização.
+            panel_key: Identidade da central adicional atendida por este
+                coordinator (None = central principal da entry, com os IDs
+                legados).
         """
         super().__init__(
             hass,
             _LOGGER,
-            name=f"Intelbras AMT ({entry_id})",
+            name=f"Intelbras AMT ({panel_key or entry_id})",
             update_interval=UPDATE_INTERVAL,
+            # Só notifica as entidades quando o status realmente muda
+            always_update=False,
         )
         self.server = server
-        self.connection_id = connection_id
+        self._connection_id = connection_id
         self.password = password
         self.entry_id = entry_id
+        self.panel_key = panel_key
+        """Identidade da central adicional (None = central principal)."""
+        self.unique_prefix = entry_id if panel_key is None else f"{entry_id}_{slugify(panel_key)}"
+        """Prefixo dos unique_ids e do dispositivo das entidades desta central."""
         self._detected_model: int | None = None
         """Modelo detectado da central (0x1E = AMT 2018, 0x41 = AMT 4010)."""
+        self._model_identity: str | None = None
+        """Identidade da central a que ``_detected_model`` se refere."""
+        self._panel_identity: str | None = None
+        """Identidade (conta + MAC) da central na conexão atual, via 0x94."""
+        self._known_models: dict[str, dict[str, Any]] = {}
+        """Modelos já detectados, por identidade da central."""
+        self._seen_zones: set[int] = set()
+        """Zonas já vistas ativas (sensores criados sob demanda)."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{self.unique_prefix}"
+        )
+        self._last_raw: bytes | None = None
+        """Último payload bruto de status recebido."""
+        self._last_raw_hash: int | None = None
+        """Hash do último payload bruto (descarte rápido quando difere)."""
+        self._last_status: PartialCentralStatus | CentralStatus | None = None
+        """Status parseado correspondente a ``_last_raw``."""
+        self.history: SnapshotLogRecorder | None = None
+        """Histórico binário de status (None se desabilitado)."""
+        self._push_mode = False
+        """Se a central está enviando eventos (consulta periódica relaxada)."""
+        self._last_change = time.monotonic()
+        """Momento (monotônico) da última mudança no status."""
+        self._arming_until = 0.0
+        """Fim (monotônico) da janela de consulta rápida após um arme."""
+        self.refresh_window = refresh_window
+        """Janela (segundos) de agrupamento de pedidos de atualização."""
+        self._unsub_batched_refresh: CALLBACK_TYPE | None = None
+        """Cancela a consulta agrupada agendada."""
+        self._refresh_deadline = 0.0
+        """Momento (monotônico) previsto para a consulta agrupada."""
+        self._batched_requests = 0
+        """Pedidos de atualização aguardando a consulta agrupada."""
+        self._unsub_verify: CALLBACK_TYPE | None = None
+        """Cancela a consulta de verificação agendada após um comando."""
+        self.merged_refresh_requests = 0
+        """Total de pedidos de atualização absorvidos por outra consulta."""
+        self.entity_writes = 0
+        """Entidades gravadas na última atualização."""
+        self.entity_writes_skipped = 0
+        """Entidades com estado inalterado (não gravadas) na última atualização."""
+        self.command_stats: dict[str, CommandStats] = {}
+        """Estatísticas de execução por tipo de comando."""
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.unique_prefix)},
+            name="Intelbras AMT 2018 / 4010" if panel_key is None else f"Intelbras AMT {panel_key}",
+            manufacturer="Intelbras",
+            model="AMT 2018 / 4010",
+        )
+        """Dispositivo da central, compartilhado por todas as suas entidades."""
+
+    @property
+    def detected_model(self) -> int | None:
+        """Modelo detectado (ou salvo) da central, None se desconhecido."""
+        return self._detected_model
+
+    @property
+    def connection_id(self) -> str | None:
+        """ID da conexão ativa com a central."""
+        return self._connection_id
+
+    @connection_id.setter
+    def connection_id(self, value: str | None) -> None:
+        """Atualiza a conexão ativa.
+        
+        Uma nova conexão (ou a desconexão) invalida o status em cache e
+        volta para a consulta periódica normal até o próximo evento.
+        """
+        if value == self._connection_id:
+            return
+        self._connection_id = value
+        self._panel_identity = None
+        if self._model_identity is None:
+            # Modelo detectado antes da identificação: não dá para saber se
+            # a nova conexão é da mesma central
+            self._detected_model = None
+        self._last_raw = None
+        self._last_raw_hash = None
+        self._last_status = None
+        if self._push_mode:
+            _LOGGER.debug("Conexão mudou, voltando para consulta periódica normal")
+            self._push_mode = False
 
     async def _async_update_data(self) -> PartialCentralStatus | CentralStatus | None:
+        """Busca status atual da central e ajusta o intervalo da próxima consulta.
+        
+        Returns:
+            Status da central (parcial ou completo) ou None se não conectada.
+            
+        Raises:
+            UpdateFailed: Se houver erro ao buscar status.
+        """
+        status = await self._async_fetch_status()
+        # Sem conexão não há o que consultar: a central conectando pede uma
+        # atualização e a consulta periódica recomeça
+        self.update_interval = self._next_interval(status) if self.connection_id else None
+        return status
+    
+    async def _async_fetch_status(self) -> PartialCentralStatus | CentralStatus | None:
         """Busca status atual da central.
         
         Detecta automaticamente o modelo no primeiro request e usa o comando apropriado.
@@ -76,6 +268,8 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
             _LOGGER.debug("Central não conectada, não é possível atualizar status")
             return None
         
+        self._sync_panel_identity()
+        
         try:
             # Se ainda não detectamos o modelo, tenta 0x5A primeiro (AMT 2018)
             if self._detected_model is None:
@@ -92,8 +286,10 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
                 return await self._fetch_partial_status()
                 
         except TimeoutError as err:
+            self.server.metrics.status_updates.inc("failed")
             raise UpdateFailed(f"Timeout aguardando resposta: {err}")
         except Exception as err:
+            self.server.metrics.status_updates.inc("failed")
             raise UpdateFailed(f"Erro ao atualizar status: {err}")
     
     async def _detect_and_fetch_status(self) -> PartialCentralStatus | CentralStatus | None:
@@ -106,9 +302,7 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
         try:
             status = await self._fetch_partial_status()
             if status:
-                self._detected_model = status.model
-                model_name = CentralModel.get_name(self._detected_model)
-                _LOGGER.info(f"Modelo detectado: {model_name} (0x{self._detected_model:02X})")
+                self._set_detected_model(status)
                 
                 # Se for AMT 4010, usa status completo nas próximas vezes
                 if self._detected_model == CentralModel.AMT_4010:
@@ -123,9 +317,7 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
         try:
             status = await self._fetch_full_status()
             if status:
-                self._detected_model = status.model
-                model_name = CentralModel.get_name(self._detected_model)
-                _LOGGER.info(f"Modelo detectado: {model_name} (0x{self._detected_model:02X})")
+                self._set_detected_model(status)
                 return status
         except Exception as e:
             raise UpdateFailed(f"Ambos comandos de status falharam: {e}")
@@ -141,10 +333,22 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
             wait_response=True,
         )
         
+        self._check_status_size(response, 43)
+        
         if response.response_type == ResponseType.DATA and len(response.raw_frame.content) >= 43:
-            status = PartialCentralStatus.try_parse(response.raw_frame.content)
+            raw = response.raw_frame.content
+            self._record_history(raw)
+            cached = self._get_cached_status(raw)
+            if cached is not None:
+                self.server.metrics.status_updates.inc("unchanged")
+                return cached
+            
+            started = time.perf_counter()
+            status = PartialCentralStatus.try_parse(raw)
+            self._record_parse_time(raw, started)
             if status:
                 _LOGGER.debug("Status parcial atualizado")
+                self._remember_status(raw, status)
                 return status
             raise UpdateFailed("Não foi possível parsear status parcial")
         else:
@@ -159,14 +363,486 @@ class AMTCoordinator(DataUpdateCoordinator[PartialCentralStatus | CentralStatus
             wait_response=True,
         )
         
+        self._check_status_size(response, 54)
+        
         if response.response_type == ResponseType.DATA and len(response.raw_frame.content) >= 54:
-            status = CentralStatus.try_parse(response.raw_frame.content)
+            raw = response.raw_frame.content
+            self._record_history(raw)
+            cached = self._get_cached_status(raw)
+            if cached is not None:
+                self.server.metrics.status_updates.inc("unchanged")
+                return cached
+            
+            started = time.perf_counter()
+            status = CentralStatus.try_parse(raw)
+            self._record_parse_time(raw, started)
             if status:
                 _LOGGER.debug("Status completo atualizado")
+                self._remember_status(raw, status)
                 return status
             raise UpdateFailed("Não foi possível parsear status completo")
         else:
             raise UpdateFailed(f"Erro ao buscar status completo: {response.message}")
+    
+    def _record_parse_time(self, raw: bytes, started: float) -> None:
+        """Registra nas métricas do servidor o parsing de um status novo.
+        
+        Args:
+            raw: Payload parseado.
+            started: ``time.perf_counter()`` do início do parsing.
+        """
+        metrics = self.server.metrics
+        metrics.status_parse.observe(time.perf_counter() - started, str(len(raw)))
+        metrics.status_updates.inc("changed")
+    
+    async def async_load_storage(self) -> None:
+        """Carrega os dados salvos em execuções anteriores.
+        
+        Restaura as zonas já vistas ativas e pré-seleciona o modelo da última central vista, para que a primeira
+        consulta após reiniciar o HA use direto o comando certo.
+        """
+        data = await self._store.async_load() or {}
+        self._known_models = data.get("panels", {})
+        self._seen_zones = set(data.get("seen_zones", []))
+        
+        last = data.get("last")
+        known = self._known_models.get(last) if last else None
+        if known and self._detected_model is None:
+            self._detected_model = known["model"]
+            self._model_identity = last
+            _LOGGER.debug(
+                f"Modelo salvo para {last}: {CentralModel.get_name(known['model'])}"
+            )
+    
+    def _sync_panel_identity(self) -> None:
+        """Confere a identidade da central conectada (comando 0x94).
+        
+        Usa o modelo salvo para a central, se houver. Se a central mudou
+        (outro MAC) e não há modelo salvo, força nova detecção.
+        """
+        connection = self.server.connections.get(self.connection_id)
+        info = connection.metadata.get("connection_info") if connection else None
+        if info is None or info.identity == self._panel_identity:
+            return
+        
+        identity = info.identity
+        self._panel_identity = identity
+        if identity == self._model_identity:
+            return
+        
+        known = self._known_models.get(identity)
+        if known:
+            self._detected_model = known["model"]
+            self._model_identity = identity
+            _LOGGER.debug(f"Usando modelo salvo para {identity}: {CentralModel.get_name(known['model'])}")
+        elif self._detected_model is not None and self._model_identity is None:
+            # Modelo detectado nesta conexão antes da identificação chegar
+            self._model_identity = identity
+            self._save_model(self._detected_model, self._last_status)
+        elif self._detected_model is not None:
+            _LOGGER.info(f"Central diferente conectada ({identity}), detectando modelo novamente")
+            self._detected_model = None
+            self._model_identity = None
+    
+    def _set_detected_model(self, status: PartialCentralStatus | CentralStatus) -> None:
+        """Registra o modelo detectado e salva para as próximas execuções."""
+        self._detected_model = status.model
+        self._model_identity = self._panel_identity
+        model_name = CentralModel.get_name(self._detected_model)
+        _LOGGER.info(f"Modelo detectado: {model_name} (0x{self._detected_model:02X})")
+        self._save_model(status.model, status)
+    
+    def _save_model(
+        self,
+        model: int,
+        status: PartialCentralStatus | CentralStatus | None,
+    ) -> None:
+        """Salva o modelo (e firmware) da central identificada no Store."""
+        if self._model_identity is None:
+            return
+        self._known_models[self._model_identity] = {
+            "model": model,
+            "firmware": status.firmware_version if status else None,
+        }
+        self._store.async_delay_save(self._store_data, 1)
+    
+    def _check_status_size(self, response: Response, expected: int) -> None:
+        """Descarta o modelo salvo se a resposta de status tiver tamanho errado.
+        
+        Indica que o modelo salvo não corresponde à central (ex: troca de
+        placa com o mesmo MAC); a próxima consulta detecta o modelo de novo.
+        
+        Args:
+            response: Resposta do comando de status.
+            expected: Tamanho esperado (43 ou 54 bytes).
+        """
+        if response.response_type != ResponseType.DATA or self._detected_model is None:
+            return
+        size = len(response.raw_frame.content)
+        if size == expected:
+            return
+        
+        _LOGGER.warning(
+            f"Resposta de status com {size} bytes (esperado {expected}), "
+            "detectando modelo novamente"
+        )
+        if self._model_identity is not None:
+            self._known_models.pop(self._model_identity, None)
+            self._store.async_delay_save(self._store_data, 1)
+        self._detected_model = None
+        self._model_identity = None
+    
+    @property
+    def seen_zones(self) -> set[int]:
+        """Zonas já vistas ativas em algum status."""
+        return self._seen_zones
+    
+    def mark_zones_seen(self, zones: set[int]) -> None:
+        """Registra zonas vistas ativas e salva para as próximas execuções.
+        
+        Args:
+            zones: Números das zonas.
+        """
+        if zones <= self._seen_zones:
+            return
+        self._seen_zones |= zones
+        self._store.async_delay_save(self._store_data, 1)
+    
+    def _store_data(self) -> dict[str, Any]:
+        """Dados do Store da entry."""
+        return {
+            "panels": self._known_models,
+            "last": self._model_identity,
+            "seen_zones": sorted(self._seen_zones),
+        }
+    
+    async def async_handle_event(self, event: PanelEvent) -> None:
+        """Atualiza o status a partir de um evento enviado pela central.
+        
+        Aplica o evento sobre o último payload bruto e publica o novo status
+        imediatamente, sem consultar a central. Se o evento não tiver efeito
+        conhecido no status (ou ainda não houver status em cache), agenda
+        uma consulta.
+        
+        Args:
+            event: Evento Contact-ID recebido (comando 0xB0).
+        """
+        if not self._push_mode:
+            _LOGGER.info(
+                "Central enviando eventos, consulta periódica relaxada para "
+                f"{PUSH_UPDATE_INTERVAL.total_seconds():.0f}s"
+            )
+            self._push_mode = True
+        
+        if not event.affects_status:
+            _LOGGER.debug(f"Evento sem efeito no status: {event}")
+            self.update_interval = self._next_interval(self._last_status)
+            return
+        
+        raw = event.apply_to(self._last_raw) if self._last_raw else None
+        if raw is None:
+            _LOGGER.debug(f"Evento {event} exige consulta de status")
+            await self.async_request_refresh()
+            return
+        
+        if raw == self._last_raw:
+            return
+        
+        status = self._parse_raw(raw)
+        if status is None:
+            await self.async_request_refresh()
+            return
+        
+        _LOGGER.debug(f"Status atualizado pelo evento {event}")
+        self._remember_status(raw, status)
+        self.update_interval = self._next_interval(status)
+        self.async_set_updated_data(status)
+    
+    async def async_command_acknowledged(self, command: Command) -> None:
+        """Atualiza o status logo após a central confirmar um comando.
+        
+        Aplica o efeito previsto do comando sobre o status em cache e publica
+        na hora. Uma única consulta de verificação, adiada por
+        ``VERIFY_DELAY``, confirma a previsão ou a desfaz; comandos em
+        sequência reaproveitam a mesma verificação. Se o efeito não for
+        conhecido, pede uma atualização normal (agrupada).
+        
+        Após um arme, mantém a consulta rápida durante o tempo de saída.
+        
+        Args:
+            command: Comando confirmado pela central.
+        """
+        if isinstance(command, ActivationCommand):
+            self._arming_until = time.monotonic() + ARMING_COUNTDOWN.total_seconds()
+        
+        predicted = command.apply_to(self._last_raw) if self._last_raw else None
+        status = self._parse_raw(predicted) if predicted else None
+        if status is None:
+            await self.async_request_refresh()
+            return
+        
+        if predicted != self._last_raw:
+            _LOGGER.debug(f"Aplicando estado previsto para {command}")
+            self._remember_status(predicted, status)
+            self.update_interval = self._next_interval(status)
+            self.async_set_updated_data(status)
+        
+        # Agenda (ou adia) a consulta de verificação. Se a central confirmar
+        # a previsão, o payload é idêntico e as entidades não são notificadas.
+        # Fica fora do agrupamento: não adia pedidos de atualização nem conta
+        # como pedido agrupado
+        if self._unsub_verify:
+            self._unsub_verify()
+        self._unsub_verify = async_call_later(
+            self.hass, VERIFY_DELAY, self._async_verify
+        )
+    
+    async def async_execute_command(self, command: Command, action: str) -> bool:
+        """Envia um comando de controle para a central.
+        
+        Caminho único usado por todas as entidades de controle: verifica a
+        conexão, envia o comando, mede a latência, registra o resultado em
+        ``command_stats`` e, se a central confirmar, aplica o estado previsto
+        (``async_command_acknowledged``).
+        
+        Args:
+            command: Comando a enviar.
+            action: Descrição da ação para os logs (ex: "armar partição A").
+            
+        Returns:
+            True se a central confirmou o comando.
+        """
+        connection_id = self.connection_id
+        if not connection_id:
+            _LOGGER.error(f"Central não conectada, não é possível {action}")
+            return False
+        
+        stats = self.command_stats.setdefault(type(command).__name__, CommandStats())
+        stats.sent += 1
+        start = time.monotonic()
+        
+        try:
+            response = await self.server.send_command(
+                connection_id,
+                command.build_net_frame(),
+                wait_response=True,
+            )
+        except TimeoutError:
+            stats.timeouts += 1
+            _LOGGER.error(f"Timeout aguardando resposta da central ao {action}")
+            return False
+        except Exception as e:
+            stats.errors += 1
+            _LOGGER.error(f"Erro ao {action}: {e}")
+            return False
+        
+        latency = time.monotonic() - start
+        if response is None:
+            stats.errors += 1
+            _LOGGER.error(f"Erro ao {action}: sem resposta da central")
+            return False
+        
+        stats.record_latency(latency)
+        if not response.is_success:
+            stats.rejected += 1
+            _LOGGER.error(f"Erro ao {action}: {response.message} ({latency * 1000:.0f} ms)")
+            return False
+        
+        stats.succeeded += 1
+        _LOGGER.info(f"Comando para {action} confirmado em {latency * 1000:.0f} ms")
+        await self.async_command_acknowledged(command)
+        return True
+    
+    async def async_request_refresh(self) -> None:
+        """Pede uma atualização do status, agrupando pedidos próximos.
+        
+        Pedidos feitos dentro de ``refresh_window`` (ex: uma cena que liga
+        várias PGMs) resultam em uma única consulta, enviada depois que a
+        fila de comandos da conexão esvaziar.
+        """
+        self._queue_refresh(self.refresh_window)
+    
+    def _queue_refresh(self, delay: float) -> None:
+        """Agenda a consulta agrupada para daqui a ``delay`` segundos.
+        
+        Cada novo pedido adia a consulta, mas nunca a antecipa.
+        
+        Args:
+            delay: Atraso mínimo em segundos a partir de agora.
+        """
+        self._batched_requests += 1
+        now = time.monotonic()
+        self._refresh_deadline = max(self._refresh_deadline, now + delay)
+        
+        if self._unsub_batched_refresh:
+            self._unsub_batched_refresh()
+        self._unsub_batched_refresh = async_call_later(
+            self.hass, self._refresh_deadline - now, self._async_flush_refresh
+        )
+    
+    async def _async_verify(self, _now: datetime) -> None:
+        """Executa a consulta de verificação do estado previsto."""
+        self._unsub_verify = None
+        
+        if self._unsub_batched_refresh:
+            # A consulta agrupada pendente também confirma a previsão
+            return
+        if self.server.queued_commands(self.connection_id):
+            # Ainda há comandos na fila: verifica só depois do último
+            self._unsub_verify = async_call_later(
+                self.hass, QUEUE_RETRY_DELAY, self._async_verify
+            )
+            return
+        
+        await self.async_refresh()
+    
+    async def _async_flush_refresh(self, _now: datetime) -> None:
+        """Executa a consulta agrupada (que também serve de verificação)."""
+        self._unsub_batched_refresh = None
+        
+        if self.server.queued_commands(self.connection_id):
+            # Ainda há comandos na fila: consulta só depois do último
+            self._unsub_batched_refresh = async_call_later(
+                self.hass, QUEUE_RETRY_DELAY, self._async_flush_refresh
+            )
+            return
+        
+        if self._unsub_verify:
+            self._unsub_verify()
+            self._unsub_verify = None
+        
+        requests = self._batched_requests
+        self._batched_requests = 0
+        self._refresh_deadline = 0.0
+        if requests > 1:
+            self.merged_refresh_requests += requests - 1
+            _LOGGER.debug(
+                f"{requests} pedidos de atualização agrupados em uma consulta "
+                f"(total agrupado: {self.merged_refresh_requests})"
+            )
+        
+        await self.async_refresh()
+    
+    @callback
+    def async_detach(self) -> None:
+        """Desliga o coordinator da conexão encerrada.
+        
+        Para a consulta periódica (até a central conectar de novo) e
+        publica status vazio, deixando as entidades indisponíveis.
+        """
+        self.connection_id = None
+        self.update_interval = None
+        if self._unsub_batched_refresh:
+            self._unsub_batched_refresh()
+            self._unsub_batched_refresh = None
+        if self._unsub_verify:
+            self._unsub_verify()
+            self._unsub_verify = None
+        self._batched_requests = 0
+        self._refresh_deadline = 0.0
+        self.async_set_updated_data(None)
+    
+    async def async_shutdown(self) -> None:
+        """Cancela as consultas agrupada e de verificação pendentes e encerra o coordinator."""
+        if self._unsub_batched_refresh:
+            self._unsub_batched_refresh()
+            self._unsub_batched_refresh = None
+        if self._unsub_verify:
+            self._unsub_verify()
+            self._unsub_verify = None
+        await super().async_shutdown()
+    
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notifica as entidades e registra quantas realmente mudaram."""
+        self.entity_writes = 0
+        self.entity_writes_skipped = 0
+        super().async_update_listeners()
+        _LOGGER.debug(
+            f"Atualização: {self.entity_writes} entidades gravadas, "
+            f"{self.entity_writes_skipped} inalteradas"
+        )
+    
+    @staticmethod
+    def _parse_raw(raw: bytes) -> PartialCentralStatus | CentralStatus | None:
+        """Faz o parsing de um payload bruto de acordo com o tamanho."""
+        if len(raw) == 54:
+            return CentralStatus.try_parse(raw)
+        return PartialCentralStatus.try_parse(raw)
+    
+    def _next_interval(
+        self,
+        status: PartialCentralStatus | CentralStatus | None,
+    ) -> timedelta:
+        """Calcula o intervalo até a próxima consulta.
+        
+        - Rápido: central disparada, sirene ligada ou contagem de arme
+        - Lento: central desarmada e sem mudanças há ``IDLE_THRESHOLD``
+        - Normal: demais casos (relaxado se a central envia eventos)
+        
+        Args:
+            status: Status atual da central.
+            
+        Returns:
+            Intervalo com variação aleatória de ``POLL_JITTER``.
+        """
+        now = time.monotonic()
+        base = PUSH_UPDATE_INTERVAL if self._push_mode else UPDATE_INTERVAL
+        
+        if now < self._arming_until or (status and (status.triggered or status.siren_on)):
+            interval = FAST_UPDATE_INTERVAL
+        elif (
+            status
+            and not status.armed
+            and now - self._last_change >= IDLE_THRESHOLD.total_seconds()
+        ):
+            interval = max(base, SLOW_UPDATE_INTERVAL)
+        else:
+            interval = base
+        
+        return interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
 
-
-
+    def _get_cached_status(self, raw: bytes) -> PartialCentralStatus | CentralStatus | None:
+        """Retorna o status anterior se os bytes recebidos forem idênticos.
+        
+        Compara primeiro o hash (descarte rápido) e depois os bytes, evitando
+        parsear de novo e criar um objeto novo. Como o coordinator usa
+        ``always_update=False``, devolver o mesmo objeto faz o
+        DataUpdateCoordinator não notificar as entidades.
+        
+        Args:
+            raw: Payload bruto de status recebido da central.
+            
+        Returns:
+            Status anterior ou None se o payload mudou.
+        """
+        if self._last_status is None or hash(raw) != self._last_raw_hash:
+            return None
+        if raw != self._last_raw:
+            return None
+        _LOGGER.debug("Status inalterado, reaproveitando objeto anterior")
+        return self._last_status
+    
+    def _remember_status(self, raw: bytes, status: PartialCentralStatus | CentralStatus) -> None:
+        """Guarda o payload bruto e o status parseado para a próxima comparação.
+        
+        Args:
+            raw: Payload bruto de status.
+            status: Status parseado a partir de ``raw``.
+        """
+        self._last_raw = raw
+        self._last_raw_hash = hash(raw)
+        self._last_status = status
+        self._last_change = time.monotonic()
+    
+    def _record_history(self, raw: bytes) -> None:
+        """Envia o payload bruto para o histórico, se habilitado.
+        
+        Args:
+            raw: Payload bruto de status (43 ou 54 bytes).
+        """
+        if self.history is None:
+            return
+        layout = STATUS_LAYOUTS.get(len(raw))
+        if layout is not None:
+            self.history.record(raw[layout.model], raw)
@@ -0,0 +1,109 @@
+"""Entidade base da integração Intelbras AMT."""
+
+from typing import Any, Callable
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import AMTCoordinator
+from .lib.protocol.commands import STATUS_LAYOUTS, Command, StatusLayout
+
+
+class AMTEntity(CoordinatorEntity[AMTCoordinator]):
+    """Entidade base atualizada pelo coordinator.
+    
+    Todas as entidades da config entry compartilham o mesmo descritor de
+    dispositivo (criado uma vez pelo coordinator) e enviam comandos pelo
+    mesmo caminho instrumentado (``_async_send_command``).
+    
+    Só grava o estado no Home Assistant quando o estado derivado da entidade
+    muda. A cada atualização do coordinator, compara a "impressão digital"
+    do estado (disponibilidade, estado e atributos) com a última gravada;
+    se for igual, a escrita é pulada.
+    """
+
+    _last_fingerprint: Any = None
+    _bit_positions: dict[int, tuple[int, int] | None] = {}
+
+    def __init__(self, coordinator: AMTCoordinator) -> None:
+        """Inicializa a entidade com o dispositivo da config entry.
+        
+        Args:
+            coordinator: Coordinator do status.
+        """
+        super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
+
+    def _state_fingerprint(self) -> Any:
+        """Retorna um valor comparável que muda quando o estado muda.
+        
+        Subclasses podem sobrescrever com algo mais barato de calcular.
+        """
+        attributes = self.extra_state_attributes
+        return (
+            self.available,
+            self.state,
+            tuple(sorted(attributes.items())) if attributes else None,
+        )
+
+    def _resolve_status_bit(
+        self,
+        resolve: Callable[[StatusLayout], tuple[int, int] | None],
+    ) -> None:
+        """Pré-calcula a posição do bit da entidade em cada layout de status.
+        
+        Chamado no construtor; depois disso ``_status_bit`` lê o estado
+        direto do payload bruto, sem percorrer os objetos parseados.
+        
+        Args:
+            resolve: Função layout -> (offset, máscara) ou None se o campo
+                não existe no layout.
+        """
+        self._bit_positions = {
+            size: resolve(layout) for size, layout in STATUS_LAYOUTS.items()
+        }
+
+    def _status_bit(self) -> bool:
+        """Lê o bit pré-calculado no payload bruto do status atual."""
+        status = self.coordinator.data
+        if not status:
+            return False
+        raw = status.raw_data
+        position = self._bit_positions.get(len(raw))
+        if position is None:
+            return False
+        return bool(raw[position[0]] & position[1])
+
+    @property
+    def available(self) -> bool:
+        """Disponível enquanto a central estiver conectada."""
+        return super().available and self.coordinator.connection_id is not None
+
+    async def _async_send_command(self, command: Command, action: str) -> bool:
+        """Envia um comando pelo coordinator (latência e resultado registrados).
+        
+        Args:
+            command: Comando a enviar.
+            action: Descrição da ação para os logs (ex: "ligar PGM 3").
+            
+        Returns:
+            True se a central confirmou o comando.
+        """
+        return await self.coordinator.async_execute_command(command, action)
+
+    async def async_added_to_hass(self) -> None:
+        """Registra a entidade e guarda o estado inicial gravado."""
+        await super().async_added_to_hass()
+        self._last_fingerprint = self._state_fingerprint()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Grava o estado apenas se ele mudou desde a última escrita."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            self.coordinator.entity_writes_skipped += 1
+            return
+        
+        self._last_fingerprint = fingerprint
+        self.coordinator.entity_writes += 1
+        self.async_write_ha_state()
@@ -0,0 +1,231 @@
+"""Ponte entre os frames recebidos da central e o barramento de eventos do HA.
+
+Cada frame não tratado automaticamente (eventos 0xB0, comandos
+desconhecidos) pode virar um evento ``intelbras_amt_frame_received``.
+Durante rajadas de eventos (ex: disparo em várias zonas) isso inunda o
+barramento, então a ponte aplica, nesta ordem:
+
+1. Filtro por comando: só os comandos configurados são publicados.
+2. Limite de taxa por comando (token bucket): o excesso é descartado e
+   contado no campo ``dropped`` do próximo evento publicado.
+3. Janela de agrupamento opcional: os frames da janela saem juntos em um
+   único evento ``intelbras_amt_frames_received``.
+
+Os frames são publicados já decodificados (campos do evento Contact-ID ou
+a lista de bytes), evitando que cada automação faça o parsing de hex.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+from .lib.protocol.events import PanelEvent
+from .lib.protocol.isecnet import ISECNetFrame
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAME_EVENT = f"{DOMAIN}_frame_received"
+"""Evento com um frame decodificado."""
+
+FRAME_BATCH_EVENT = f"{DOMAIN}_frames_received"
+"""Evento com todos os frames de uma janela de agrupamento."""
+
+ALL_COMMANDS = "*"
+"""Valor da lista de comandos que publica todos os comandos."""
+
+COMMAND_PATTERN = re.compile(r"^(?:0x)?([0-9a-f]{1,2})$", re.IGNORECASE)
+"""Item de uma lista de comandos: código em hexadecimal ("B0" ou "0xB0")."""
+
+
+def parse_command_list(text: str | None) -> set[int] | None:
+    """Converte a lista de comandos digitada pelo usuário em códigos.
+
+    Args:
+        text: Códigos em hexadecimal separados por vírgula (ex: "B0, 94"),
+            ``*`` para todos ou vazio para nenhum.
+
+    Returns:
+        Conjunto de códigos, ou None para todos os comandos.
+
+    Raises:
+        ValueError: Se algum item não for um código hexadecimal válido.
+    """
+    if text is None or text.strip() == ALL_COMMANDS:
+        return None
+
+    commands: set[int] = set()
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+
+        match = COMMAND_PATTERN.match(item)
+        if not match:
+            raise ValueError(f"Item inválido na lista de comandos: '{item}'")
+        commands.add(int(match.group(1), 16))
+
+    return commands
+
+
+def decode_frame(
+    connection_id: str,
+    frame: ISECNetFrame,
+    event: PanelEvent | None = None,
+) -> dict[str, Any]:
+    """Monta o payload decodificado de um frame para o barramento.
+
+    Args:
+        connection_id: Conexão que recebeu o frame.
+        frame: Frame recebido.
+        event: Evento Contact-ID já parseado do frame, se houver.
+
+    Returns:
+        Dicionário com ``connection_id``, ``command`` e os campos do evento
+        (``event``) ou os bytes do conteúdo (``data``).
+    """
+    payload: dict[str, Any] = {
+        "connection_id": connection_id,
+        "command": frame.command,
+    }
+    if event is not None:
+        payload["event"] = {
+            "account": event.account,
+            "code": event.code,
+            "qualifier": event.qualifier,
+            "partition": event.partition,
+            "zone": event.zone,
+            "restore": event.is_restore,
+            "alarm": event.is_alarm,
+        }
+    else:
+        payload["data"] = list(frame.content)
+    return payload
+
+
+@dataclass
+class _TokenBucket:
+    """Limitador de taxa simples (``rate`` frames/s, rajada de ``rate``)."""
+
+    rate: float
+    tokens: float = field(init=False)
+    updated: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        self.tokens = max(self.rate, 1.0)
+
+    def take(self, now: float) -> bool:
+        """Consome um token, retorna False se a taxa foi excedida."""
+        self.tokens = min(
+            max(self.rate, 1.0),
+            self.tokens + (now - self.updated) * self.rate,
+        )
+        self.updated = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class FrameEventBridge:
+    """Publica os frames recebidos no barramento do HA com filtro, limite e agrupamento."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        commands: set[int] | None = None,
+        rate: float = 0.0,
+        batch_window: float = 0.0,
+    ) -> None:
+        """Inicializa a ponte.
+
+        Args:
+            hass: Instância do Home Assistant.
+            commands: Comandos publicados (None = todos, vazio = nenhum).
+            rate: Máximo de frames por segundo de cada comando (0 = sem limite).
+            batch_window: Janela (segundos) de agrupamento (0 = um evento
+                por frame).
+        """
+        self.hass = hass
+        self.commands = commands
+        self.rate = rate
+        self.batch_window = batch_window
+        self._buckets: dict[int, _TokenBucket] = {}
+        self._pending: list[dict[str, Any]] = []
+        """Frames aguardando o fim da janela de agrupamento."""
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._dropped = 0
+        """Frames descartados desde o último evento publicado."""
+        self.published = 0
+        """Total de frames publicados."""
+        self.dropped = 0
+        """Total de frames descartados pelo limite de taxa."""
+
+    @callback
+    def async_publish(
+        self,
+        connection_id: str,
+        frame: ISECNetFrame,
+        event: PanelEvent | None = None,
+    ) -> None:
+        """Publica um frame recebido, se passar pelo filtro e pelo limite.
+
+        Args:
+            connection_id: Conexão que recebeu o frame.
+            frame: Frame recebido.
+            event: Evento Contact-ID já parseado do frame, se houver.
+        """
+        if self.commands is not None and frame.command not in self.commands:
+            return
+
+        if self.rate > 0:
+            bucket = self._buckets.get(frame.command)
+            if bucket is None:
+                bucket = self._buckets[frame.command] = _TokenBucket(self.rate)
+            if not bucket.take(time.monotonic()):
+                self._dropped += 1
+                self.dropped += 1
+                return
+
+        payload = decode_frame(connection_id, frame, event)
+        self.published += 1
+
+        if self.batch_window <= 0:
+            payload["dropped"] = self._dropped
+            self._dropped = 0
+            self.hass.bus.async_fire(FRAME_EVENT, payload)
+            return
+
+        self._pending.append(payload)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.batch_window, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: datetime | None = None) -> None:
+        """Publica os frames da janela de agrupamento em um único evento."""
+        self._unsub_flush = None
+        if not self._pending:
+            return
+
+        frames, self._pending = self._pending, []
+        _LOGGER.debug(f"Publicando {len(frames)} frames agrupados ({self._dropped} descartados)")
+        self.hass.bus.async_fire(FRAME_BATCH_EVENT, {
+            "frames": frames,
+            "dropped": self._dropped,
+        })
+        self._dropped = 0
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancela a janela pendente e publica os frames já acumulados."""
+        if self._unsub_flush:
+            self._unsub_flush()
+        self._async_flush()
@@ -10,7 +10,6 @@ Ou com opções:
 import argparse
 import asyncio
 import logging
-import select
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -22,20 +21,15 @@ if str(_CUSTOM_COMPONENTS_DIR) not in sys.path:
 
 from custom_components.intelbras_amt.lib.server import AMTServer, AMTServerConfig
 from custom_components.intelbras_amt.lib.protocol.isecnet import ISECNetFrame
-from custom_components.intelbras_amt.lib.protocol.responses import ResponseType
-from custom_components.intelbras_amt.lib.protocol.commands import (
-    ActivationCommand,
-    DeactivationCommand,
-    PGMCommand,
-    SirenCommand,
-    PartialStatusRequestCommand,
-    PartialCentralStatus,
-    StatusRequestCommand,
-    CentralStatus,
-    ConnectionInfo,
-    CONNECTION_INFO_COMMAND,
-)
+from custom_components.intelbras_amt.lib.protocol.commands import CONNECTION_INFO_COMMAND
 from custom_components.intelbras_amt.lib.const import DEFAULT_PORT
+from custom_components.intelbras_amt.lib.console import AMTConsole, read_lines
+from custom_components.intelbras_amt.lib.metrics import start_metrics_server
+from custom_components.intelbras_amt.lib.profiling import Profiler, ProfileMode
+
+
+IDENTIFY_TIMEOUT = 10.0
+"""Espera (segundos) pelo comando 0x94 antes de o script contar a central só pela conexão."""
 
 
 # Configura logging com cores
@@ -82,37 +76,84 @@ def print_banner():
     print()
 
 
-async def run_server(port: int, password: str, verbose: bool):
+async def run_server(
+    port: int,
+    password: str,
+    verbose: bool,
+    capture: str | None = None,
+    profile: str | None = None,
+    profile_dir: str = ".",
+    metrics_port: int | None = None,
+    script: str | None = None,
+    wait_panels: int = 1,
+):
     """Executa o servidor."""
     logger = logging.getLogger(__name__)
+    profiler = Profiler(profile_dir)
     
     config = AMTServerConfig(
         host="0.0.0.0",
         port=port,
         auto_ack_heartbeat=True,
+        capture_path=capture,
     )
     
     server = AMTServer(config)
+    console = AMTConsole(server, password, profiler)
     
     # Estado
     connected_at = None
-    heartbeat_count = 0
+    ready = asyncio.Event()
+    unidentified: set[str] = set()
+    """Conexões que não enviaram o 0x94 em IDENTIFY_TIMEOUT (contam para o script)."""
+    
+    def check_ready():
+        # O script começa quando as centrais esperadas se identificam (alvos por
+        # conta/MAC) ou esgotam o prazo de identificação (alvos por IP ou all)
+        count = sum(
+            1 for c in server.connections
+            if "connection_info" in c.metadata or c.id in unidentified
+        )
+        if count >= wait_panels:
+            ready.set()
+    
+    def identify_timeout(connection_id: str):
+        conn = server.connections.get(connection_id)
+        if conn is None or "connection_info" in conn.metadata:
+            return
+        logger.warning(
+            f"Central {connection_id} não se identificou (0x94) em {IDENTIFY_TIMEOUT:.0f}s; "
+            f"use o IP ou o ID da conexão como alvo"
+        )
+        unidentified.add(connection_id)
+        check_ready()
     
     @server.on_connect
     async def on_connect(conn):
-        nonlocal connected_at, heartbeat_count
+        nonlocal connected_at
         connected_at = datetime.now()
-        heartbeat_count = 0
+        if server.connections.count == 1:
+            console.heartbeat_count = 0
         
         logger.info(f"✅ Central conectada: {conn.host}:{conn.port}")
+        if script:
+            asyncio.get_running_loop().call_later(IDENTIFY_TIMEOUT, identify_timeout, conn.id)
+            return
+        if server.connections.count > 1:
+            return
         print()
         print("\033[32m" + "  Central conectada! Agora você pode enviar comandos." + "\033[0m")
         print("  Digite 'arm' para armar, 'disarm' para desarmar, 'help' para ajuda.")
         print()
     
+    @server.on_identify
+    async def on_identify(conn):
+        check_ready()
+    
     @server.on_disconnect
     async def on_disconnect(conn):
         nonlocal connected_at
+        unidentified.discard(conn.id)
         
         if connected_at:
             duration = datetime.now() - connected_at
@@ -126,14 +167,13 @@ async def run_server(port: int, password: str, verbose: bool):
     async def on_frame(conn, frame: ISECNetFrame):
         # Heartbeats são tratados automaticamente, mas logamos aqui
         if frame.is_heartbeat:
-            nonlocal heartbeat_count
-            heartbeat_count += 1
+            console.heartbeat_count += 1
             if verbose:
-                logger.debug(f"💓 Heartbeat #{heartbeat_count}")
+                logger.debug(f"💓 Heartbeat #{console.heartbeat_count}")
         elif frame.command == CONNECTION_INFO_COMMAND:
             # Comando de identificação - informações já foram logadas pelo servidor
             info = conn.metadata.get("connection_info")
-            if info:
+            if info and not script:
                 print()
                 print(f"  📋 Central identificada:")
                 print(f"     Conta: {info.account}")
@@ -144,579 +184,55 @@ async def run_server(port: int, password: str, verbose: bool):
             logger.info(f"📦 Frame recebido: cmd=0x{frame.command:02X} data={frame.content.hex()}")
     
     # Inicia servidor
+    if profile:
+        profiler.start(profile)
     await server.start()
+    metrics_server = None
+    if metrics_port:
+        metrics_server = await start_metrics_server(server.metrics.registry, "0.0.0.0", metrics_port)
     
     print(f"  🔌 Servidor iniciado na porta {port}")
+    if metrics_server:
+        print(f"  📊 Métricas em http://<IP desta máquina>:{metrics_port}/metrics")
     print(f"  ⏳ Aguardando conexão da central...")
     print()
     print("  Configure sua central AMT para conectar em:")
     print(f"    IP: <IP desta máquina>")
     print(f"    Porta: {port}")
     print()
-    print("  Comandos: arm, disarm, pgm, siren, info, info-partial, status, quit (ou Ctrl+C)")
-    print()
-    
-    # Sinaliza quando devemos parar
-    stop_event = asyncio.Event()
-    
-    def read_stdin_nonblocking() -> str | None:
-        """Lê stdin sem bloquear, retorna None se não há input."""
-        if select.select([sys.stdin], [], [], 0)[0]:
-            return sys.stdin.readline()
-        return None
+    if not script:
+        print("  Comandos: arm, disarm, pgm, siren, info, info-partial, status, profile, trace, quit (ou Ctrl+C)")
+        print()
     
-    # Task para ler comandos
     async def command_loop():
-        loop = asyncio.get_event_loop()
-        
-        while not stop_event.is_set():
-            try:
-                # Usa executor com função non-blocking
-                line = await loop.run_in_executor(None, read_stdin_nonblocking)
-                
-                if line is None:
-                    # Sem input, aguarda um pouco antes de verificar novamente
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                line = line.strip().lower()
-                
-                if not line:
-                    continue
-                
-                if line in ('quit', 'exit', 'q'):
-                    logger.info("Encerrando servidor...")
-                    stop_event.set()
-                    return
-                
-                elif line == 'help':
-                    print()
-                    print("  Comandos disponíveis:")
-                    print("    arm [a|b|c|d|stay]   - Armar alarme (todas ou partição específica)")
-                    print("    disarm [a|b|c|d]     - Desarmar alarme (todas ou partição específica)")
-                    print("    pgm <1-19> on|off    - Controlar PGM (ex: pgm 1 on)")
-                    print("    siren on|off          - Ligar/desligar sirene (ex: siren on)")
-                    print("    info                 - Solicitar status completo da central (0x5B)")
-                    print("    info-partial         - Solicitar status parcial da central (0x5A)")
-                    print("    status               - Ver status da conexão TCP")
-                    print("    quit                 - Encerrar servidor")
-                    print()
-                
-                elif line.startswith('arm'):
-                    parts = line.split()
-                    partition = parts[1] if len(parts) > 1 else None
-                    
-                    # Verifica conexão
-                    connections = server.connections.all()
-                    if not connections:
-                        logger.error("❌ Nenhuma central conectada")
-                        continue
-                    
-                    conn_id = list(connections.keys())[0]
-                    
-                    # Cria comando
-                    if partition == 'a':
-                        cmd = ActivationCommand.arm_partition_a(password)
-                    elif partition == 'b':
-                        cmd = ActivationCommand.arm_partition_b(password)
-                    elif partition == 'c':
-                        cmd = ActivationCommand.arm_partition_c(password)
-                    elif partition == 'd':
-                        cmd = ActivationCommand.arm_partition_d(password)
-                    elif partition == 'stay':
-                        cmd = ActivationCommand.arm_stay(password)
-                    else:
-                        cmd = ActivationCommand.arm_all(password)
-                    
-                    logger.info(f"📤 Enviando comando de ativação...")
-                    
-                    try:
-                        response = await server.send_command(
-                            conn_id,
-                            cmd.build_net_frame(),
-                            wait_response=True,
-                        )
-                        
-                        if response.is_success:
-                            logger.info("✅ Alarme armado com sucesso!")
-                        else:
-                            logger.error(f"❌ Erro: {response.message}")
-                    
-                    except TimeoutError:
-                        logger.error("❌ Timeout aguardando resposta")
-                    except Exception as e:
-                        logger.error(f"❌ Erro: {e}")
-                
-                elif line.startswith('disarm'):
-                    parts = line.split()
-                    partition = parts[1] if len(parts) > 1 else None
-                    
-                    # Verifica conexão
-                    connections = server.connections.all()
-                    if not connections:
-                        logger.error("❌ Nenhuma central conectada")
-                        continue
-                    
-                    conn_id = list(connections.keys())[0]
-                    
-                    # Cria comando
-                    if partition == 'a':
-                        cmd = DeactivationCommand.disarm_partition_a(password)
-                    elif partition == 'b':
-                        cmd = DeactivationCommand.disarm_partition_b(password)
-                    elif partition == 'c':
-                        cmd = DeactivationCommand.disarm_partition_c(password)
-                    elif partition == 'd':
-                        cmd = DeactivationCommand.disarm_partition_d(password)
-                    else:
-                        cmd = DeactivationCommand.disarm_all(password)
-                    
-                    logger.info(f"📤 Enviando comando de desativação...")
-                    
-                    try:
-                        response = await server.send_command(
-                            conn_id,
-                            cmd.build_net_frame(),
-                            wait_response=True,
-                        )
-                        
-                        if response.is_success:
-                            logger.info("✅ Alarme desarmado com sucesso!")
-                        else:
-                            logger.error(f"❌ Erro: {response.message}")
-                    
-                    except TimeoutError:
-                        logger.error("❌ Timeout aguardando resposta")
-                    except Exception as e:
-                        logger.error(f"❌ Erro: {e}")
-                
-                elif line.startswith('pgm'):
-                    parts = line.split()
-                    if len(parts) < 3:
-                        print("  Uso: pgm <numero> on|off")
-                        print("  Exemplo: pgm 1 on")
-                        continue
-                    
-                    try:
-                        pgm_num = int(parts[1])
-                        action = parts[2]
-                    except ValueError:
-                        print("  Número de PGM inválido")
-                        continue
-                    
-                    if pgm_num < 1 or pgm_num > 19:
-                        print("  PGM deve ser entre 1 e 19")
-                        continue
-                    
-                    if action not in ('on', 'off'):
-                        print("  Ação deve ser 'on' ou 'off'")
-                        continue
-                    
-                    # Verifica conexão
-                    connections = server.connections.all()
-                    if not connections:
-                        logger.error("❌ Nenhuma central conectada")
-                        continue
-                    
-                    conn_id = list(connections.keys())[0]
-                    
-                    # Cria comando
-                    if action == 'on':
-                        cmd = PGMCommand.turn_on(password, pgm_num)
-                    else:
-                        cmd = PGMCommand.turn_off(password, pgm_num)
-                    
-                    action_str = "ligar" if action == 'on' else "desligar"
-                    logger.info(f"📤 Enviando comando para {action_str} PGM {pgm_num}...")
-                    
-                    try:
-                        response = await server.send_command(
-                            conn_id,
-                            cmd.build_net_frame(),
-                            wait_response=True,
-                        )
-                        
-                        if response.is_success:
-                            logger.info(f"✅ PGM {pgm_num} {'ligada' if action == 'on' else 'desligada'} com sucesso!")
-                        else:
-                            logger.error(f"❌ Erro: {response.message}")
-                    
-                    except TimeoutError:
-                        logger.error("❌ Timeout aguardando resposta")
-                    except Exception as e:
-                        logger.error(f"❌ Erro: {e}")
-                
-                elif line.startswith('siren'):
-                    parts = line.split()
-                    if len(parts) < 2:
-                        print("  Uso: siren on|off")
-                        print("  Exemplo: siren on")
-                        continue
-                    
-                    action = parts[1]
-                    if action not in ('on', 'off'):
-                        print("  Ação deve ser 'on' ou 'off'")
-                        continue
-                    
-                    # Verifica conexão
-                    connections = server.connections.all()
-                    if not connections:
-                        logger.error("❌ Nenhuma central conectada")
-                        continue
-                    
-                    conn_id = list(connections.keys())[0]
-                    
-                    # Cria comando
-                    if action == 'on':
-                        cmd = SirenCommand.turn_on_siren(password)
-                    else:
-                        cmd = SirenCommand.turn_off_siren(password)
-                    
-                    action_str = "ligar" if action == 'on' else "desligar"
-                    logger.info(f"📤 Enviando comando para {action_str} sirene...")
-                    
-                    try:
-                        response = await server.send_command(
-                            conn_id,
-                            cmd.build_net_frame(),
-                            wait_response=True,
-                        )
-                        
-                        if response.is_success:
-                            logger.info(f"✅ Sirene {'ligada' if action == 'on' else 'desligada'} com sucesso!")
-                        else:
-                            logger.error(f"❌ Erro: {response.message}")
-                    
-                    except TimeoutError:
-                        logger.error("❌ Timeout aguardando resposta")
-                    except Exception as e:
-                        logger.error(f"❌ Erro: {e}")
-                
-                elif line == 'info':
-                    # Verifica conexão
-                    connections = server.connections.all()
-                    if not connections:
-                        logger.error("❌ Nenhuma central conectada")
-                        continue
-                    
-                    conn_id = list(connections.keys())[0]
-                    
-                    cmd = StatusRequestCommand(password)
-                    frame_to_send = cmd.build_net_frame()
-                    logger.info("📤 Solicitando status da central...")
-                    logger.debug(f"📤 Frame enviado: {frame_to_send.build().hex(' ')}")
-                    
-                    try:
-                        response = await server.send_command(
-                            conn_id,
-                            frame_to_send,
-                            wait_response=True,
-                        )
-                        
-                        # Log detalhado da resposta
-                        logger.debug(f"📥 Resposta recebida:")
-                        logger.debug(f"   Tipo: {response.response_type}")
-                        logger.debug(f"   Código: 0x{response.code:02X}")
-                        logger.debug(f"   Tamanho dados: {len(response.data)} bytes")
-                        logger.debug(f"   Dados (hex): {response.data.hex(' ') if response.data else '(vazio)'}")
-                        logger.debug(f"   is_success: {response.is_success}")
-                        logger.debug(f"   Mensagem: {response.message}")
-                        logger.debug(f"   Frame bruto (hex): {response.raw_frame.build().hex(' ')}")
-                        logger.debug(f"   Frame content: {response.raw_frame.content.hex(' ') if response.raw_frame.content else '(vazio)'}")
-                        logger.debug(f"   Frame content length: {len(response.raw_frame.content)}")
-                        
-                        if response.is_success and response.data:
-                            status = CentralStatus.try_parse(response.data)
-                            if status:
-                                print()
-                                print("  ═══════════════════════════════════════")
-                                print("  📊 STATUS DA CENTRAL")
-                                print("  ═══════════════════════════════════════")
-                                print()
-                                
-                                # Status geral
-                                armed_status = "🔴 ARMADA" if status.armed else "🟢 DESARMADA"
-                                print(f"  Estado: {armed_status}")
-                                
-                                if status.triggered:
-                                    print("  ⚠️  ALARME DISPARADO!")
-                                if status.siren_on:
-                                    print("  🔊 Sirene LIGADA")
-                                if status.has_problem:
-                                    print("  ⚠️  Há problemas na central")
-                                
-                                print()
-                                print(f"  Modelo: 0x{status.model:02X}")
-                                print(f"  Firmware: v{status.firmware_version}")
-                                if status.central_datetime:
-                                    print(f"  Data/Hora: {status.central_datetime.strftime('%d/%m/%Y %H:%M')}")
-                                
-                                # Partições
-                                if status.partitions.partitions_enabled:
-                                    print()
-                                    print("  Partições:")
-                                    print(f"    A: {'🔴 Armada' if status.partitions.partition_a_armed else '🟢 Desarmada'}")
-                                    print(f"    B: {'🔴 Armada' if status.partitions.partition_b_armed else '🟢 Desarmada'}")
-                                    print(f"    C: {'🔴 Armada' if status.partitions.partition_c_armed else '🟢 Desarmada'}")
-                                    print(f"    D: {'🔴 Armada' if status.partitions.partition_d_armed else '🟢 Desarmada'}")
-                                
-                                # Zonas
-                                if status.zones.open_zones:
-                                    print()
-                                    print(f"  Zonas abertas: {sorted(status.zones.open_zones)}")
-                                if status.zones.violated_zones:
-                                    print(f"  Zonas violadas: {sorted(status.zones.violated_zones)}")
-                                if status.zones.bypassed_zones:
-                                    print(f"  Zonas em bypass: {sorted(status.zones.bypassed_zones)}")
-                                
-                                # PGMs
-                                active_pgms = status.pgm.get_active_pgms()
-                                if active_pgms:
-                                    print()
-                                    print(f"  PGMs ligadas: {active_pgms}")
-                                
-                                # Problemas
-                                if status.problems.has_problems:
-                                    print()
-                                    print("  ⚠️  Problemas detectados:")
-                                    if status.problems.ac_failure:
-                                        print("    - Falta de energia elétrica")
-                                    if status.problems.low_battery:
-                                        print("    - Bateria baixa")
-                                    if status.problems.battery_absent:
-                                        print("    - Bateria ausente")
-                                    if status.problems.siren_wire_cut:
-                                        print("    - Fio da sirene cortado")
-                                
-                                print()
-                                print("  ═══════════════════════════════════════")
-                                print()
-                            else:
-                                logger.error(f"❌ Não foi possível parsear status (recebido {len(response.data)} bytes)")
-                                logger.debug(f"   Dados brutos: {response.data.hex(' ')}")
-                        else:
-                            logger.error(f"❌ Erro: {response.message}")
-                            logger.debug(f"   Tipo resposta: {response.response_type}")
-                            logger.debug(f"   Código: 0x{response.code:02X}")
-                            logger.debug(f"   Dados recebidos: {len(response.data)} bytes")
-                            if response.data:
-                                logger.debug(f"   Dados (hex): {response.data.hex(' ')}")
-                            logger.debug(f"   Frame completo (hex): {response.raw_frame.build().hex(' ')}")
-                            if response.raw_frame.content:
-                                logger.debug(f"   Frame content (hex): {response.raw_frame.content.hex(' ')}")
-                                logger.debug(f"   Frame content length: {len(response.raw_frame.content)}")
-                    
-                    except TimeoutError:
-                        logger.error("❌ Timeout aguardando resposta")
-                    except Exception as e:
-                        logger.error(f"❌ Erro: {e}")
-                        import traceback
-                        logger.debug(f"   Traceback completo:\n{traceback.format_exc()}")
-                
-                elif line == 'info-partial':
-                    # Verifica conexão
-                    connections = server.connections.all()
-                    if not connections:
-                        logger.error("❌ Nenhuma central conectada")
-                        continue
-                    
-                    conn_id = list(connections.keys())[0]
-                    
-                    cmd = PartialStatusRequestCommand(password)
-                    frame_to_send = cmd.build_net_frame()
-                    logger.info("📤 Solicitando status parcial da central (0x5A)...")
-                    logger.debug(f"📤 Frame enviado: {frame_to_send.build().hex(' ')}")
-                    
-                    try:
-                        response = await server.send_command(
-                            conn_id,
-                            frame_to_send,
-                            wait_response=True,
-                        )
-                        
-                        # Log detalhado da resposta
-                        logger.debug(f"📥 Resposta recebida:")
-                        logger.debug(f"   Tipo: {response.response_type}")
-                        logger.debug(f"   Código: 0x{response.code:02X}")
-                        logger.debug(f"   Tamanho dados: {len(response.data)} bytes")
-                        logger.debug(f"   Dados (hex): {response.data.hex(' ') if response.data else '(vazio)'}")
-                        logger.debug(f"   is_success: {response.is_success}")
-                        logger.debug(f"   Mensagem: {response.message}")
-                        logger.debug(f"   Frame bruto (hex): {response.raw_frame.build().hex(' ')}")
-                        logger.debug(f"   Frame content: {response.raw_frame.content.hex(' ') if response.raw_frame.content else '(vazio)'}")
-                        logger.debug(f"   Frame content length: {len(response.raw_frame.content)}")
-                        
-                        # Para status parcial, a resposta pode ser DATA com 43 bytes
-                        if response.response_type == ResponseType.DATA and len(response.raw_frame.content) >= 43:
-                            # Resposta com dados grandes - parseia diretamente do content
-                            status = PartialCentralStatus.try_parse(response.raw_frame.content)
-                            if status:
-                                print()
-                                print("  ═══════════════════════════════════════")
-                                print("  📊 STATUS PARCIAL DA CENTRAL (0x5A)")
-                                print("  ═══════════════════════════════════════")
-                                print()
-                                
-                                # Status geral
-                                armed_status = "🔴 ARMADA" if status.armed else "🟢 DESARMADA"
-                                print(f"  Estado: {armed_status}")
-                                
-                                if status.triggered:
-                                    print("  ⚠️  ALARME DISPARADO!")
-                                
-                                print()
-                                print(f"  Modelo: 0x{status.model:02X}")
-                                print(f"  Firmware: v{status.firmware_version}")
-                                if status.central_datetime:
-                                    print(f"  Data/Hora: {status.central_datetime.strftime('%d/%m/%Y %H:%M')}")
-                                
-                                # Partições
-                                print()
-                                print("  Partições:")
-                                if status.partitions.partitions_enabled:
-                                    print(f"    A: {'🔴 Armada' if status.partitions.partition_a_armed else '🟢 Desarmada'}")
-                                    print(f"    B: {'🔴 Armada' if status.partitions.partition_b_armed else '🟢 Desarmada'}")
-                                else:
-                                    print("    Partições desabilitadas")
-                                
-                                # Zonas
-                                print()
-                                print("  Zonas:")
-                                open_zones = sorted(status.zones.open_zones)
-                                if open_zones:
-                                    print(f"    Abertas: {open_zones}")
-                                else:
-                                    print("    Abertas: Nenhuma (todas fechadas)")
-                                
-                                violated_zones = sorted(status.zones.violated_zones)
-                                if violated_zones:
-                                    print(f"    Violadas: {violated_zones}")
-                                else:
-                                    print("    Violadas: Nenhuma")
-                                
-                                bypassed_zones = sorted(status.zones.bypassed_zones)
-                                if bypassed_zones:
-                                    print(f"    Em bypass: {bypassed_zones}")
-                                else:
-                                    print("    Em bypass: Nenhuma")
-                                
-                                # Tamper e curto-circuito
-                                tamper_zones = sorted(status.zones.tamper_zones)
-                                if tamper_zones:
-                                    print(f"    Com tamper: {tamper_zones}")
-                                
-                                short_zones = sorted(status.zones.short_circuit_zones)
-                                if short_zones:
-                                    print(f"    Em curto-circuito: {short_zones}")
-                                
-                                # Bateria baixa sensores sem fio
-                                low_bat_zones = sorted(status.zones.low_battery_zones)
-                                if low_bat_zones:
-                                    print(f"    Bateria baixa (sem fio): {low_bat_zones}")
-                                
-                                # Sirene e PGMs
-                                print()
-                                print("  Saídas:")
-                                print(f"    Sirene: {'🔊 LIGADA' if status.siren_on else '🔇 Desligada'}")
-                                
-                                active_pgms = status.pgm.get_active_pgms()
-                                if active_pgms:
-                                    print(f"    PGMs ligadas: {active_pgms}")
-                                else:
-                                    print("    PGMs ligadas: Nenhuma")
-                                
-                                # Problemas
-                                print()
-                                if status.problems.has_problems:
-                                    print("  ⚠️  Problemas detectados:")
-                                    if status.problems.ac_failure:
-                                        print("    - Falta de energia elétrica")
-                                    if status.problems.low_battery:
-                                        print("    - Bateria baixa")
-                                    if status.problems.battery_absent:
-                                        print("    - Bateria ausente ou invertida")
-                                    if status.problems.battery_short:
-                                        print("    - Bateria em curto-circuito")
-                                    if status.problems.aux_overload:
-                                        print("    - Sobrecarga na saída auxiliar")
-                                    if status.problems.keyboard_problems:
-                                        print(f"    - Problemas nos teclados: {status.problems.keyboard_problems}")
-                                    if status.problems.keyboard_tamper:
-                                        print(f"    - Tamper nos teclados: {status.problems.keyboard_tamper}")
-                                    if status.problems.receiver_problems:
-                                        print(f"    - Problemas nos receptores: {status.problems.receiver_problems}")
-                                    if status.problems.siren_wire_cut:
-                                        print("    - Fio da sirene cortado")
-                                    if status.problems.siren_short:
-                                        print("    - Curto-circuito no fio da sirene")
-                                    if status.problems.phone_line_cut:
-                                        print("    - Linha telefônica cortada")
-                                    if status.problems.event_comm_failure:
-                                        print("    - Falha ao comunicar evento")
-                                else:
-                                    print("  ✅ Nenhum problema detectado")
-                                
-                                print()
-                                print("  ═══════════════════════════════════════")
-                                print()
-                            else:
-                                logger.error(f"❌ Não foi possível parsear status parcial (recebido {len(response.raw_frame.content)} bytes)")
-                        elif response.is_success and response.data:
-                            # Resposta ACK com dados (formato antigo)
-                            status = PartialCentralStatus.try_parse(response.data)
-                            if status:
-                                logger.info("✅ Status parcial recebido e parseado!")
-                            else:
-                                logger.error(f"❌ Não foi possível parsear status parcial (recebido {len(response.data)} bytes)")
-                        else:
-                            logger.error(f"❌ Erro: {response.message}")
-                            logger.debug(f"   Tipo resposta: {response.response_type}")
-                            logger.debug(f"   Código: 0x{response.code:02X}")
-                            logger.debug(f"   Dados recebidos: {len(response.data)} bytes")
-                            if response.data:
-                                logger.debug(f"   Dados (hex): {response.data.hex(' ')}")
-                            logger.debug(f"   Frame completo (hex): {response.raw_frame.build().hex(' ')}")
-                            if response.raw_frame.content:
-                                logger.debug(f"   Frame content (hex): {response.raw_frame.content.hex(' ')}")
-                                logger.debug(f"   Frame content length: {len(response.raw_frame.content)}")
-                    
-                    except TimeoutError:
-                        logger.error("❌ Timeout aguardando resposta")
-                    except Exception as e:
-                        logger.error(f"❌ Erro: {e}")
-                        import traceback
-                        logger.debug(f"   Traceback completo:\n{traceback.format_exc()}")
-                
-                elif line == 'status':
-                    connections = server.connections.all()
-                    print()
-                    print(f"  Conexões ativas: {len(connections)}")
-                    for conn_id, conn in connections.items():
-                        print(f"    - {conn_id} (conectado em {conn.connected_at})")
-                        if conn.metadata.get("account"):
-                            print(f"      Conta: {conn.metadata['account']}")
-                    if connected_at:
-                        print(f"  Heartbeats recebidos: {heartbeat_count}")
-                    print()
-                
-                else:
-                    print(f"  Comando desconhecido: {line}")
-                    print("  Digite 'help' para ver comandos disponíveis")
-            
-            except EOFError:
-                stop_event.set()
+        # Linhas chegam pelo event loop (add_reader), sem thread nem polling
+        async for line in read_lines(sys.stdin):
+            await console.execute(line)
+            if console.stopped:
                 return
-            except Exception as e:
-                if not stop_event.is_set():
-                    logger.error(f"Erro: {e}")
+        # Sem stdin (ex.: rodando como serviço): continua até Ctrl+C
+        await console.wait_stopped()
+
+    async def script_loop():
+        await ready.wait()
+        if script == '-':
+            await console.run_script(read_lines(sys.stdin))
+        else:
+            with open(script, encoding="utf-8") as f:
+                await console.run_script(read_lines(f))
     
     # Executa
     try:
-        await command_loop()
+        await (script_loop() if script else command_loop())
     except KeyboardInterrupt:
         logger.info("Interrompido pelo usuário")
     finally:
         await server.stop()
+        if metrics_server:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+        if profiler.mode:
+            console.stop_profiler()
 
 
 def main():
@@ -729,6 +245,12 @@ Exemplos:
   uv run python -m intelbras_amt
   uv run python -m intelbras_amt --port 9009 --password 1234
   uv run python -m intelbras_amt -v  # modo verbose
+  uv run python -m intelbras_amt --capture trafego.amtcap  # grava o tráfego
+  uv run python -m intelbras_amt --profile sample  # flamegraph ao encerrar
+  uv run python -m intelbras_amt --metrics-port 9464  # métricas OpenMetrics/Prometheus
+  uv run python -m intelbras_amt --script comandos.txt  # executa os comandos e encerra
+  echo "pgm 1 on" | uv run python -m intelbras_amt --script -
+  echo "pgm 1 off all" | uv run python -m intelbras_amt --script - --wait 300  # frota
         """
     )
     
@@ -746,6 +268,53 @@ Exemplos:
         help='Senha da central (padrão: 1234)'
     )
     
+    parser.add_argument(
+        '--capture',
+        type=str,
+        metavar='ARQUIVO',
+        help='Grava todo o tráfego das conexões neste arquivo (replay com lib.server.replay)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        choices=[mode.value for mode in ProfileMode],
+        help='Faz profiling do servidor do início ao fim (cpu, sample ou alloc)'
+    )
+    
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        default='.',
+        metavar='DIR',
+        help='Diretório dos arquivos de profiling (padrão: diretório atual)'
+    )
+    
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        metavar='PORTA',
+        help='Exporta métricas OpenMetrics (Prometheus) em http://0.0.0.0:PORTA/metrics'
+    )
+    
+    parser.add_argument(
+        '--script',
+        type=str,
+        metavar='ARQUIVO',
+        help=(
+            "Executa os comandos do arquivo ('-' para stdin) e encerra; começa quando "
+            f"as centrais de --wait se identificam (0x94) ou, sem 0x94, {IDENTIFY_TIMEOUT:.0f}s "
+            "depois de conectarem"
+        )
+    )
+    
+    parser.add_argument(
+        '--wait',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Com --script, espera N centrais conectarem e se identificarem antes de executar (padrão: 1)'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -763,7 +332,17 @@ Exemplos:
     print_banner()
     
     try:
-        asyncio.run(run_server(args.port, args.password, args.verbose))
+        asyncio.run(run_server(
+            args.port,
+            args.password,
+            args.verbose,
+            args.capture,
+            args.profile,
+            args.profile_dir,
+            args.metrics_port,
+            args.script,
+            args.wait,
+        ))
     except KeyboardInterrupt:
         pass
     
@@ -0,0 +1,1030 @@
+"""Console de comandos do servidor standalone.
+
+Os comandos chegam como linhas de texto (``arm``, ``pgm 1 on``, ``status``,
+...) e são despachados pela tabela ``COMMANDS``. A entrada é lida sem
+threads nem polling: ``read_lines`` registra o descritor no event loop
+(``loop.add_reader``) e entrega cada linha assim que ela chega.
+
+Os comandos para a central aceitam um alvo no fim da linha (``pgm 1 off
+all``, ``arm 1234``), resolvido por ``ConnectionManager.select``: ID da
+conexão, IP, conta, final do MAC ou ``all``. Sem alvo, vão para a primeira
+central conectada. Com várias centrais, o comando é enviado a todas ao
+mesmo tempo e o progresso aparece numa tabela com a latência de cada uma.
+
+No modo script (``run_script``) os comandos que vão para a central são
+disparados sem esperar a resposta do anterior: a fila de comandos da
+conexão os envia um após o outro, cada um assim que a central responde ao
+anterior. Os demais comandos (``status``, ``trace``, ``sleep``, ...)
+esperam os comandos em andamento terminarem antes de executar.
+
+Example:
+    ```python
+    console = AMTConsole(server, password="1234", profiler=Profiler())
+    async for line in read_lines(sys.stdin):
+        await console.execute(line)
+        if console.stopped:
+            break
+    ```
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, NamedTuple, TextIO
+
+from .protocol.commands import (
+    ActivationCommand,
+    CentralStatus,
+    DeactivationCommand,
+    PartialCentralStatus,
+    PartialStatusRequestCommand,
+    PGMCommand,
+    SirenCommand,
+    StatusRequestCommand,
+)
+from .protocol.isecnet import ISECNetFrame
+from .protocol.responses import Response, ResponseType
+from .profiling import Profiler, ProfilerError, ProfileMode, print_cpu_summary
+from .server import AMTServer
+from .server.connection_manager import AMTConnection
+
+
+logger = logging.getLogger(__name__)
+
+
+READ_CHUNK_SIZE = 4096
+"""Bytes lidos da entrada a cada vez que o descritor fica legível."""
+
+LIVE_REFRESH_INTERVAL = 0.1
+"""Intervalo entre redesenhos da tabela de progresso (segundos)."""
+
+LIVE_TABLE_ROWS = 20
+"""Centrais pendentes ou com erro mostradas na tabela ao vivo (a final mostra todas)."""
+
+
+async def read_lines(stream: TextIO) -> AsyncIterator[str]:
+    """Lê linhas de um arquivo, pipe ou terminal sem bloquear o event loop.
+
+    O descritor é registrado com ``loop.add_reader``: nenhuma thread e nenhum
+    polling, e a linha é entregue assim que chega. Descritores que o loop não
+    consegue monitorar (arquivo regular redirecionado, Windows) são lidos
+    linha a linha num executor.
+
+    Args:
+        stream: Entrada (normalmente ``sys.stdin``).
+
+    Yields:
+        Linhas lidas, com o ``\\n`` final.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    fd = stream.fileno()
+
+    def on_readable() -> None:
+        data = os.read(fd, READ_CHUNK_SIZE)
+        if data:
+            reader.feed_data(data)
+        else:
+            loop.remove_reader(fd)
+            reader.feed_eof()
+
+    try:
+        loop.add_reader(fd, on_readable)
+    except (OSError, ValueError, NotImplementedError):
+        while line := await loop.run_in_executor(None, stream.readline):
+            yield line
+        return
+
+    try:
+        while line := await reader.readline():
+            yield line.decode(errors="replace")
+    finally:
+        loop.remove_reader(fd)
+
+
+class ConsoleCommand(NamedTuple):
+    """Entrada da tabela de comandos do console."""
+
+    handler: str
+    """Nome do método de ``AMTConsole`` que executa o comando."""
+
+    help: tuple[tuple[str, str], ...]
+    """Linhas da ajuda: (uso, descrição)."""
+
+    panel: bool = False
+    """Se envia comando para a central (aceita alvo; o handler retorna um ``PanelRequest``)."""
+
+    max_args: int = 0
+    """Argumentos do comando sem contar o alvo (o que passar disso é o alvo)."""
+
+
+COMMANDS: dict[str, ConsoleCommand] = {
+    "arm": ConsoleCommand(
+        "_arm",
+        (("arm [a|b|c|d|stay] [alvo]", "Armar alarme (todas ou partição específica)"),),
+        panel=True,
+        max_args=1,
+    ),
+    "disarm": ConsoleCommand(
+        "_disarm",
+        (("disarm [a|b|c|d] [alvo]", "Desarmar alarme (todas ou partição específica)"),),
+        panel=True,
+        max_args=1,
+    ),
+    "pgm": ConsoleCommand(
+        "_pgm",
+        (("pgm <1-19> on|off [alvo]", "Controlar PGM (ex: pgm 1 on, pgm 1 off all)"),),
+        panel=True,
+        max_args=2,
+    ),
+    "siren": ConsoleCommand(
+        "_siren",
+        (("siren on|off [alvo]", "Ligar/desligar sirene (ex: siren on)"),),
+        panel=True,
+        max_args=1,
+    ),
+    "info": ConsoleCommand(
+        "_info",
+        (("info [alvo]", "Solicitar status completo da central (0x5B)"),),
+        panel=True,
+    ),
+    "info-partial": ConsoleCommand(
+        "_info_partial",
+        (("info-partial [alvo]", "Solicitar status parcial da central (0x5A)"),),
+        panel=True,
+    ),
+    "status": ConsoleCommand(
+        "_status",
+        (("status [alvo]", "Ver status das conexões TCP"),),
+    ),
+    "profile": ConsoleCommand(
+        "_profile",
+        (
+            ("profile start [modo]", "Iniciar profiling (cpu, sample ou alloc; padrão: sample)"),
+            ("profile stop", "Encerrar profiling e gravar o resultado"),
+        ),
+    ),
+    "trace": ConsoleCommand(
+        "_trace",
+        (
+            ("trace on [alvo] [N]", "Rastrear frames (todas ou algumas centrais, 1 a cada N)"),
+            ("trace off [alvo]", "Parar de rastrear frames"),
+            ("trace dump [arquivo]", "Mostrar (ou gravar) os frames rastreados"),
+        ),
+    ),
+    "sleep": ConsoleCommand(
+        "_sleep",
+        (("sleep <segundos>", "Aguardar (útil em scripts)"),),
+    ),
+    "help": ConsoleCommand(
+        "_help",
+        (("help", "Mostrar esta ajuda"),),
+    ),
+    "quit": ConsoleCommand(
+        "_quit",
+        (("quit", "Encerrar servidor"),),
+    ),
+}
+"""Comandos do console, na ordem em que aparecem na ajuda."""
+
+ALIASES = {
+    "exit": "quit",
+    "q": "quit",
+}
+"""Nomes alternativos de comandos."""
+
+
+class PanelRequest(NamedTuple):
+    """Comando para a central, montado pelo handler de um comando do console."""
+
+    frame: ISECNetFrame
+    description: str
+    """Texto do log de envio (ex.: "comando de ativação")."""
+
+    success: str = ""
+    """Log de sucesso com uma central só (comandos sem dados na resposta)."""
+
+    show: Callable[[Response], None] | None = None
+    """Mostra a resposta em detalhe quando o alvo é uma central só."""
+
+    summarize: Callable[[Response], str | None] | None = None
+    """Resumo da resposta na tabela de progresso (None = resposta inválida)."""
+
+
+@dataclass
+class PanelResult:
+    """Linha da tabela de progresso: o comando em uma central."""
+
+    connection_id: str
+    label: str
+    """Identidade da central (conta-MAC) ou "-" se ainda não identificada."""
+
+    result: str = "⏳ Enviando"
+    latency: float | None = None
+    """Segundos entre o envio e a resposta (inclui a espera na fila da conexão)."""
+
+    done: bool = False
+    ok: bool = False
+
+
+class ProgressTable:
+    """Tabela de progresso de um comando enviado a várias centrais.
+
+    Num terminal, ``draw`` redesenha a tabela no lugar, mostrando o resumo
+    e as centrais ainda pendentes ou com erro (até ``LIVE_TABLE_ROWS``);
+    ``finish`` mostra todas as linhas, com a latência de cada central.
+    """
+
+    def __init__(self, results: list[PanelResult]) -> None:
+        self._results = results
+        self._started = time.monotonic()
+        self._drawn = 0
+
+    def draw(self) -> None:
+        """Redesenha a tabela ao vivo."""
+        rows = [result for result in self._results if not result.ok]
+        lines = [self._summary(), self._header()]
+        lines += [self._row(result) for result in rows[:LIVE_TABLE_ROWS]]
+        if len(rows) > LIVE_TABLE_ROWS:
+            lines.append(f"  ... mais {len(rows) - LIVE_TABLE_ROWS} centrais")
+        self._write(lines)
+
+    def finish(self) -> None:
+        """Substitui a tabela ao vivo pela tabela completa e o resumo."""
+        lines = [""]
+        lines.append(self._header())
+        lines += [self._row(result) for result in self._results]
+        lines.append("")
+        lines.append(self._summary())
+        latencies = [result.latency for result in self._results if result.latency is not None]
+        if latencies:
+            lines.append(
+                f"  Latência: mediana {statistics.median(latencies) * 1000:.0f} ms, "
+                f"máxima {max(latencies) * 1000:.0f} ms"
+            )
+        lines.append("")
+        self._write(lines)
+        self._drawn = 0
+
+    def _write(self, lines: list[str]) -> None:
+        # Volta o cursor para o início da tabela anterior e apaga até o fim da tela
+        erase = f"\033[{self._drawn}F\033[J" if self._drawn else ""
+        sys.stdout.write(erase + "\n".join(lines) + "\n")
+        sys.stdout.flush()
+        self._drawn = len(lines)
+
+    def _summary(self) -> str:
+        done = sum(result.done for result in self._results)
+        ok = sum(result.ok for result in self._results)
+        return (
+            f"  {done}/{len(self._results)} centrais │ ✅ {ok} │ ❌ {done - ok} │ "
+            f"⏳ {len(self._results) - done} │ {time.monotonic() - self._started:.2f}s"
+        )
+
+    @staticmethod
+    def _header() -> str:
+        return f"  {'Central':<16} {'Conexão':<22} {'Latência':>9}  Resultado"
+
+    @staticmethod
+    def _row(result: PanelResult) -> str:
+        latency = f"{result.latency * 1000:.0f} ms" if result.latency is not None else "-"
+        return f"  {result.label:<16} {result.connection_id:<22} {latency:>9}  {result.result}"
+
+
+class AMTConsole:
+    """Executa os comandos do console contra um ``AMTServer``."""
+
+    def __init__(self, server: AMTServer, password: str, profiler: Profiler) -> None:
+        """Inicializa o console.
+
+        Args:
+            server: Servidor com as centrais conectadas.
+            password: Senha da central usada nos comandos.
+            profiler: Profiler controlado pelo comando ``profile``.
+        """
+        self._server = server
+        self._password = password
+        self._profiler = profiler
+        self._stop_event = asyncio.Event()
+        self.heartbeat_count = 0
+        """Heartbeats recebidos desde a última conexão (mostrado em ``status``)."""
+        self.live = sys.stdout.isatty()
+        """Se a tabela de progresso é redesenhada enquanto o comando executa."""
+
+    @property
+    def stopped(self) -> bool:
+        """Se o comando ``quit`` foi executado."""
+        return self._stop_event.is_set()
+
+    async def wait_stopped(self) -> None:
+        """Aguarda o comando ``quit``."""
+        await self._stop_event.wait()
+
+    def stop(self) -> None:
+        """Sinaliza o encerramento do console."""
+        self._stop_event.set()
+
+    def parse(self, line: str) -> tuple[ConsoleCommand, list[str]] | None:
+        """Separa uma linha em comando e argumentos.
+
+        Linhas vazias e comentários (``#``) são ignorados; comandos
+        desconhecidos são avisados no terminal.
+
+        Returns:
+            Comando e argumentos, ou None se não há o que executar.
+        """
+        parts = line.split("#", 1)[0].split()
+        if not parts:
+            return None
+        name = parts[0].lower()
+        command = COMMANDS.get(ALIASES.get(name, name))
+        if command is None:
+            print(f"  Comando desconhecido: {name}")
+            print("  Digite 'help' para ver comandos disponíveis")
+            return None
+        return command, parts[1:]
+
+    async def execute(self, line: str) -> None:
+        """Executa uma linha de comando e aguarda o resultado."""
+        parsed = self.parse(line)
+        if parsed is not None:
+            await self._run(*parsed)
+
+    async def run_script(self, lines: AsyncIterator[str]) -> None:
+        """Executa os comandos de um script, enviando em sequência sem esperas.
+
+        Comandos para a central entram na fila de cada conexão do alvo assim
+        que lidos, na ordem do script (``_start_panel``), e as respostas são
+        aguardadas em background; comandos locais aguardam os que estão em
+        andamento.
+        Termina no fim do script ou no ``quit``. As tabelas de progresso só
+        são mostradas completas, no fim de cada comando.
+
+        Args:
+            lines: Linhas do script (ex.: ``read_lines(arquivo)``).
+        """
+        pending: set[asyncio.Task] = set()
+        started = time.monotonic()
+        count = 0
+        self.live = False
+
+        async for line in lines:
+            parsed = self.parse(line)
+            if parsed is None:
+                continue
+            command, args = parsed
+            count += 1
+            if command.panel:
+                try:
+                    responses = self._start_panel(command, args)
+                except Exception as e:
+                    logger.error(f"Erro: {e}")
+                    continue
+                if responses is not None:
+                    task = asyncio.create_task(responses)
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                continue
+            if pending:
+                await asyncio.wait(pending)
+            await self._run(command, args)
+            if self.stopped:
+                break
+
+        if pending:
+            await asyncio.wait(pending)
+        print(f"  📜 Script: {count} comandos em {time.monotonic() - started:.2f}s")
+
+    async def _run(self, command: ConsoleCommand, args: list[str]) -> None:
+        try:
+            if command.panel:
+                responses = self._start_panel(command, args)
+                if responses is not None:
+                    await responses
+            else:
+                handler: Callable[[list[str]], Awaitable[None]] = getattr(self, command.handler)
+                await handler(args)
+        except Exception as e:
+            logger.error(f"Erro: {e}")
+
+    def _split_target(self, command: ConsoleCommand, args: list[str]) -> tuple[list[str], str | None]:
+        """Separa o alvo (último argumento) dos argumentos do comando.
+
+        O último argumento é o alvo se passa do número de argumentos do
+        comando ou se é ``all`` ou corresponde a alguma conexão (``arm all``,
+        ``info 1234``).
+        """
+        if args and (
+            len(args) > command.max_args
+            or args[-1].lower() == "all"
+            or self._server.connections.select(args[-1])
+        ):
+            return args[:-1], args[-1]
+        return args, None
+
+    def _targets(self, selector: str | None) -> list[AMTConnection]:
+        """Conexões do alvo (sem alvo, a primeira); loga erro se não há nenhuma."""
+        connections = self._server.connections
+        if selector is None:
+            targets = list(connections)[:1]
+        else:
+            targets = connections.select(selector)
+        if not targets:
+            if not connections.count:
+                logger.error("❌ Nenhuma central conectada")
+            else:
+                logger.error(f"❌ Nenhuma central corresponde a '{selector}'")
+        return targets
+
+    def _start_panel(self, command: ConsoleCommand, args: list[str]) -> Awaitable[None] | None:
+        """Monta o comando para a central e o coloca na fila das conexões do alvo.
+
+        Os envios são criados aqui, sem esperas, então cada conexão recebe os
+        comandos na ordem das chamadas (a ordem do script), mesmo quando um
+        comando para várias centrais e outro para uma só disputam a fila.
+
+        Returns:
+            Aguardável que recebe e mostra as respostas, ou None se não há
+            o que enviar.
+        """
+        args, selector = self._split_target(command, args)
+        request: PanelRequest | None = getattr(self, command.handler)(args)
+        if request is None:
+            return None
+        targets = self._targets(selector)
+        if not targets:
+            return None
+        sends = [self._enqueue(connection, request) for connection in targets]
+        if len(targets) == 1:
+            return self._request_one(targets[0], request, sends[0])
+        return self._request_many(targets, request, sends)
+
+    def _enqueue(self, connection: AMTConnection, request: PanelRequest) -> asyncio.Task[Response | None]:
+        """Envia o comando numa task criada na hora (entra na fila da conexão na ordem de criação)."""
+        return asyncio.create_task(
+            self._server.send_command(connection.id, request.frame, wait_response=True)
+        )
+
+    async def _request_one(
+        self,
+        connection: AMTConnection,
+        request: PanelRequest,
+        send: asyncio.Task[Response | None],
+    ) -> None:
+        """Aguarda a resposta de uma central e mostra em detalhe."""
+        if self._server.connections.count > 1:
+            logger.info(f"📤 Enviando {request.description} para {connection.id}...")
+        else:
+            logger.info(f"📤 Enviando {request.description}...")
+        try:
+            response = await send
+        except TimeoutError:
+            logger.error("❌ Timeout aguardando resposta")
+            return
+        except Exception as e:
+            logger.error(f"❌ Erro: {e}")
+            logger.debug(f"   Traceback completo:\n{traceback.format_exc()}")
+            return
+
+        if request.show:
+            request.show(response)
+        elif response.is_success:
+            logger.info(f"✅ {request.success}")
+        else:
+            logger.error(f"❌ Erro: {response.message}")
+
+    async def _request_many(
+        self,
+        targets: list[AMTConnection],
+        request: PanelRequest,
+        sends: list[asyncio.Task[Response | None]],
+    ) -> None:
+        """Aguarda as respostas de várias centrais ao mesmo tempo, com tabela de progresso."""
+        logger.info(f"📤 Enviando {request.description} para {len(targets)} centrais...")
+        sent_at = time.monotonic()
+        results = []
+        for connection in targets:
+            info = connection.metadata.get("connection_info")
+            results.append(PanelResult(connection.id, info.identity if info else "-"))
+
+        table = ProgressTable(results)
+        pending = {
+            asyncio.create_task(self._request_panel(result, request, send, sent_at))
+            for result, send in zip(results, sends)
+        }
+        if self.live:
+            while pending:
+                table.draw()
+                _, pending = await asyncio.wait(pending, timeout=LIVE_REFRESH_INTERVAL)
+        else:
+            await asyncio.wait(pending)
+        table.finish()
+
+    async def _request_panel(
+        self,
+        result: PanelResult,
+        request: PanelRequest,
+        send: asyncio.Task[Response | None],
+        sent_at: float,
+    ) -> None:
+        """Aguarda a resposta de uma das centrais e preenche a linha da tabela."""
+        try:
+            response = await send
+        except TimeoutError:
+            result.result = "⏱️ Timeout"
+        except Exception as e:
+            result.result = f"❌ {e}"
+        else:
+            result.latency = time.monotonic() - sent_at
+            if request.summarize:
+                summary = request.summarize(response)
+            else:
+                summary = "OK" if response.is_success else None
+            if summary is None:
+                result.result = f"❌ {response.message}"
+            else:
+                result.ok = True
+                result.result = f"✅ {summary}"
+        result.done = True
+
+    def _arm(self, args: list[str]) -> PanelRequest:
+        partition = args[0].lower() if args else None
+        if partition == "a":
+            cmd = ActivationCommand.arm_partition_a(self._password)
+        elif partition == "b":
+            cmd = ActivationCommand.arm_partition_b(self._password)
+        elif partition == "c":
+            cmd = ActivationCommand.arm_partition_c(self._password)
+        elif partition == "d":
+            cmd = ActivationCommand.arm_partition_d(self._password)
+        elif partition == "stay":
+            cmd = ActivationCommand.arm_stay(self._password)
+        else:
+            cmd = ActivationCommand.arm_all(self._password)
+
+        return PanelRequest(
+            cmd.build_net_frame(), "comando de ativação", "Alarme armado com sucesso!"
+        )
+
+    def _disarm(self, args: list[str]) -> PanelRequest:
+        partition = args[0].lower() if args else None
+        if partition == "a":
+            cmd = DeactivationCommand.disarm_partition_a(self._password)
+        elif partition == "b":
+            cmd = DeactivationCommand.disarm_partition_b(self._password)
+        elif partition == "c":
+            cmd = DeactivationCommand.disarm_partition_c(self._password)
+        elif partition == "d":
+            cmd = DeactivationCommand.disarm_partition_d(self._password)
+        else:
+            cmd = DeactivationCommand.disarm_all(self._password)
+
+        return PanelRequest(
+            cmd.build_net_frame(), "comando de desativação", "Alarme desarmado com sucesso!"
+        )
+
+    def _pgm(self, args: list[str]) -> PanelRequest | None:
+        if len(args) < 2:
+            print("  Uso: pgm <numero> on|off [alvo]")
+            print("  Exemplo: pgm 1 on")
+            return None
+
+        try:
+            pgm_num = int(args[0])
+        except ValueError:
+            print("  Número de PGM inválido")
+            return None
+        action = args[1].lower()
+
+        if pgm_num < 1 or pgm_num > 19:
+            print("  PGM deve ser entre 1 e 19")
+            return None
+        if action not in ("on", "off"):
+            print("  Ação deve ser 'on' ou 'off'")
+            return None
+
+        if action == "on":
+            cmd = PGMCommand.turn_on(self._password, pgm_num)
+        else:
+            cmd = PGMCommand.turn_off(self._password, pgm_num)
+
+        return PanelRequest(
+            cmd.build_net_frame(),
+            f"comando para {'ligar' if action == 'on' else 'desligar'} PGM {pgm_num}",
+            f"PGM {pgm_num} {'ligada' if action == 'on' else 'desligada'} com sucesso!",
+        )
+
+    def _siren(self, args: list[str]) -> PanelRequest | None:
+        if not args:
+            print("  Uso: siren on|off [alvo]")
+            print("  Exemplo: siren on")
+            return None
+
+        action = args[0].lower()
+        if action not in ("on", "off"):
+            print("  Ação deve ser 'on' ou 'off'")
+            return None
+
+        if action == "on":
+            cmd = SirenCommand.turn_on_siren(self._password)
+        else:
+            cmd = SirenCommand.turn_off_siren(self._password)
+
+        return PanelRequest(
+            cmd.build_net_frame(),
+            f"comando para {'ligar' if action == 'on' else 'desligar'} sirene",
+            f"Sirene {'ligada' if action == 'on' else 'desligada'} com sucesso!",
+        )
+
+    def _info(self, args: list[str]) -> PanelRequest:
+        return PanelRequest(
+            StatusRequestCommand(self._password).build_net_frame(),
+            "pedido de status da central",
+            show=_show_status,
+            summarize=_summarize_status,
+        )
+
+    def _info_partial(self, args: list[str]) -> PanelRequest:
+        return PanelRequest(
+            PartialStatusRequestCommand(self._password).build_net_frame(),
+            "pedido de status parcial da central (0x5A)",
+            show=_show_partial_status,
+            summarize=_summarize_partial_status,
+        )
+
+    async def _status(self, args: list[str]) -> None:
+        connections = self._server.connections
+        selected = connections.select(args[0]) if args else list(connections)
+        print()
+        print(f"  Conexões ativas: {connections.count}")
+        for conn in selected:
+            print(f"    - {conn.id} (conectado em {conn.connected_at})")
+            if conn.metadata.get("account"):
+                print(f"      Conta: {conn.metadata['account']}")
+            memory = conn.memory_usage()
+            print(
+                f"      Memória: {memory['total']} bytes "
+                f"(leitura {memory['reader_buffer'] + memory['frame_buffer']}, "
+                f"escrita {memory['write_buffer']})"
+            )
+        if connections.count:
+            print(f"  Heartbeats recebidos: {self.heartbeat_count}")
+        print()
+
+    def stop_profiler(self) -> None:
+        """Encerra o profiling e mostra onde o resultado foi gravado."""
+        path = self._profiler.stop()
+        print(f"  📈 Perfil gravado em {path}")
+        if path.suffix == ".pstats":
+            print_cpu_summary(path)
+
+    async def _profile(self, args: list[str]) -> None:
+        action = args[0].lower() if args else ""
+        profiler = self._profiler
+        try:
+            if action == "start":
+                profiler.start(args[1].lower() if len(args) > 1 else ProfileMode.SAMPLE)
+                print(f"  📈 Profiling '{profiler.mode}' iniciado")
+            elif action == "stop":
+                self.stop_profiler()
+            elif profiler.mode:
+                print(f"  📈 Profiling '{profiler.mode}' em execução há {profiler.elapsed:.0f}s")
+            else:
+                print("  Uso: profile start [cpu|sample|alloc] | profile stop")
+        except ProfilerError as e:
+            print(f"  {e}")
+        except ValueError:
+            print("  Modo deve ser 'cpu', 'sample' ou 'alloc'")
+
+    async def _trace(self, args: list[str]) -> None:
+        action = args[0].lower() if args else ""
+        trace = self._server.wire_trace
+        if action == "on":
+            selector = None
+            sample = None
+            for arg in args[1:]:
+                if arg.isdigit() and not self._server.connections.select(arg):
+                    sample = int(arg)
+                elif arg.lower() != "all":
+                    selector = arg
+            targets = self._server.connections.select(selector) if selector else None
+            if targets == []:
+                print(f"  Nenhuma central corresponde a '{selector}'")
+                return
+            try:
+                if targets is None:
+                    trace.enable(sample=sample)
+                for connection in targets or ():
+                    trace.enable(connection.id, sample)
+            except ValueError as e:
+                print(f"  {e}")
+                return
+            names = ", ".join(connection.id for connection in targets) if targets else "todas as conexões"
+            print(f"  🔎 Trace ligado para {names} (1 a cada {trace.sample} frames)")
+        elif action == "off":
+            selector = args[1] if len(args) > 1 and args[1].lower() != "all" else None
+            if selector is None:
+                trace.disable()
+                print("  🔎 Trace desligado para todas as conexões")
+                return
+            # Conexões já encerradas continuam desligáveis pelo ID
+            ids = [connection.id for connection in self._server.connections.select(selector)] or [selector]
+            for connection_id in ids:
+                trace.disable(connection_id)
+            print(f"  🔎 Trace desligado para {', '.join(ids)}")
+        elif action == "dump":
+            lines = list(trace.format())
+            if len(args) > 1:
+                Path(args[1]).write_text("".join(f"{text}\n" for text in lines))
+                print(f"  🔎 {len(lines)} frames gravados em {args[1]}")
+            else:
+                print()
+                for text in lines:
+                    print(f"  {text}")
+                print()
+        elif action == "clear":
+            trace.clear()
+            print("  🔎 Trace esvaziado")
+        else:
+            if trace.active:
+                targets = trace.connections
+                if targets is not None:
+                    names = ", ".join(sorted(targets))
+                elif trace.excluded:
+                    names = f"todas as conexões exceto {', '.join(sorted(trace.excluded))}"
+                else:
+                    names = "todas as conexões"
+                print(f"  🔎 Trace ligado para {names} (1 a cada {trace.sample} frames), {len(trace)} frames no buffer")
+            else:
+                print(f"  🔎 Trace desligado, {len(trace)} frames no buffer")
+            print("  Uso: trace on [alvo|all] [N] | trace off [alvo] | trace dump [arquivo] | trace clear")
+
+    async def _sleep(self, args: list[str]) -> None:
+        try:
+            seconds = float(args[0])
+        except (IndexError, ValueError):
+            print("  Uso: sleep <segundos>")
+            return
+        await asyncio.sleep(seconds)
+
+    async def _help(self, args: list[str]) -> None:
+        print()
+        print("  Comandos disponíveis:")
+        for command in COMMANDS.values():
+            for usage, description in command.help:
+                print(f"    {usage:<26} - {description}")
+        print()
+        print("  Alvo: all, ID da conexão, IP, conta ou final do MAC; vários separados")
+        print("  por vírgula (ex: pgm 1 off all, arm 1234,5678). Sem alvo: primeira central.")
+        print()
+
+    async def _quit(self, args: list[str]) -> None:
+        logger.info("Encerrando servidor...")
+        self.stop()
+
+
+def _show_status(response: Response) -> None:
+    """Mostra a resposta do status completo (0x5B) de uma central."""
+    _log_response(response)
+    if not (response.is_success and response.data):
+        logger.error(f"❌ Erro: {response.message}")
+        return
+    status = CentralStatus.try_parse(response.data)
+    if status:
+        _print_central_status(status)
+    else:
+        logger.error(f"❌ Não foi possível parsear status (recebido {len(response.data)} bytes)")
+
+
+def _show_partial_status(response: Response) -> None:
+    """Mostra a resposta do status parcial (0x5A) de uma central."""
+    _log_response(response)
+    content = response.raw_frame.content
+    # Para status parcial, a resposta pode ser DATA com 43 bytes
+    if response.response_type == ResponseType.DATA and len(content) >= 43:
+        status = PartialCentralStatus.try_parse(content)
+        if status:
+            _print_partial_status(status)
+        else:
+            logger.error(f"❌ Não foi possível parsear status parcial (recebido {len(content)} bytes)")
+    elif response.is_success and response.data:
+        # Resposta ACK com dados (formato antigo)
+        if PartialCentralStatus.try_parse(response.data):
+            logger.info("✅ Status parcial recebido e parseado!")
+        else:
+            logger.error(f"❌ Não foi possível parsear status parcial (recebido {len(response.data)} bytes)")
+    else:
+        logger.error(f"❌ Erro: {response.message}")
+
+
+def _summarize_status(response: Response) -> str | None:
+    """Resumo do status completo para a tabela de progresso."""
+    status = CentralStatus.try_parse(response.data) if response.is_success and response.data else None
+    return _status_summary(status) if status else None
+
+
+def _summarize_partial_status(response: Response) -> str | None:
+    """Resumo do status parcial para a tabela de progresso."""
+    content = response.raw_frame.content
+    if response.response_type == ResponseType.DATA and len(content) >= 43:
+        status = PartialCentralStatus.try_parse(content)
+    elif response.is_success and response.data:
+        status = PartialCentralStatus.try_parse(response.data)
+    else:
+        status = None
+    return _status_summary(status) if status else None
+
+
+def _status_summary(status: CentralStatus | PartialCentralStatus) -> str:
+    """Estado, disparo, sirene e PGMs ligadas em uma linha."""
+    parts = ["ARMADA" if status.armed else "DESARMADA"]
+    if status.triggered:
+        parts.append("DISPARADA")
+    if status.siren_on:
+        parts.append("sirene ligada")
+    active_pgms = status.pgm.get_active_pgms()
+    if active_pgms:
+        parts.append(f"PGMs {active_pgms}")
+    return ", ".join(parts)
+
+
+def _log_response(response: Response) -> None:
+    """Loga (em debug) os detalhes de uma resposta da central."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    content = response.raw_frame.content
+    logger.debug("📥 Resposta recebida:")
+    logger.debug(f"   Tipo: {response.response_type}")
+    logger.debug(f"   Código: 0x{response.code:02X}")
+    logger.debug(f"   Tamanho dados: {len(response.data)} bytes")
+    logger.debug(f"   Dados (hex): {response.data.hex(' ') if response.data else '(vazio)'}")
+    logger.debug(f"   is_success: {response.is_success}")
+    logger.debug(f"   Mensagem: {response.message}")
+    logger.debug(f"   Frame bruto (hex): {response.raw_frame.build().hex(' ')}")
+    logger.debug(f"   Frame content: {content.hex(' ') if content else '(vazio)'}")
+    logger.debug(f"   Frame content length: {len(content)}")
+
+
+def _partition_state(armed: bool) -> str:
+    return "🔴 Armada" if armed else "🟢 Desarmada"
+
+
+def _print_central_status(status: CentralStatus) -> None:
+    """Mostra o status completo (0x5B) da central."""
+    print()
+    print("  ═══════════════════════════════════════")
+    print("  📊 STATUS DA CENTRAL")
+    print("  ═══════════════════════════════════════")
+    print()
+
+    # Status geral
+    print(f"  Estado: {'🔴 ARMADA' if status.armed else '🟢 DESARMADA'}")
+    if status.triggered:
+        print("  ⚠️  ALARME DISPARADO!")
+    if status.siren_on:
+        print("  🔊 Sirene LIGADA")
+    if status.has_problem:
+        print("  ⚠️  Há problemas na central")
+
+    print()
+    print(f"  Modelo: 0x{status.model:02X}")
+    print(f"  Firmware: v{status.firmware_version}")
+    if status.central_datetime:
+        print(f"  Data/Hora: {status.central_datetime.strftime('%d/%m/%Y %H:%M')}")
+
+    # Partições
+    partitions = status.partitions
+    if partitions.partitions_enabled:
+        print()
+        print("  Partições:")
+        print(f"    A: {_partition_state(partitions.partition_a_armed)}")
+        print(f"    B: {_partition_state(partitions.partition_b_armed)}")
+        print(f"    C: {_partition_state(partitions.partition_c_armed)}")
+        print(f"    D: {_partition_state(partitions.partition_d_armed)}")
+
+    # Zonas
+    if status.zones.open_zones:
+        print()
+        print(f"  Zonas abertas: {sorted(status.zones.open_zones)}")
+    if status.zones.violated_zones:
+        print(f"  Zonas violadas: {sorted(status.zones.violated_zones)}")
+    if status.zones.bypassed_zones:
+        print(f"  Zonas em bypass: {sorted(status.zones.bypassed_zones)}")
+
+    # PGMs
+    active_pgms = status.pgm.get_active_pgms()
+    if active_pgms:
+        print()
+        print(f"  PGMs ligadas: {active_pgms}")
+
+    # Problemas
+    problems = status.problems
+    if problems.has_problems:
+        print()
+        print("  ⚠️  Problemas detectados:")
+        if problems.ac_failure:
+            print("    - Falta de energia elétrica")
+        if problems.low_battery:
+            print("    - Bateria baixa")
+        if problems.battery_absent:
+            print("    - Bateria ausente")
+        if problems.siren_wire_cut:
+            print("    - Fio da sirene cortado")
+
+    print()
+    print("  ═══════════════════════════════════════")
+    print()
+
+
+def _print_partial_status(status: PartialCentralStatus) -> None:
+    """Mostra o status parcial (0x5A) da central."""
+    print()
+    print("  ═══════════════════════════════════════")
+    print("  📊 STATUS PARCIAL DA CENTRAL (0x5A)")
+    print("  ═══════════════════════════════════════")
+    print()
+
+    # Status geral
+    print(f"  Estado: {'🔴 ARMADA' if status.armed else '🟢 DESARMADA'}")
+    if status.triggered:
+        print("  ⚠️  ALARME DISPARADO!")
+
+    print()
+    print(f"  Modelo: 0x{status.model:02X}")
+    print(f"  Firmware: v{status.firmware_version}")
+    if status.central_datetime:
+        print(f"  Data/Hora: {status.central_datetime.strftime('%d/%m/%Y %H:%M')}")
+
+    # Partições
+    partitions = status.partitions
+    print()
+    print("  Partições:")
+    if partitions.partitions_enabled:
+        print(f"    A: {_partition_state(partitions.partition_a_armed)}")
+        print(f"    B: {_partition_state(partitions.partition_b_armed)}")
+    else:
+        print("    Partições desabilitadas")
+
+    # Zonas
+    zones = status.zones
+    print()
+    print("  Zonas:")
+    print(f"    Abertas: {sorted(zones.open_zones) or 'Nenhuma (todas fechadas)'}")
+    print(f"    Violadas: {sorted(zones.violated_zones) or 'Nenhuma'}")
+    print(f"    Em bypass: {sorted(zones.bypassed_zones) or 'Nenhuma'}")
+
+    # Tamper, curto-circuito e bateria baixa dos sensores sem fio
+    if zones.tamper_zones:
+        print(f"    Com tamper: {sorted(zones.tamper_zones)}")
+    if zones.short_circuit_zones:
+        print(f"    Em curto-circuito: {sorted(zones.short_circuit_zones)}")
+    if zones.low_battery_zones:
+        print(f"    Bateria baixa (sem fio): {sorted(zones.low_battery_zones)}")
+
+    # Sirene e PGMs
+    print()
+    print("  Saídas:")
+    print(f"    Sirene: {'🔊 LIGADA' if status.siren_on else '🔇 Desligada'}")
+    print(f"    PGMs ligadas: {status.pgm.get_active_pgms() or 'Nenhuma'}")
+
+    # Problemas
+    problems = status.problems
+    print()
+    if problems.has_problems:
+        print("  ⚠️  Problemas detectados:")
+        if problems.ac_failure:
+            print("    - Falta de energia elétrica")
+        if problems.low_battery:
+            print("    - Bateria baixa")
+        if problems.battery_absent:
+            print("    - Bateria ausente ou invertida")
+        if problems.battery_short:
+            print("    - Bateria em curto-circuito")
+        if problems.aux_overload:
+            print("    - Sobrecarga na saída auxiliar")
+        if problems.keyboard_problems:
+            print(f"    - Problemas nos teclados: {problems.keyboard_problems}")
+        if problems.keyboard_tamper:
+            print(f"    - Tamper nos teclados: {problems.keyboard_tamper}")
+        if problems.receiver_problems:
+            print(f"    - Problemas nos receptores: {problems.receiver_problems}")
+        if problems.siren_wire_cut:
+            print("    - Fio da sirene cortado")
+        if problems.siren_short:
+            print("    - Curto-circuito no fio da sirene")
+        if problems.phone_line_cut:
+            print("    - Linha telefônica cortada")
+        if problems.event_comm_failure:
+            print("    - Falha ao comunicar evento")
+    else:
+        print("  ✅ Nenhum problema detectado")
+
+    print()
+    print("  ═══════════════════════════════════════")
+    print()
@@ -1,6 +1,6 @@
 """Constantes do protocolo ISECNet/ISECMobile."""
 
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 
 
 # =============================================================================
@@ -17,6 +17,47 @@ KEEPALIVE_INTERVAL = 30.0
 """Intervalo em segundos para envio de keep-alive."""
 
 
+# =============================================================================
+# Limites de Memória por Conexão
+# =============================================================================
+
+READ_BUFFER_LIMIT = 16 * 1024
+"""Limite do buffer de leitura asyncio de cada conexão (bytes).
+
+Acima de duas vezes esse valor a leitura do socket é pausada até o
+servidor consumir os dados.
+"""
+
+WRITE_BUFFER_LIMIT = 16 * 1024
+"""Bytes na fila de escrita de uma conexão acima dos quais ``drain`` espera."""
+
+FRAME_BUFFER_LIMIT = 1024
+"""Bytes sem frame completo guardados pelo ``ISECNetFrameReader``.
+
+Um frame ISECNet tem no máximo 257 bytes; o excesso é lixo de um link
+ruim e é descartado a partir dos bytes mais antigos.
+"""
+
+MAX_CONNECTION_MEMORY = 256 * 1024
+"""Memória estimada máxima de uma conexão antes de aplicar ``MemoryPolicy``."""
+
+MEMORY_CHECK_INTERVAL = 1.0
+"""Intervalo mínimo em segundos entre verificações do limite global de memória."""
+
+MEMORY_THROTTLE_DELAY = 0.5
+"""Pausa em segundos na leitura de uma conexão acima do limite (``THROTTLE``)."""
+
+
+class MemoryPolicy(StrEnum):
+    """O que fazer com uma conexão acima do limite de memória."""
+
+    DISCONNECT = "disconnect"
+    """Encerra a conexão (a central reconecta sozinha)."""
+
+    THROTTLE = "throttle"
+    """Pausa a leitura da conexão até a memória voltar ao limite."""
+
+
 # =============================================================================
 # Protocolo ISECNet
 # =============================================================================
@@ -27,6 +68,9 @@ ISECNET_COMMAND_MOBILE = 0xE9
 ISECNET_COMMAND_HEARTBEAT = 0xF7
 """Comando ISECNet para heartbeat (keep-alive)."""
 
+ISECNET_COMMAND_EVENT = 0xB0
+"""Comando ISECNet de evento Contact-ID enviado espontaneamente pela central."""
+
 
 # =============================================================================
 # Protocolo ISECMobile
@@ -145,6 +189,13 @@ class PartitionCode(IntEnum):
     
     STAY_MODE = 0x50
     """Ativa no modo Stay."""
+    
+    @property
+    def letter(self) -> str | None:
+        """Letra da partição ('A'-'D') ou None para todas/Stay."""
+        if PartitionCode.PARTITION_A <= self <= PartitionCode.PARTITION_D:
+            return chr(self)
+        return None
 
 
 # =============================================================================
@@ -274,3 +325,19 @@ class CentralModel(IntEnum):
         }
         return model_names.get(model_code, f"0x{model_code:02X}")
 
+    @classmethod
+    def max_zones(cls, model_code: int | None) -> int:
+        """Retorna o número de zonas suportadas pelo modelo.
+        
+        Args:
+            model_code: Código do modelo (hex) ou None se desconhecido.
+            
+        Returns:
+            Número máximo de zonas (64 se o modelo for desconhecido).
+        """
+        zones = {
+            cls.AMT_2018_E: 18,
+            cls.AMT_4010: 64,
+        }
+        return zones.get(model_code, 64)
+
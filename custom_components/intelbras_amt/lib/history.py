@@ -0,0 +1,405 @@
+"""Histórico compacto de respostas de status da central.
+
+Grava cada resposta de status (43 ou 54 bytes) em um log binário
+append-only, com registros de tamanho fixo, para manter o histórico
+completo da central sem o custo de guardar centenas de estados de
+entidades por leitura.
+
+Formato de cada segmento:
+| Campo       | Bytes | Descrição                               |
+|-------------|-------|-----------------------------------------|
+| Magic       | 8     | b"AMTSNAP1"                             |
+| Registro    | 2     | Tamanho de cada registro (64)           |
+| Reservado   | 6     | Zeros                                   |
+| Registros   | N*64  | Registros em ordem cronológica          |
+
+Formato de cada registro (64 bytes, little-endian):
+| Campo       | Bytes | Descrição                               |
+|-------------|-------|-----------------------------------------|
+| Timestamp   | 8     | Epoch em segundos (float64)             |
+| Modelo      | 1     | Código do modelo da central             |
+| Tamanho     | 1     | Bytes válidos do payload (43 ou 54)     |
+| Payload     | 54    | Status bruto (completado com zeros)     |
+
+Os segmentos são rotacionados por tamanho e nomeados pelo timestamp do
+primeiro registro, então a leitura por intervalo de tempo só abre os
+segmentos relevantes e faz busca binária dentro de cada um via mmap.
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+logger = logging.getLogger(__name__)
+
+
+SEGMENT_MAGIC = b"AMTSNAP1"
+"""Identificador do início de cada segmento."""
+
+SEGMENT_HEADER = struct.Struct("<8sH6x")
+"""Cabeçalho do segmento: magic + tamanho do registro."""
+
+RECORD = struct.Struct("<dBB54s")
+"""Registro: timestamp + modelo + tamanho do payload + payload."""
+
+SEGMENT_SUFFIX = ".amtlog"
+"""Extensão dos arquivos de segmento."""
+
+DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024
+"""Tamanho máximo de um segmento antes da rotação (4 MiB, ~65 mil registros)."""
+
+DEFAULT_FLUSH_INTERVAL = 30.0
+"""Intervalo máximo em segundos entre gravações em disco."""
+
+DEFAULT_BATCH_SIZE = 128
+"""Quantidade de registros que força uma gravação imediata."""
+
+DEFAULT_QUEUE_SIZE = 4096
+"""Registros pendentes em memória antes de começar a descartar."""
+
+
+@dataclass(frozen=True)
+class SnapshotRecord:
+    """Um snapshot de status gravado no histórico."""
+
+    timestamp: float
+    """Momento da resposta (epoch em segundos)."""
+
+    model: int
+    """Código do modelo da central."""
+
+    payload: bytes
+    """Status bruto (43 ou 54 bytes)."""
+
+    def pack(self) -> bytes:
+        """Serializa o registro em 64 bytes."""
+        return RECORD.pack(self.timestamp, self.model, len(self.payload), self.payload)
+
+    @classmethod
+    def unpack_from(cls, buffer, offset: int = 0) -> "SnapshotRecord":
+        """Lê um registro a partir de um buffer.
+
+        Args:
+            buffer: Buffer com os bytes do segmento (bytes ou mmap).
+            offset: Posição do registro no buffer.
+
+        Returns:
+            Registro lido.
+        """
+        timestamp, model, length, payload = RECORD.unpack_from(buffer, offset)
+        return cls(timestamp=timestamp, model=model, payload=payload[:length])
+
+
+def _segment_start(path: Path) -> float:
+    """Extrai o timestamp inicial do nome do segmento."""
+    return int(path.stem) / 1000
+
+
+class SnapshotLogWriter:
+    """Grava registros em segmentos append-only.
+
+    Operações de arquivo bloqueantes; em código asyncio use
+    ``SnapshotLogRecorder``, que grava em lote num executor.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_segments: int | None = None,
+    ) -> None:
+        """Inicializa o writer.
+
+        Args:
+            directory: Diretório dos segmentos (criado se não existir).
+            max_segment_size: Tamanho em bytes que dispara a rotação.
+            max_segments: Quantidade máxima de segmentos mantidos (None = todos).
+        """
+        self._directory = Path(directory)
+        self._max_segment_size = max_segment_size
+        self._max_segments = max_segments
+        self._file = None
+        self._size = 0
+
+    @property
+    def directory(self) -> Path:
+        """Diretório dos segmentos."""
+        return self._directory
+
+    def append_many(self, records: list[SnapshotRecord]) -> None:
+        """Grava uma lista de registros, rotacionando segmentos se necessário.
+
+        Args:
+            records: Registros em ordem cronológica.
+        """
+        if not records:
+            return
+
+        chunk: list[bytes] = []
+        for record in records:
+            if self._file is None or self._size >= self._max_segment_size:
+                if chunk:
+                    self._file.write(b"".join(chunk))
+                    chunk.clear()
+                self._open_segment(record.timestamp)
+            chunk.append(record.pack())
+            self._size += RECORD.size
+
+        self._file.write(b"".join(chunk))
+        self._file.flush()
+
+    def _open_segment(self, timestamp: float) -> None:
+        """Fecha o segmento atual e abre um novo."""
+        self.close()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        path = self._directory / f"{int(timestamp * 1000):013d}{SEGMENT_SUFFIX}"
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+        if self._size == 0:
+            self._file.write(SEGMENT_HEADER.pack(SEGMENT_MAGIC, RECORD.size))
+            self._size = SEGMENT_HEADER.size
+
+        logger.debug(f"Novo segmento de histórico: {path.name}")
+        self._prune()
+
+    def _prune(self) -> None:
+        """Remove os segmentos mais antigos além do limite configurado."""
+        if not self._max_segments:
+            return
+
+        segments = sorted(self._directory.glob(f"*{SEGMENT_SUFFIX}"))
+        for path in segments[:-self._max_segments]:
+            try:
+                path.unlink()
+                logger.debug(f"Segmento de histórico removido: {path.name}")
+            except OSError as e:
+                logger.warning(f"Não foi possível remover {path.name}: {e}")
+
+    def close(self) -> None:
+        """Fecha o segmento atual."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._size = 0
+
+
+class SnapshotLogReader:
+    """Lê o histórico de snapshots via mmap, com busca por tempo.
+
+    Example:
+        ```python
+        reader = SnapshotLogReader("history/")
+        for record in reader.iter_range(start=time.time() - 3600):
+            status = CentralStatus.try_parse(record.payload)
+        ```
+    """
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        """Inicializa o leitor.
+
+        Args:
+            directory: Diretório dos segmentos.
+        """
+        self._directory = Path(directory)
+
+    @property
+    def segments(self) -> list[Path]:
+        """Segmentos existentes, em ordem cronológica."""
+        return sorted(self._directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def iter_range(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> Iterator[SnapshotRecord]:
+        """Itera os registros com ``start <= timestamp < end``.
+
+        Args:
+            start: Timestamp inicial (None = desde o início).
+            end: Timestamp final exclusivo (None = até o fim).
+
+        Yields:
+            Registros em ordem cronológica.
+        """
+        segments = self.segments
+        starts = [_segment_start(path) for path in segments]
+
+        # Primeiro segmento que pode conter `start`
+        first = 0
+        if start is not None:
+            first = max(bisect_right(starts, start) - 1, 0)
+
+        for index in range(first, len(segments)):
+            if end is not None and starts[index] >= end:
+                return
+            yield from self._iter_segment(segments[index], start, end)
+
+    def _iter_segment(
+        self,
+        path: Path,
+        start: float | None,
+        end: float | None,
+    ) -> Iterator[SnapshotRecord]:
+        """Itera um segmento usando busca binária para o início."""
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size <= SEGMENT_HEADER.size:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, record_size = SEGMENT_HEADER.unpack_from(data, 0)
+                if magic != SEGMENT_MAGIC or record_size != RECORD.size:
+                    logger.warning(f"Segmento de histórico inválido: {path.name}")
+                    return
+
+                count = (size - SEGMENT_HEADER.size) // RECORD.size
+                index = self._find_first(data, count, start) if start is not None else 0
+
+                while index < count:
+                    offset = SEGMENT_HEADER.size + index * RECORD.size
+                    record = SnapshotRecord.unpack_from(data, offset)
+                    if end is not None and record.timestamp >= end:
+                        return
+                    yield record
+                    index += 1
+
+    @staticmethod
+    def _find_first(data: mmap.mmap, count: int, start: float) -> int:
+        """Busca binária pelo primeiro registro com timestamp >= start."""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            (timestamp,) = struct.unpack_from("<d", data, SEGMENT_HEADER.size + middle * RECORD.size)
+            if timestamp < start:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class SnapshotLogRecorder:
+    """Alimenta um ``SnapshotLogWriter`` em lotes, em background.
+
+    ``record`` apenas enfileira o snapshot (não bloqueia o event loop);
+    uma task agrupa os registros e grava em um executor a cada
+    ``flush_interval`` segundos ou quando ``batch_size`` registros
+    se acumulam.
+    """
+
+    def __init__(
+        self,
+        writer: SnapshotLogWriter,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        """Inicializa o recorder.
+
+        Args:
+            writer: Writer dos segmentos.
+            flush_interval: Intervalo máximo entre gravações (segundos).
+            batch_size: Registros que forçam uma gravação imediata.
+            max_queue_size: Registros pendentes antes de descartar novos.
+        """
+        self._writer = writer
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue[SnapshotRecord | None] = asyncio.Queue(max_queue_size)
+        self._task: asyncio.Task | None = None
+        self.dropped = 0
+        """Registros descartados por fila cheia."""
+
+    def start(self) -> None:
+        """Inicia a task de gravação."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Grava os registros pendentes e encerra a task."""
+        if self._task is not None:
+            # Sentinela: a task grava o lote atual e termina
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+        await self._flush(self._drain())
+        await asyncio.get_running_loop().run_in_executor(None, self._writer.close)
+
+    def record(self, model: int, payload: bytes, timestamp: float | None = None) -> None:
+        """Enfileira um snapshot para gravação.
+
+        Args:
+            model: Código do modelo da central.
+            payload: Status bruto (43 ou 54 bytes).
+            timestamp: Momento da resposta (padrão: agora).
+        """
+        record = SnapshotRecord(
+            timestamp=time.time() if timestamp is None else timestamp,
+            model=model,
+            payload=bytes(payload),
+        )
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _drain(self) -> list[SnapshotRecord]:
+        """Retira todos os registros disponíveis na fila."""
+        batch: list[SnapshotRecord] = []
+        while not self._queue.empty():
+            record = self._queue.get_nowait()
+            if record is not None:
+                batch.append(record)
+        return batch
+
+    async def _flush(self, batch: list[SnapshotRecord]) -> None:
+        """Grava um lote no executor."""
+        if not batch:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._writer.append_many, batch
+            )
+            logger.debug(f"{len(batch)} snapshots gravados no histórico")
+        except OSError as e:
+            logger.error(f"Erro ao gravar histórico de status: {e}")
+
+    async def _run(self) -> None:
+        """Loop de gravação em lote (termina ao receber a sentinela None)."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Aguarda o primeiro registro do lote
+            record = await self._queue.get()
+            if record is None:
+                return
+
+            batch = [record]
+            deadline = loop.time() + self._flush_interval
+            stopping = False
+
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            await self._flush(batch)
+            if stopping:
+                return
@@ -0,0 +1,390 @@
+"""Métricas do servidor, das conexões e dos coordinators.
+
+Registro simples, sem dependências: contadores, gauges e histogramas com
+labels, renderizados no formato texto do OpenMetrics (lido pelo
+Prometheus, VictoriaMetrics, Grafana Agent etc).
+
+``ServerMetrics`` reúne as métricas do ``AMTServer`` (frames e bytes por
+comando, heartbeats, NACKs, timeouts, reconexões, RTT dos comandos) e do
+``ConnectionManager`` (conexões abertas e memória estimada). O coordinator
+da integração registra o tempo de parsing do status na mesma instância.
+
+No servidor standalone, ``start_metrics_server`` expõe o texto em
+``http://<host>:<porta>/metrics``:
+
+    uv run python -m custom_components.intelbras_amt.lib --metrics-port 9464
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from .const import ISECNET_COMMAND_HEARTBEAT, ISECNET_COMMAND_MOBILE
+from .protocol.isecmobile import ISECMobileFrame
+from .protocol.isecnet import ISECNetFrame
+from .protocol.responses import Response, ResponseType
+
+if TYPE_CHECKING:
+    from .server.connection_manager import ConnectionManager
+
+
+logger = logging.getLogger(__name__)
+
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+"""Content-Type da resposta do endpoint ``/metrics``."""
+
+RTT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+"""Limites (segundos) do histograma de RTT dos comandos (link GPRS incluso)."""
+
+PARSE_BUCKETS = (5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 5e-3)
+"""Limites (segundos) do histograma de tempo de parsing do status."""
+
+Labels = tuple[str, ...]
+"""Valores dos labels de uma série, na ordem de ``labelnames``."""
+
+
+def _format_value(value: float) -> str:
+    """Formata um valor de amostra (inteiros sem casas decimais)."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escapa o valor de um label (barra invertida, aspas e quebra de linha)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: Labels, extra: str = "") -> str:
+    """Formata ``{nome="valor",...}`` (vazio se não há labels)."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Contador monotônico, com uma série por combinação de labels."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Incrementa a série dos ``labels``."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Valor de uma série (0 se nunca incrementada)."""
+        return self._values.get(labels, 0.0)
+
+    @property
+    def total(self) -> float:
+        """Soma de todas as séries."""
+        return sum(self._values.values())
+
+    def samples(self) -> Iterator[str]:
+        """Linhas de amostra no formato OpenMetrics."""
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}_total{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge:
+    """Valor instantâneo, lido de uma função na hora da exportação."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        read: Callable[[], float | dict[Labels, float]],
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._read = read
+
+    def samples(self) -> Iterator[str]:
+        """Linhas de amostra no formato OpenMetrics."""
+        values = self._read()
+        if not isinstance(values, dict):
+            values = {(): values}
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """Histograma de limites fixos, com uma série por combinação de labels."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...],
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: dict[Labels, list] = {}
+        """Labels -> [contagem por limite (+Inf no fim), soma, total]."""
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Registra uma observação na série dos ``labels``."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        """Observações de uma série; de todas se ``labels`` vazio."""
+        if labels:
+            series = self._series.get(labels)
+            return series[2] if series else 0
+        return sum(series[2] for series in self._series.values())
+
+    def sum(self, *labels: str) -> float:
+        """Soma das observações de uma série; de todas se ``labels`` vazio."""
+        if labels:
+            series = self._series.get(labels)
+            return series[1] if series else 0.0
+        return sum(series[1] for series in self._series.values())
+
+    def samples(self) -> Iterator[str]:
+        """Linhas de amostra no formato OpenMetrics (buckets cumulativos)."""
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}"
+
+
+Metric = Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    """Conjunto de métricas exportadas juntas."""
+
+    def __init__(self) -> None:
+        self._metrics: list[Metric] = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Cria e registra um contador."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        read: Callable[[], float | dict[Labels, float]],
+        labelnames: tuple[str, ...] = (),
+    ) -> Gauge:
+        """Cria e registra um gauge lido de ``read`` na exportação."""
+        return self._register(Gauge(name, documentation, read, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...],
+        labelnames: tuple[str, ...] = (),
+    ) -> Histogram:
+        """Cria e registra um histograma."""
+        return self._register(Histogram(name, documentation, buckets, labelnames))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Exporta todas as métricas no formato texto do OpenMetrics."""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.extend(metric.samples())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def command_label(command: int) -> str:
+    """Label de um código de comando (ex: ``"0x5A"``)."""
+    return f"0x{command:02X}"
+
+
+class ServerMetrics:
+    """Métricas de um ``AMTServer`` e do seu ``ConnectionManager``.
+
+    Atualizadas pelo próprio servidor; o coordinator registra
+    ``status_parse``. Os contadores podem ser lidos direto (ex: sensores
+    de diagnóstico) ou exportados com ``registry.render()``.
+    """
+
+    def __init__(self, connections: "ConnectionManager") -> None:
+        """Cria as métricas.
+
+        Args:
+            connections: Conexões do servidor (para os gauges).
+        """
+        self._connections = connections
+        self._seen_panels: set[str] = set()
+        registry = self.registry = MetricsRegistry()
+
+        self.frames_received = registry.counter(
+            "amt_frames_received", "Frames recebidos das centrais, por comando ISECNet.", ("command",)
+        )
+        self.bytes_received = registry.counter(
+            "amt_bytes_received", "Bytes dos frames recebidos, por comando ISECNet.", ("command",)
+        )
+        self.frames_sent = registry.counter(
+            "amt_frames_sent", "Frames enviados às centrais, por comando ISECNet.", ("command",)
+        )
+        self.bytes_sent = registry.counter(
+            "amt_bytes_sent", "Bytes enviados às centrais, por comando ISECNet.", ("command",)
+        )
+        self.heartbeats = registry.counter(
+            "amt_heartbeats", "Heartbeats (0xF7) recebidos."
+        )
+        self.responses = registry.counter(
+            "amt_command_responses", "Respostas a comandos, por comando ISECMobile e tipo de resposta.",
+            ("command", "result"),
+        )
+        self.nacks = registry.counter(
+            "amt_nacks", "Comandos recusados pela central, por código de NACK.", ("code",)
+        )
+        self.timeouts = registry.counter(
+            "amt_command_timeouts", "Comandos sem resposta dentro do timeout, por comando ISECMobile.", ("command",)
+        )
+        self.connections_accepted = registry.counter(
+            "amt_connections_accepted", "Conexões TCP aceitas."
+        )
+        self.reconnects = registry.counter(
+            "amt_reconnects", "Identificações (0x94) de centrais que já tinham conectado antes."
+        )
+        self.command_rtt = registry.histogram(
+            "amt_command_rtt_seconds", "Tempo entre o envio do comando e a resposta, por comando ISECMobile.",
+            RTT_BUCKETS, ("command",),
+        )
+        self.status_parse = registry.histogram(
+            "amt_status_parse_seconds", "Tempo de parsing das respostas de status, por tamanho do payload.",
+            PARSE_BUCKETS, ("size",),
+        )
+        self.status_updates = registry.counter(
+            "amt_status_updates", "Consultas de status dos coordinators, por resultado "
+            "(changed, unchanged ou failed).", ("result",)
+        )
+        registry.gauge(
+            "amt_connections", "Conexões abertas.", lambda: connections.count
+        )
+        registry.gauge(
+            "amt_connection_memory_bytes", "Memória estimada das conexões, por item.",
+            self._memory_usage, ("item",),
+        )
+
+    def _memory_usage(self) -> dict[Labels, float]:
+        """Soma de ``AMTConnection.memory_usage`` por item."""
+        totals: dict[Labels, float] = {}
+        for connection in self._connections:
+            for item, size in connection.memory_usage().items():
+                if item != "total":
+                    totals[(item,)] = totals.get((item,), 0) + size
+        return totals
+
+    def frame_received(self, frame: ISECNetFrame) -> None:
+        """Registra um frame recebido."""
+        label = command_label(frame.command)
+        self.frames_received.inc(label)
+        if frame.command == ISECNET_COMMAND_HEARTBEAT:
+            self.bytes_received.inc(label)
+            self.heartbeats.inc()
+        else:
+            self.bytes_received.inc(label, amount=len(frame.content) + 3)
+
+    def data_sent(self, data: bytes) -> None:
+        """Registra um frame enviado (bytes já serializados)."""
+        label = command_label(data[1] if len(data) > 1 else data[0])
+        self.frames_sent.inc(label)
+        self.bytes_sent.inc(label, amount=len(data))
+
+    def identified(self, identity: str) -> None:
+        """Registra a identificação (0x94) de uma central."""
+        if identity in self._seen_panels:
+            self.reconnects.inc()
+        else:
+            self._seen_panels.add(identity)
+
+    @staticmethod
+    def mobile_command(frame: ISECNetFrame) -> str:
+        """Label do comando ISECMobile dentro de um frame enviado."""
+        if frame.command == ISECNET_COMMAND_MOBILE:
+            mobile = ISECMobileFrame.try_parse(frame.content)
+            if mobile is not None:
+                return command_label(mobile.command_code)
+        return command_label(frame.command)
+
+    def response(self, command: str, response: Response, rtt: float) -> None:
+        """Registra a resposta a um comando.
+
+        Args:
+            command: Label do comando ISECMobile (``mobile_command``).
+            response: Resposta da central.
+            rtt: Tempo entre o envio e a resposta (segundos).
+        """
+        self.command_rtt.observe(rtt, command)
+        self.responses.inc(command, response.response_type.value)
+        if response.response_type == ResponseType.NACK:
+            code = response.error_code
+            self.nacks.inc(code.name if code else command_label(response.code))
+
+
+async def start_metrics_server(registry: MetricsRegistry, host: str, port: int) -> asyncio.Server:
+    """Sobe um endpoint HTTP mínimo que exporta ``registry`` em ``/metrics``.
+
+    Args:
+        registry: Métricas a exportar.
+        host: Endereço para bind.
+        port: Porta TCP.
+
+    Returns:
+        Servidor asyncio (feche com ``close()``).
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5.0)
+            path = request.split(b" ", 2)[1].split(b"?")[0] if request.count(b" ") >= 2 else b""
+            if path == b"/metrics":
+                status, content_type, body = "200 OK", OPENMETRICS_CONTENT_TYPE, registry.render().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", b"Use /metrics\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError) as e:
+            logger.debug(f"Requisição de métricas inválida: {e}")
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info(f"Métricas em http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,257 @@
+"""Profiling do servidor standalone sem alterar código.
+
+Três modos, escolhidos por ``ProfileMode``:
+
+| Modo   | Ferramenta                     | Saída                                  |
+|--------|--------------------------------|----------------------------------------|
+| cpu    | cProfile na thread do loop     | ``.pstats`` (pstats, snakeviz, gprof2dot) |
+| sample | Amostragem da pilha do loop    | ``.folded`` (flamegraph.pl, speedscope)   |
+| alloc  | tracemalloc                    | ``.txt`` (top alocações) + ``.snapshot``  |
+
+O modo ``cpu`` conta todas as chamadas (preciso, mas deixa o servidor mais
+lento); o ``sample`` lê a pilha da thread do event loop em intervalos fixos
+a partir de outra thread, com custo baixo, e é o indicado sob carga. As
+pilhas são gravadas no formato "collapsed" (``func;func;func contagem``).
+
+O ``alloc`` compara um snapshot do tracemalloc no início com outro no fim,
+então mostra o que foi alocado (e não liberado) durante a janela.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from enum import StrEnum
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+"""Intervalo entre amostras da pilha no modo ``sample`` (segundos)."""
+
+TRACEMALLOC_FRAMES = 25
+"""Profundidade das pilhas gravadas pelo tracemalloc."""
+
+TOP_ALLOCATIONS = 40
+"""Linhas com mais alocações listadas no relatório do modo ``alloc``."""
+
+TOP_FUNCTIONS = 30
+"""Funções listadas por ``print_cpu_summary``."""
+
+
+class ProfileMode(StrEnum):
+    """Modo de profiling."""
+
+    CPU = "cpu"
+    """cProfile: todas as chamadas, com tempo total e acumulado."""
+
+    SAMPLE = "sample"
+    """Amostragem da pilha: flamegraph com custo baixo."""
+
+    ALLOC = "alloc"
+    """tracemalloc: alocações por linha de código."""
+
+
+class ProfilerError(Exception):
+    """Profiler já em execução ou parado."""
+
+
+class _StackSampler:
+    """Amostra periodicamente a pilha de uma thread a partir de outra."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="amt-profiler", daemon=True)
+        self.samples = 0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """Para a amostragem e retorna as pilhas com a contagem de amostras."""
+        self._stop.set()
+        self._thread.join()
+        return self._stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self._stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+
+class Profiler:
+    """Liga e desliga um profiler em tempo de execução.
+
+    Deve ser iniciado na thread do event loop: ``cpu`` e ``sample`` medem
+    essa thread (onde rodam ``_handle_client`` e o parser).
+
+    Example:
+        ```python
+        profiler = Profiler(output_dir="perfis")
+        profiler.start(ProfileMode.SAMPLE)
+        ...
+        path = profiler.stop()  # perfis/amt-sample-20250101-120000.folded
+        ```
+    """
+
+    def __init__(
+        self,
+        output_dir: str | os.PathLike = ".",
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+    ) -> None:
+        """Inicializa o profiler.
+
+        Args:
+            output_dir: Diretório dos arquivos gerados (criado se preciso).
+            sample_interval: Intervalo entre amostras no modo ``sample``.
+        """
+        self.output_dir = Path(output_dir)
+        self._sample_interval = sample_interval
+        self._mode: ProfileMode | None = None
+        self._started_at: datetime | None = None
+        self._started = 0.0
+        self._cprofile: cProfile.Profile | None = None
+        self._sampler: _StackSampler | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+
+    @property
+    def mode(self) -> ProfileMode | None:
+        """Modo em execução (None se parado)."""
+        return self._mode
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos desde o início do profiling em execução."""
+        return time.monotonic() - self._started if self._mode else 0.0
+
+    def start(self, mode: ProfileMode | str) -> None:
+        """Inicia o profiling.
+
+        Args:
+            mode: Modo de profiling.
+
+        Raises:
+            ProfilerError: Se já há um profiling em execução.
+            ValueError: Se o modo é inválido.
+        """
+        if self._mode is not None:
+            raise ProfilerError(f"Profiling '{self._mode}' já está em execução")
+        mode = ProfileMode(mode)
+
+        if mode == ProfileMode.CPU:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif mode == ProfileMode.SAMPLE:
+            self._sampler = _StackSampler(threading.get_ident(), self._sample_interval)
+            self._sampler.start()
+        else:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._snapshot = tracemalloc.take_snapshot()
+
+        self._mode = mode
+        self._started_at = datetime.now()
+        self._started = time.monotonic()
+        logger.info(f"Profiling '{mode}' iniciado")
+
+    def stop(self) -> Path:
+        """Para o profiling e grava o resultado.
+
+        Returns:
+            Arquivo principal gerado.
+
+        Raises:
+            ProfilerError: Se não há profiling em execução.
+        """
+        if self._mode is None:
+            raise ProfilerError("Nenhum profiling em execução")
+
+        mode, elapsed = self._mode, self.elapsed
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / f"amt-{mode}-{self._started_at:%Y%m%d-%H%M%S}"
+
+        if mode == ProfileMode.CPU:
+            path = self._stop_cpu(base)
+        elif mode == ProfileMode.SAMPLE:
+            path = self._stop_sample(base)
+        else:
+            path = self._stop_alloc(base)
+
+        self._mode = None
+        logger.info(f"Profiling '{mode}' encerrado após {elapsed:.1f}s: {path}")
+        return path
+
+    def _stop_cpu(self, base: Path) -> Path:
+        """Grava as estatísticas do cProfile em ``.pstats``."""
+        self._cprofile.disable()
+        path = base.with_suffix(".pstats")
+        self._cprofile.dump_stats(path)
+        self._cprofile = None
+        return path
+
+    def _stop_sample(self, base: Path) -> Path:
+        """Grava as pilhas amostradas no formato collapsed."""
+        stacks = self._sampler.stop()
+        samples = self._sampler.samples
+        self._sampler = None
+
+        path = base.with_suffix(".folded")
+        with open(path, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.info(f"{samples} amostras, {len(stacks)} pilhas distintas")
+        return path
+
+    def _stop_alloc(self, base: Path) -> Path:
+        """Grava o snapshot e o relatório das alocações desde o início."""
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        snapshot.dump(str(base.with_suffix(".snapshot")))
+
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+        snapshot = snapshot.filter_traces(filters)
+        diff = snapshot.compare_to(self._snapshot.filter_traces(filters), "lineno")
+        top = snapshot.statistics("traceback")[:5]
+        self._snapshot = None
+
+        path = base.with_suffix(".txt")
+        with open(path, "w") as f:
+            total = sum(stat.size for stat in snapshot.statistics("filename"))
+            f.write(f"Memória rastreada no fim: {total / 1024:.1f} KiB\n\n")
+            f.write(f"Maiores diferenças desde o início (top {TOP_ALLOCATIONS}):\n")
+            for stat in diff[:TOP_ALLOCATIONS]:
+                f.write(f"  {stat}\n")
+            f.write("\nPilhas das maiores alocações:\n")
+            for stat in top:
+                f.write(f"\n  {stat.count} blocos, {stat.size / 1024:.1f} KiB\n")
+                for line in stat.traceback.format():
+                    f.write(f"    {line}\n")
+        return path
+
+
+def print_cpu_summary(path: str | os.PathLike, limit: int = TOP_FUNCTIONS) -> None:
+    """Mostra as funções com maior tempo acumulado de um ``.pstats``."""
+    stats = pstats.Stats(str(path))
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
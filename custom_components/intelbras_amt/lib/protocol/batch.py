@@ -0,0 +1,254 @@
+"""Decodificação em lote de snapshots de status arquivados.
+
+Para análises offline (frota de centrais, histórico de dias), parsear cada
+resposta de status com ``CentralStatus.parse`` em um loop Python é lento.
+Este módulo decodifica N snapshots de uma vez, usando ``np.unpackbits`` e
+máscaras vetorizadas sobre uma matriz (N, 54) ou (N, 43) de ``uint8``.
+
+Requer numpy (dependência opcional ``analytics``).
+
+Exemplo:
+    ```python
+    from custom_components.intelbras_amt.lib.protocol.batch import (
+        decode_snapshots,
+        load_snapshots,
+    )
+
+    snapshots = load_snapshots("status_2025-01-01.bin")  # memmap (N, 54)
+    batch = decode_snapshots(snapshots)
+
+    print(batch.armed.mean())            # fração do tempo armada
+    print(batch.open_zones[:, 4].sum())  # snapshots com a zona 5 aberta
+    ```
+"""
+
+from dataclasses import dataclass
+from os import PathLike
+
+import numpy as np
+
+from .commands.status import (
+    FULL_STATUS_LAYOUT,
+    FUNC_ARMED,
+    FUNC_PROBLEM,
+    FUNC_SIREN,
+    FUNC_TRIGGERED,
+    STATUS_LAYOUTS,
+    StatusLayout,
+    ZoneBitmap,
+)
+
+MAX_ZONES = 64
+"""Número de colunas das matrizes de zonas (coluna i = zona i + 1)."""
+
+MAX_PGMS = 19
+"""Número de colunas da matriz de PGMs (coluna i = PGM i + 1)."""
+
+PARTITION_NAMES = ("A", "B", "C", "D")
+"""Ordem das colunas da matriz de partições."""
+
+
+@dataclass
+class StatusBatch:
+    """Resultado colunar da decodificação de N snapshots.
+
+    Todas as matrizes têm N linhas, uma por snapshot, na mesma ordem
+    da entrada. Campos inexistentes no layout (ex: PGM 3-19 no status
+    parcial) ficam sempre False.
+    """
+
+    model: np.ndarray
+    """Modelo da central, (N,) uint8."""
+
+    firmware: np.ndarray
+    """Byte de versão do firmware (nibbles = versão), (N,) uint8."""
+
+    armed: np.ndarray
+    """Central armada, (N,) bool."""
+
+    triggered: np.ndarray
+    """Central disparada, (N,) bool."""
+
+    siren_on: np.ndarray
+    """Sirene ligada, (N,) bool."""
+
+    has_problem: np.ndarray
+    """Indicador geral de problema, (N,) bool."""
+
+    partitions_enabled: np.ndarray
+    """Central particionada, (N,) bool."""
+
+    partitions_armed: np.ndarray
+    """Partições armadas, (N, 4) bool nas colunas A, B, C, D."""
+
+    open_zones: np.ndarray
+    """Zonas abertas, (N, 64) bool."""
+
+    violated_zones: np.ndarray
+    """Zonas violadas, (N, 64) bool."""
+
+    bypassed_zones: np.ndarray
+    """Zonas em bypass, (N, 64) bool."""
+
+    tamper_zones: np.ndarray
+    """Zonas com tamper, (N, 64) bool."""
+
+    short_circuit_zones: np.ndarray
+    """Zonas em curto-circuito, (N, 64) bool."""
+
+    low_battery_zones: np.ndarray
+    """Zonas com bateria baixa, (N, 64) bool."""
+
+    pgm: np.ndarray
+    """PGMs ligadas, (N, 19) bool."""
+
+    problems: dict[str, np.ndarray]
+    """Problemas do sistema (nomes de ``SystemProblems``), cada um (N,) bool."""
+
+    def __len__(self) -> int:
+        """Número de snapshots decodificados."""
+        return len(self.model)
+
+
+def load_snapshots(
+    path: str | PathLike,
+    record_size: int = FULL_STATUS_LAYOUT.size,
+    offset: int = 0,
+) -> np.ndarray:
+    """Mapeia em memória um arquivo de snapshots empilhados.
+
+    O arquivo deve conter apenas payloads de status concatenados, todos
+    do mesmo tamanho. Nada é lido do disco até as colunas serem acessadas.
+
+    Args:
+        path: Caminho do arquivo.
+        record_size: Tamanho de cada snapshot (54 ou 43).
+        offset: Bytes a ignorar no início do arquivo (cabeçalho).
+
+    Returns:
+        Matriz (N, record_size) uint8 somente leitura.
+
+    Raises:
+        ValueError: Se o tamanho do arquivo não for múltiplo do registro.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=offset)
+    if data.size % record_size:
+        raise ValueError(
+            f"Tamanho do arquivo ({data.size} bytes) não é múltiplo de {record_size}"
+        )
+    return data.reshape(-1, record_size)
+
+
+def as_snapshot_array(snapshots: np.ndarray | bytes | bytearray, record_size: int | None = None) -> np.ndarray:
+    """Converte a entrada em uma matriz (N, tamanho) uint8.
+
+    Args:
+        snapshots: Matriz 2D, matriz 1D ou bytes com snapshots concatenados.
+        record_size: Tamanho do registro para entradas 1D (padrão: 54).
+
+    Returns:
+        Matriz 2D uint8 (sem cópia quando possível).
+
+    Raises:
+        ValueError: Se o formato não for compatível com um layout conhecido.
+    """
+    if isinstance(snapshots, (bytes, bytearray, memoryview)):
+        snapshots = np.frombuffer(snapshots, dtype=np.uint8)
+
+    data = np.asarray(snapshots, dtype=np.uint8)
+
+    if data.ndim == 1:
+        size = record_size or FULL_STATUS_LAYOUT.size
+        if data.size % size:
+            raise ValueError(f"{data.size} bytes não formam registros de {size} bytes")
+        data = data.reshape(-1, size)
+
+    if data.ndim != 2:
+        raise ValueError(f"Esperada matriz 2D de snapshots, recebido shape {data.shape}")
+
+    return data
+
+
+def _flag(data: np.ndarray, offset: int, mask: int) -> np.ndarray:
+    """Extrai um bit de todas as linhas."""
+    return (data[:, offset] & mask) != 0
+
+
+def _zone_matrix(data: np.ndarray, bitmap: ZoneBitmap) -> np.ndarray:
+    """Expande uma região de bitmask de zonas para a matriz (N, 64)."""
+    region = data[:, bitmap.offset:bitmap.offset + bitmap.length]
+    bits = np.unpackbits(region, axis=1, bitorder="little")
+
+    first = bitmap.first_zone - 1
+    last = min(bitmap.max_zone, MAX_ZONES)
+    count = last - first
+
+    zones = np.zeros((data.shape[0], MAX_ZONES), dtype=bool)
+    zones[:, first:last] = bits[:, :count]
+    return zones
+
+
+def decode_snapshots(
+    snapshots: np.ndarray | bytes | bytearray,
+    layout: StatusLayout | None = None,
+) -> StatusBatch:
+    """Decodifica N snapshots de status em arrays colunares.
+
+    Args:
+        snapshots: Matriz (N, 54) ou (N, 43) uint8, memmap ou bytes.
+        layout: Layout do payload (padrão: detectado pela largura).
+
+    Returns:
+        StatusBatch com todas as colunas decodificadas.
+
+    Raises:
+        ValueError: Se o tamanho dos snapshots não corresponder a um layout.
+    """
+    data = as_snapshot_array(snapshots, layout.size if layout else None)
+
+    if layout is None:
+        layout = STATUS_LAYOUTS.get(data.shape[1])
+        if layout is None:
+            raise ValueError(f"Tamanho de snapshot desconhecido: {data.shape[1]} bytes")
+    elif data.shape[1] != layout.size:
+        raise ValueError(
+            f"Snapshots de {data.shape[1]} bytes não correspondem ao layout de {layout.size} bytes"
+        )
+
+    rows = data.shape[0]
+    func = data[:, layout.functioning]
+
+    siren_on = (func & FUNC_SIREN) != 0
+    if layout.siren_output is not None:
+        siren_on |= _flag(data, *layout.siren_output)
+
+    partitions = np.zeros((rows, len(PARTITION_NAMES)), dtype=bool)
+    for column, name in enumerate(PARTITION_NAMES):
+        if name in layout.partitions:
+            partitions[:, column] = _flag(data, *layout.partitions[name])
+
+    pgm = np.zeros((rows, MAX_PGMS), dtype=bool)
+    for number, (offset, mask) in layout.pgm.items():
+        pgm[:, number - 1] = _flag(data, offset, mask)
+
+    return StatusBatch(
+        model=data[:, layout.model].copy(),
+        firmware=data[:, layout.firmware].copy(),
+        armed=(func & FUNC_ARMED) != 0,
+        triggered=(func & FUNC_TRIGGERED) != 0,
+        siren_on=siren_on,
+        has_problem=(func & FUNC_PROBLEM) != 0,
+        partitions_enabled=data[:, layout.partitions_enabled] == 0x01,
+        partitions_armed=partitions,
+        open_zones=_zone_matrix(data, layout.open_zones),
+        violated_zones=_zone_matrix(data, layout.violated_zones),
+        bypassed_zones=_zone_matrix(data, layout.bypassed_zones),
+        tamper_zones=_zone_matrix(data, layout.tamper_zones),
+        short_circuit_zones=_zone_matrix(data, layout.short_circuit_zones),
+        low_battery_zones=_zone_matrix(data, layout.low_battery_zones),
+        pgm=pgm,
+        problems={
+            name: _flag(data, offset, mask)
+            for name, (offset, mask) in layout.problems.items()
+        },
+    )
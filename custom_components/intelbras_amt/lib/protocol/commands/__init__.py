@@ -18,6 +18,11 @@ from .status import (
     PartitionStatus,
     PGMStatus,
     SystemProblems,
+    StatusLayout,
+    ZoneBitmap,
+    FULL_STATUS_LAYOUT,
+    PARTIAL_STATUS_LAYOUT,
+    STATUS_LAYOUTS,
 )
 from .connection import ConnectionInfo, ConnectionChannel, CONNECTION_INFO_COMMAND
 
@@ -35,6 +40,11 @@ __all__ = [
     "PartitionStatus",
     "PGMStatus",
     "SystemProblems",
+    "StatusLayout",
+    "ZoneBitmap",
+    "FULL_STATUS_LAYOUT",
+    "PARTIAL_STATUS_LAYOUT",
+    "STATUS_LAYOUTS",
     "ConnectionInfo",
     "ConnectionChannel",
     "CONNECTION_INFO_COMMAND",
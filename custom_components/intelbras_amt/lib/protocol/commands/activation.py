@@ -25,6 +25,7 @@ from typing import Self
 
 from ...const import CommandCode, PartitionCode
 from .base import Command
+from .status import STATUS_LAYOUTS
 
 
 class ActivationCommand(Command):
@@ -141,6 +142,25 @@ class ActivationCommand(Command):
         """
         return cls(password, partition=PartitionCode.STAY_MODE)
 
+    def apply_to(self, payload: bytes) -> bytes | None:
+        """Prevê o status após o arme (partição ou todas).
+        
+        Args:
+            payload: Status bruto atual (43 ou 54 bytes).
+            
+        Returns:
+            Payload previsto ou None se o efeito não é conhecido.
+        """
+        layout = STATUS_LAYOUTS.get(len(payload))
+        if layout is None or self._partition == PartitionCode.STAY_MODE:
+            # Zonas armadas no modo Stay dependem da programação da central
+            return None
+        
+        data = bytearray(payload)
+        partition = PartitionCode(self._partition).letter if self._partition else None
+        layout.set_armed(data, partition, True)
+        return bytes(data)
+
     def __repr__(self) -> str:
         partition_str = self._partition.name if self._partition else "ALL"
         return f"ActivationCommand(password='****', partition={partition_str})"
@@ -48,6 +48,20 @@ class Command(ABC):
         """
         ...
 
+    def apply_to(self, payload: bytes) -> bytes | None:
+        """Prevê o efeito do comando sobre um payload de status bruto.
+        
+        Usado para atualizar o status logo após o ACK, sem esperar uma
+        nova consulta. Subclasses que alteram o status sobrescrevem.
+        
+        Args:
+            payload: Status bruto atual (43 ou 54 bytes).
+            
+        Returns:
+            Payload previsto ou None se o efeito não é conhecido.
+        """
+        return None
+
     def build_mobile_frame(self) -> "ISECMobileFrame":
         """Constrói o frame ISECMobile para este comando.
         
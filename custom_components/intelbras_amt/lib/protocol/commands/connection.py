@@ -109,6 +109,11 @@ class ConnectionInfo:
             raw_data=bytes(data),
         )
     
+    @property
+    def identity(self) -> str:
+        """Identificador estável da central (conta + MAC parcial)."""
+        return f"{self.account}-{self.mac_suffix}"
+    
     @classmethod
     def try_parse(cls, data: bytes) -> "ConnectionInfo | None":
         """Tenta fazer o parsing, retorna None se falhar."""
@@ -24,6 +24,7 @@ from typing import Self
 
 from ...const import CommandCode, PartitionCode
 from .base import Command
+from .status import STATUS_LAYOUTS
 
 
 class DeactivationCommand(Command):
@@ -128,6 +129,24 @@ class DeactivationCommand(Command):
         """
         return cls(password, partition=PartitionCode.PARTITION_D)
 
+    def apply_to(self, payload: bytes) -> bytes | None:
+        """Prevê o status após o desarme (partição ou todas).
+        
+        Args:
+            payload: Status bruto atual (43 ou 54 bytes).
+            
+        Returns:
+            Payload previsto ou None se o efeito não é conhecido.
+        """
+        layout = STATUS_LAYOUTS.get(len(payload))
+        if layout is None or self._partition == PartitionCode.STAY_MODE:
+            return None
+        
+        data = bytearray(payload)
+        partition = PartitionCode(self._partition).letter if self._partition else None
+        layout.set_armed(data, partition, False)
+        return bytes(data)
+
     def __repr__(self) -> str:
         partition_str = self._partition.name if self._partition else "ALL"
         return f"DeactivationCommand(password='****', partition={partition_str})"
@@ -27,6 +27,7 @@ from typing import Self
 
 from ...const import CommandCode, PGMAction, PGMOutput
 from .base import Command
+from .status import STATUS_LAYOUTS, set_bit
 
 
 class PGMCommand(Command):
@@ -113,6 +114,23 @@ class PGMCommand(Command):
         """
         return cls(password, PGMAction.TURN_OFF, pgm_number)
 
+    def apply_to(self, payload: bytes) -> bytes | None:
+        """Prevê o status após ligar/desligar a PGM.
+        
+        Args:
+            payload: Status bruto atual (43 ou 54 bytes).
+            
+        Returns:
+            Payload previsto ou None se a PGM não existe no status.
+        """
+        layout = STATUS_LAYOUTS.get(len(payload))
+        if layout is None or self.output_number not in layout.pgm:
+            return None
+        
+        data = bytearray(payload)
+        set_bit(data, layout.pgm[self.output_number], self._action == PGMAction.TURN_ON)
+        return bytes(data)
+
     def __repr__(self) -> str:
         action_str = "ON" if self._action == PGMAction.TURN_ON else "OFF"
         return f"PGMCommand(password='****', action={action_str}, pgm={self.output_number})"
@@ -22,6 +22,7 @@ from typing import Self
 
 from ...const import CommandCode
 from .base import Command
+from .status import STATUS_LAYOUTS
 
 
 class SirenCommand(Command):
@@ -90,6 +91,23 @@ class SirenCommand(Command):
         """
         return cls(password, turn_on=False)
 
+    def apply_to(self, payload: bytes) -> bytes | None:
+        """Prevê o status após ligar/desligar a sirene.
+        
+        Args:
+            payload: Status bruto atual (43 ou 54 bytes).
+            
+        Returns:
+            Payload previsto ou None se o tamanho for desconhecido.
+        """
+        layout = STATUS_LAYOUTS.get(len(payload))
+        if layout is None:
+            return None
+        
+        data = bytearray(payload)
+        layout.set_siren(data, self._turn_on)
+        return bytes(data)
+
     def __repr__(self) -> str:
         action_str = "ON" if self._turn_on else "OFF"
         return f"SirenCommand(password='****', action={action_str})"
@@ -251,6 +251,265 @@ class SystemProblems:
         ])
 
 
+# =============================================================================
+# Layout dos payloads de status
+# =============================================================================
+
+FUNC_ARMED = 0x08
+"""Bit de central armada no byte de funcionamento."""
+
+FUNC_TRIGGERED = 0x44
+"""Bits de disparo no byte de funcionamento."""
+
+FUNC_SIREN = 0x02
+"""Bit de sirene ligada no byte de funcionamento."""
+
+FUNC_PROBLEM = 0x11
+"""Bits de problema no byte de funcionamento."""
+
+
+def set_bit(payload: bytearray, position: tuple[int, int] | None, on: bool) -> None:
+    """Liga ou desliga um bit do payload (ignora posições inexistentes).
+    
+    Args:
+        payload: Payload de status a alterar.
+        position: Tupla (offset, máscara) ou None.
+        on: Estado desejado do bit.
+    """
+    if position is None:
+        return
+    offset, mask = position
+    if on:
+        payload[offset] |= mask
+    else:
+        payload[offset] &= ~mask & 0xFF
+
+
+@dataclass(frozen=True)
+class ZoneBitmap:
+    """Região de bitmask de zonas dentro do payload de status.
+    
+    Cada byte representa 8 zonas, do bit 0 (menor zona) ao bit 7.
+    """
+    
+    offset: int
+    """Posição do primeiro byte no payload."""
+    
+    length: int
+    """Quantidade de bytes da região."""
+    
+    first_zone: int = 1
+    """Zona representada pelo bit 0 do primeiro byte."""
+    
+    last_zone: int | None = None
+    """Última zona válida (None = todos os bits da região)."""
+    
+    @property
+    def max_zone(self) -> int:
+        """Última zona representada na região."""
+        region_end = self.first_zone + self.length * 8 - 1
+        if self.last_zone is not None:
+            return min(self.last_zone, region_end)
+        return region_end
+    
+    def bit(self, zone: int) -> tuple[int, int] | None:
+        """Retorna a posição (byte, máscara) de uma zona.
+        
+        Args:
+            zone: Número da zona.
+            
+        Returns:
+            Tupla (offset do byte, máscara do bit) ou None se a zona
+            não existir nesta região.
+        """
+        if zone < self.first_zone or zone > self.max_zone:
+            return None
+        index = zone - self.first_zone
+        return self.offset + index // 8, 1 << (index % 8)
+    
+    def mask(self, payload: bytes) -> int:
+        """Lê a região inteira como um número (bit i = zona i + 1).
+        
+        Args:
+            payload: Payload de status bruto.
+            
+        Returns:
+            Bitmask das zonas ativas.
+        """
+        value = int.from_bytes(payload[self.offset:self.offset + self.length], "little")
+        count = self.max_zone - self.first_zone + 1
+        return (value & ((1 << count) - 1)) << (self.first_zone - 1)
+
+
+@dataclass(frozen=True)
+class StatusLayout:
+    """Posição de cada campo dentro de um payload de status.
+    
+    Espelha os offsets usados por ``CentralStatus.parse`` (54 bytes) e
+    ``PartialCentralStatus.parse`` (43 bytes), permitindo ler ou alterar
+    campos diretamente nos bytes brutos.
+    """
+    
+    size: int
+    """Tamanho do payload em bytes."""
+    
+    open_zones: ZoneBitmap
+    violated_zones: ZoneBitmap
+    bypassed_zones: ZoneBitmap
+    tamper_zones: ZoneBitmap
+    short_circuit_zones: ZoneBitmap
+    low_battery_zones: ZoneBitmap
+    
+    model: int
+    """Offset do byte de modelo."""
+    
+    firmware: int
+    """Offset do byte de versão do firmware."""
+    
+    partitions_enabled: int
+    """Offset do byte de partição habilitada."""
+    
+    functioning: int
+    """Offset do byte de funcionamento (armada, disparo, sirene, problema)."""
+    
+    partitions: dict[str, tuple[int, int]]
+    """Partição ('A'-'D') -> (offset, máscara)."""
+    
+    problems: dict[str, tuple[int, int]]
+    """Atributo de ``SystemProblems`` -> (offset, máscara)."""
+    
+    pgm: dict[int, tuple[int, int]]
+    """Número da PGM -> (offset, máscara)."""
+    
+    siren_output: tuple[int, int] | None = None
+    """Bit adicional de sirene ligada (apenas no status parcial)."""
+    
+    @property
+    def triggered(self) -> tuple[int, int]:
+        """Bits de disparo (offset, máscara) no byte de funcionamento."""
+        return self.functioning, FUNC_TRIGGERED
+    
+    def zone_bitmap(self, zone_type: str) -> ZoneBitmap:
+        """Retorna a região de zonas pelo nome do atributo de ``ZoneStatus``.
+        
+        Args:
+            zone_type: Nome do atributo (ex: 'open_zones').
+            
+        Returns:
+            Região de bitmask correspondente.
+        """
+        return getattr(self, zone_type)
+    
+    def set_armed(self, payload: bytearray, partition: str | None, armed: bool) -> None:
+        """Arma ou desarma uma partição (ou todas) no payload.
+        
+        Atualiza também o bit de central armada. Desarmar interrompe o
+        disparo e a sirene, como faz a central.
+        
+        Args:
+            payload: Payload de status a alterar.
+            partition: Letra da partição ('A'-'D') ou None para todas.
+            armed: True para armar, False para desarmar.
+        """
+        if (
+            partition in self.partitions
+            and payload[self.partitions_enabled] == 0x01
+        ):
+            set_bit(payload, self.partitions[partition], armed)
+            any_armed = any(
+                payload[offset] & mask for offset, mask in self.partitions.values()
+            )
+        else:
+            for position in self.partitions.values():
+                set_bit(payload, position, armed)
+            any_armed = armed
+        
+        set_bit(payload, (self.functioning, FUNC_ARMED), any_armed)
+        if not armed:
+            set_bit(payload, self.triggered, False)
+            self.set_siren(payload, False)
+    
+    def set_siren(self, payload: bytearray, on: bool) -> None:
+        """Liga ou desliga a sirene no payload.
+        
+        Args:
+            payload: Payload de status a alterar.
+            on: Estado da sirene.
+        """
+        set_bit(payload, (self.functioning, FUNC_SIREN), on)
+        set_bit(payload, self.siren_output, on)
+
+
+FULL_STATUS_LAYOUT = StatusLayout(
+    size=54,
+    open_zones=ZoneBitmap(offset=0, length=8),
+    violated_zones=ZoneBitmap(offset=8, length=8),
+    bypassed_zones=ZoneBitmap(offset=16, length=8),
+    tamper_zones=ZoneBitmap(offset=43, length=1),
+    short_circuit_zones=ZoneBitmap(offset=44, length=1),
+    low_battery_zones=ZoneBitmap(offset=46, length=6, first_zone=17),
+    model=24,
+    firmware=25,
+    partitions_enabled=26,
+    functioning=29,
+    partitions={"A": (27, 0x01), "B": (27, 0x02), "C": (28, 0x01), "D": (28, 0x02)},
+    problems={
+        "ac_failure": (35, 0x01),
+        "low_battery": (35, 0x02),
+        "battery_absent": (35, 0x04),
+        "battery_short": (35, 0x08),
+        "aux_overload": (35, 0x10),
+        "siren_wire_cut": (42, 0x01),
+        "siren_short": (42, 0x02),
+        "phone_line_cut": (42, 0x04),
+        "event_comm_failure": (42, 0x08),
+    },
+    pgm={
+        1: (45, 0x40),
+        2: (45, 0x20),
+        3: (45, 0x10),
+        **{4 + i: (52, 1 << i) for i in range(8)},
+        **{12 + i: (53, 1 << i) for i in range(8)},
+    },
+)
+"""Layout do status completo (comando 0x5B, 54 bytes)."""
+
+PARTIAL_STATUS_LAYOUT = StatusLayout(
+    size=43,
+    open_zones=ZoneBitmap(offset=0, length=6),
+    violated_zones=ZoneBitmap(offset=6, length=6),
+    bypassed_zones=ZoneBitmap(offset=12, length=6),
+    tamper_zones=ZoneBitmap(offset=33, length=2, last_zone=18),
+    short_circuit_zones=ZoneBitmap(offset=35, length=2, last_zone=18),
+    low_battery_zones=ZoneBitmap(offset=38, length=5, last_zone=40),
+    model=18,
+    firmware=19,
+    partitions_enabled=20,
+    functioning=22,
+    partitions={"A": (21, 0x01), "B": (21, 0x02)},
+    problems={
+        "ac_failure": (28, 0x01),
+        "low_battery": (28, 0x02),
+        "battery_absent": (28, 0x04),
+        "battery_short": (28, 0x08),
+        "aux_overload": (28, 0x10),
+        "siren_wire_cut": (32, 0x01),
+        "siren_short": (32, 0x02),
+        "phone_line_cut": (32, 0x04),
+        "event_comm_failure": (32, 0x08),
+    },
+    pgm={1: (37, 0x40), 2: (37, 0x20)},
+    siren_output=(37, 0x04),
+)
+"""Layout do status parcial (comando 0x5A, 43 bytes)."""
+
+STATUS_LAYOUTS: dict[int, StatusLayout] = {
+    FULL_STATUS_LAYOUT.size: FULL_STATUS_LAYOUT,
+    PARTIAL_STATUS_LAYOUT.size: PARTIAL_STATUS_LAYOUT,
+}
+"""Layouts indexados pelo tamanho do payload."""
+
+
 @dataclass
 class CentralStatus:
     """Status completo da central de alarme.
@@ -0,0 +1,249 @@
+"""Eventos Contact-ID enviados espontaneamente pela central (0xB0).
+
+Além de responder aos comandos, a central envia eventos (disparos,
+arme/desarme, falhas) assim que eles acontecem. Cada evento segue o
+padrão Contact-ID e precisa ser confirmado com um ACK simples (0xFE).
+
+Estrutura do conteúdo (um dígito por byte):
+| Campo     | Dígitos | Descrição                                   |
+|-----------|---------|---------------------------------------------|
+| Conta     | 4       | Número da conta                             |
+| MT        | 2       | Tipo de mensagem ("18"), opcional           |
+| Q         | 1       | Qualificador: 1=novo/abertura, 3=restauro   |
+| Evento    | 3       | Código Contact-ID (ex: 130 = disparo)       |
+| Partição  | 2       | Partição (00 = todas, 01-04 = A-D)          |
+| Zona      | 3       | Zona ou usuário                             |
+| Checksum  | 1       | Dígito verificador Contact-ID, opcional     |
+
+Os dígitos podem vir em ASCII (0x30-0x39) ou como valores 0-9, com 0x0A
+representando o dígito 0 (convenção Contact-ID).
+
+Exemplo:
+    01 02 03 04 01 01 03 00 00 01 00 00 05
+    - Conta: 1234
+    - Qualificador: 1 (novo evento)
+    - Evento: 130 (disparo de zona)
+    - Partição: 01 (A)
+    - Zona: 005
+"""
+
+from dataclasses import dataclass
+from typing import Self
+
+from ..const import ISECNET_COMMAND_EVENT
+from .commands.status import STATUS_LAYOUTS, set_bit
+
+
+EVENT_COMMAND = ISECNET_COMMAND_EVENT
+"""Comando ISECNet dos eventos (0xB0)."""
+
+QUALIFIER_NEW = 1
+"""Novo evento ou abertura (desarme)."""
+
+QUALIFIER_RESTORE = 3
+"""Restauração ou fechamento (arme)."""
+
+QUALIFIER_STATUS = 6
+"""Status anterior ainda presente."""
+
+EVENT_PERIODIC_TEST = 602
+"""Teste periódico (não altera o status)."""
+
+PARTITION_LETTERS = {1: "A", 2: "B", 3: "C", 4: "D"}
+"""Número da partição no evento -> letra usada no status."""
+
+PROBLEM_EVENTS: dict[int, str] = {
+    301: "ac_failure",
+    302: "low_battery",
+    309: "battery_short",
+    311: "battery_absent",
+    312: "aux_overload",
+    321: "siren_wire_cut",
+    351: "phone_line_cut",
+    354: "event_comm_failure",
+}
+"""Eventos de falha -> atributo de ``SystemProblems``."""
+
+ZONE_TROUBLE_EVENTS: dict[int, str] = {
+    144: "tamper_zones",
+    145: "tamper_zones",
+    383: "tamper_zones",
+    372: "short_circuit_zones",
+    384: "low_battery_zones",
+}
+"""Eventos de problema em zona -> atributo de ``ZoneStatus``."""
+
+BYPASS_EVENTS = {570, 573}
+"""Eventos de anulação (bypass) de zona."""
+
+ZONE_ALARM_EVENTS = frozenset([*range(110, 119), *range(130, 140), *range(150, 160)])
+"""Disparos de zona (incêndio, intrusão, 24h não-intrusão): o campo zona é a zona.
+
+Nos demais disparos (ex.: pânico e coação, 120-122) o campo traz o
+usuário, então o evento não indica zona violada.
+"""
+
+
+def _digit(value: int) -> int:
+    """Converte um byte do evento em dígito."""
+    if 0x30 <= value <= 0x39:
+        return value - 0x30
+    if value == 0x0A:
+        return 0
+    if value <= 0x09:
+        return value
+    raise ValueError(f"Dígito inválido no evento: 0x{value:02X}")
+
+
+def _number(digits: list[int]) -> int:
+    """Junta uma lista de dígitos em um número."""
+    result = 0
+    for digit in digits:
+        result = result * 10 + digit
+    return result
+
+
+@dataclass
+class PanelEvent:
+    """Evento Contact-ID recebido da central.
+
+    Attributes:
+        account: Número da conta (4 dígitos).
+        qualifier: Qualificador (1 = novo, 3 = restauro, 6 = status).
+        code: Código do evento Contact-ID (3 dígitos).
+        partition: Partição (0 = todas/sem partição).
+        zone: Zona ou usuário.
+        raw_data: Conteúdo bruto do frame.
+    """
+
+    account: str
+    qualifier: int
+    code: int
+    partition: int
+    zone: int
+    raw_data: bytes
+
+    @classmethod
+    def parse(cls, data: bytes | bytearray) -> Self:
+        """Faz o parsing do conteúdo de um frame 0xB0.
+
+        Args:
+            data: Conteúdo do frame (13, 15 ou 16 dígitos).
+
+        Returns:
+            Evento parseado.
+
+        Raises:
+            ValueError: Se o conteúdo não for um evento válido.
+        """
+        digits = [_digit(value) for value in data]
+
+        if len(digits) == 16:
+            # Com MT e dígito verificador
+            digits = digits[:4] + digits[6:15]
+        elif len(digits) == 15:
+            # Com MT
+            digits = digits[:4] + digits[6:]
+        elif len(digits) != 13:
+            raise ValueError(f"Evento deve ter 13, 15 ou 16 dígitos, recebido {len(digits)}")
+
+        return cls(
+            account="".join(str(d) for d in digits[0:4]),
+            qualifier=digits[4],
+            code=_number(digits[5:8]),
+            partition=_number(digits[8:10]),
+            zone=_number(digits[10:13]),
+            raw_data=bytes(data),
+        )
+
+    @classmethod
+    def try_parse(cls, data: bytes | bytearray) -> Self | None:
+        """Tenta fazer o parsing, retorna None se falhar."""
+        try:
+            return cls.parse(data)
+        except ValueError:
+            return None
+
+    @property
+    def is_restore(self) -> bool:
+        """Se é um evento de restauração (ou fechamento/arme)."""
+        return self.qualifier == QUALIFIER_RESTORE
+
+    @property
+    def is_alarm(self) -> bool:
+        """Se é um evento de disparo (códigos 1xx)."""
+        return 100 <= self.code < 200 and self.code not in ZONE_TROUBLE_EVENTS
+
+    @property
+    def is_zone_alarm(self) -> bool:
+        """Se é um disparo de zona (o campo zona é a zona violada)."""
+        return self.code in ZONE_ALARM_EVENTS
+
+    @property
+    def is_arming(self) -> bool:
+        """Se é um evento de arme/desarme (códigos 40x e 441)."""
+        return 400 <= self.code < 410 or self.code == 441
+
+    @property
+    def affects_status(self) -> bool:
+        """Se o evento indica mudança no status da central."""
+        return self.code != EVENT_PERIODIC_TEST and self.qualifier != QUALIFIER_STATUS
+
+    def apply_to(self, payload: bytes) -> bytes | None:
+        """Aplica o efeito do evento sobre um payload de status bruto.
+
+        Permite atualizar o status em memória sem uma nova consulta
+        0x5A/0x5B.
+
+        Args:
+            payload: Status bruto atual (43 ou 54 bytes).
+
+        Returns:
+            Novo payload com o evento aplicado, ou None se o evento não
+            tem efeito conhecido (é preciso consultar o status). O
+            restauro de um disparo também retorna None: a zona volta ao
+            normal, mas o disparo continua até o desarme ou o fim do tempo
+            de sirene, o que só a consulta mostra. Disparos que não são de
+            zona (pânico, coação) também: o campo zona traz o usuário e a
+            coação é silenciosa.
+        """
+        layout = STATUS_LAYOUTS.get(len(payload))
+        if layout is None:
+            return None
+
+        data = bytearray(payload)
+        active = not self.is_restore
+
+        if self.is_alarm:
+            # Disparo de zona é zona violada, não aberta
+            if not active or not self.is_zone_alarm:
+                return None
+            set_bit(data, layout.violated_zones.bit(self.zone), True)
+            set_bit(data, layout.triggered, True)
+
+        elif self.code in ZONE_TROUBLE_EVENTS:
+            bitmap = layout.zone_bitmap(ZONE_TROUBLE_EVENTS[self.code])
+            set_bit(data, bitmap.bit(self.zone), active)
+
+        elif self.code in BYPASS_EVENTS:
+            set_bit(data, layout.bypassed_zones.bit(self.zone), active)
+
+        elif self.code in PROBLEM_EVENTS:
+            set_bit(data, layout.problems.get(PROBLEM_EVENTS[self.code]), active)
+
+        elif self.is_arming:
+            # Abertura (qualificador 1) = desarme, fechamento (3) = arme
+            layout.set_armed(data, PARTITION_LETTERS.get(self.partition), self.is_restore)
+
+        else:
+            return None
+
+        return bytes(data)
+
+    def __repr__(self) -> str:
+        kind = "R" if self.is_restore else "E"
+        return (
+            f"PanelEvent(account='{self.account}', event={kind}{self.code:03d}, "
+            f"partition={self.partition:02d}, zone={self.zone:03d})"
+        )
+
@@ -21,7 +21,12 @@ Exemplo da documentação:
 from dataclasses import dataclass
 from typing import Self
 
-from ..const import ISECNET_COMMAND_MOBILE, ISECNET_COMMAND_HEARTBEAT, ResponseCode
+from ..const import (
+    FRAME_BUFFER_LIMIT,
+    ISECNET_COMMAND_MOBILE,
+    ISECNET_COMMAND_HEARTBEAT,
+    ResponseCode,
+)
 from .checksum import Checksum
 
 
@@ -188,9 +193,17 @@ class ISECNetFrameReader:
     frames podem chegar ou frames podem chegar parcialmente.
     """
 
-    def __init__(self) -> None:
-        """Inicializa o leitor."""
+    def __init__(self, max_buffer: int = FRAME_BUFFER_LIMIT) -> None:
+        """Inicializa o leitor.
+        
+        Args:
+            max_buffer: Máximo de bytes sem frame completo mantidos entre
+                chamadas de ``feed`` (o excesso mais antigo é descartado).
+        """
         self._buffer = bytearray()
+        self._max_buffer = max_buffer
+        self.discarded_bytes = 0
+        """Bytes descartados por exceder ``max_buffer``."""
 
     def feed(self, data: bytes | bytearray) -> list[ISECNetFrame]:
         """Alimenta dados ao buffer e retorna frames completos.
@@ -207,6 +220,11 @@ class ISECNetFrameReader:
         while self._try_extract_frame(frames):
             pass
         
+        excess = len(self._buffer) - self._max_buffer
+        if excess > 0:
+            del self._buffer[:excess]
+            self.discarded_bytes += excess
+        
         return frames
 
     def _try_extract_frame(self, frames: list[ISECNetFrame]) -> bool:
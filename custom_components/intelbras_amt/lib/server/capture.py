@@ -0,0 +1,375 @@
+"""Captura binária do tráfego das conexões do servidor.
+
+Grava cada pedaço de bytes recebido ou enviado, por conexão, com
+timestamp monotônico, para reproduzir offline problemas vistos em campo
+(``replay``) e medir o parser com tráfego real.
+
+Formato do arquivo:
+| Campo       | Bytes | Descrição                                   |
+|-------------|-------|---------------------------------------------|
+| Magic       | 8     | b"AMTCAP01"                                 |
+| Início      | 8     | Epoch em segundos do início (float64)       |
+| Registros   | ...   | Registros em ordem cronológica              |
+
+Formato de cada registro (little-endian):
+| Campo       | Bytes | Descrição                                   |
+|-------------|-------|---------------------------------------------|
+| Tipo        | 1     | ``CaptureRecordType``                       |
+| Conexão     | 4     | Número da conexão na captura                |
+| Timestamp   | 8     | Nanossegundos desde o início (monotônico)   |
+| Tamanho     | 2     | Bytes de dados                              |
+| Dados       | N     | Bytes recebidos/enviados, ou o ID (abertura) |
+
+Os pedaços são gravados como lidos do socket (sem separar frames), então
+a fragmentação original é preservada no replay. Nos comandos enviados
+(ISECMobile), os dígitos da senha são trocados por ``*`` antes da
+gravação (``mask_password``); o checksum é recalculado.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from struct import Struct
+from typing import Iterator
+
+from ..const import (
+    ISECMOBILE_FRAME_DELIMITER,
+    ISECMOBILE_PASSWORD_MAX_LEN,
+    ISECNET_COMMAND_MOBILE,
+)
+from ..protocol.checksum import Checksum
+
+
+logger = logging.getLogger(__name__)
+
+
+CAPTURE_MAGIC = b"AMTCAP01"
+"""Identificador do início do arquivo de captura."""
+
+CAPTURE_HEADER = Struct("<8sd")
+"""Cabeçalho: magic + epoch do início da captura."""
+
+RECORD_HEADER = Struct("<BIQH")
+"""Cabeçalho do registro: tipo + conexão + timestamp (ns) + tamanho."""
+
+MAX_CHUNK = 0xFFFF
+"""Maior pedaço de dados em um registro (pedaços maiores são divididos)."""
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+"""Intervalo máximo em segundos entre gravações em disco."""
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+"""Bytes pendentes que forçam uma gravação imediata."""
+
+DEFAULT_MAX_PENDING = 16 * 1024 * 1024
+"""Bytes pendentes em memória antes de começar a descartar registros."""
+
+PASSWORD_MASK = ord("*")
+"""Byte gravado no lugar de cada dígito da senha."""
+
+PASSWORD_OFFSET = 3
+"""Posição da senha no frame ISECNet (tamanho, 0xE9, início ISECMobile)."""
+
+
+class CaptureError(Exception):
+    """Arquivo de captura inválido ou truncado."""
+
+
+def mask_password(data: bytes) -> bytes:
+    """Troca os dígitos da senha de um comando ISECMobile por ``*``.
+
+    A senha são os dígitos ASCII logo após o início do frame ISECMobile
+    (os códigos de comando começam em 0x41). O checksum é recalculado,
+    então o frame continua válido para o parser.
+
+    Args:
+        data: Frame ISECNet enviado para a central.
+
+    Returns:
+        Frame com a senha mascarada, ou ``data`` se não é um comando ISECMobile.
+
+    Example:
+        >>> mask_password(bytes.fromhex("08 E9 21 31 32 33 34 41 21 5B")).hex(" ")
+        '08 e9 21 2a 2a 2a 2a 41 21 5f'
+    """
+    if (
+        len(data) <= PASSWORD_OFFSET + 2
+        or data[1] != ISECNET_COMMAND_MOBILE
+        or data[2] != ISECMOBILE_FRAME_DELIMITER
+    ):
+        return data
+    end = PASSWORD_OFFSET
+    limit = min(PASSWORD_OFFSET + ISECMOBILE_PASSWORD_MAX_LEN, len(data) - 2)
+    while end < limit and 0x30 <= data[end] <= 0x39:
+        end += 1
+    if end == PASSWORD_OFFSET:
+        return data
+    masked = bytearray(data[:-1])
+    masked[PASSWORD_OFFSET:end] = bytes([PASSWORD_MASK]) * (end - PASSWORD_OFFSET)
+    return Checksum.append(masked)
+
+
+class CaptureRecordType(IntEnum):
+    """Tipo de registro da captura."""
+
+    OPEN = 1
+    """Conexão aberta (dados = ID da conexão, "IP:porta")."""
+
+    INBOUND = 2
+    """Bytes recebidos da central."""
+
+    OUTBOUND = 3
+    """Bytes enviados para a central."""
+
+    CLOSE = 4
+    """Conexão encerrada (sem dados)."""
+
+
+@dataclass(frozen=True)
+class CaptureRecord:
+    """Um registro lido da captura."""
+
+    type: CaptureRecordType
+    connection: int
+    """Número da conexão na captura (ordem de abertura)."""
+
+    timestamp: float
+    """Segundos desde o início da captura."""
+
+    data: bytes
+
+
+class CaptureWriter:
+    """Grava registros no arquivo de captura.
+
+    Operações de arquivo bloqueantes; em código asyncio use
+    ``CaptureRecorder``, que grava em lote num executor.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Abre (trunca) o arquivo e grava o cabeçalho.
+
+        Args:
+            path: Caminho do arquivo de captura (diretório criado se preciso).
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._file.write(CAPTURE_HEADER.pack(CAPTURE_MAGIC, time.time()))
+        self._file.flush()
+
+    def write(self, data: bytes) -> None:
+        """Grava registros já serializados."""
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Fecha o arquivo."""
+        if not self._file.closed:
+            self._file.close()
+
+
+class CaptureRecorder:
+    """Serializa os registros em memória e grava em lote, em background.
+
+    ``open``/``inbound``/``outbound``/``close`` só acrescentam bytes a um
+    buffer (não bloqueiam o event loop); uma task grava o buffer num
+    executor a cada ``flush_interval`` segundos ou quando ele passa de
+    ``buffer_size`` bytes.
+
+    Example:
+        ```python
+        recorder = CaptureRecorder(CaptureWriter("trafego.amtcap"))
+        recorder.start()
+        number = recorder.open("192.168.1.50:40000")
+        recorder.inbound(number, data)
+        await recorder.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        writer: CaptureWriter,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """Inicializa o recorder.
+
+        Args:
+            writer: Writer do arquivo de captura.
+            flush_interval: Intervalo máximo entre gravações (segundos).
+            buffer_size: Bytes pendentes que forçam uma gravação imediata.
+            max_pending: Bytes pendentes antes de descartar novos registros.
+        """
+        self._writer = writer
+        self._flush_interval = flush_interval
+        self._buffer_size = buffer_size
+        self._max_pending = max_pending
+        self._buffer = bytearray()
+        self._started = time.monotonic_ns()
+        self._next_connection = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.records = 0
+        """Registros capturados."""
+        self.dropped = 0
+        """Registros descartados por buffer cheio."""
+
+    @property
+    def path(self) -> Path:
+        """Arquivo de captura."""
+        return self._writer.path
+
+    def start(self) -> None:
+        """Inicia a task de gravação."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Grava o buffer pendente e fecha o arquivo."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self._flush()
+        await asyncio.get_running_loop().run_in_executor(None, self._writer.close)
+        logger.info(
+            f"Captura encerrada: {self.records} registros em {self.path} "
+            f"({self.dropped} descartados)"
+        )
+
+    def open(self, connection_id: str) -> int:
+        """Registra uma nova conexão.
+
+        Args:
+            connection_id: ID da conexão ("IP:porta").
+
+        Returns:
+            Número da conexão, usado nos demais registros.
+        """
+        number = self._next_connection
+        self._next_connection += 1
+        self._append(CaptureRecordType.OPEN, number, connection_id.encode())
+        return number
+
+    def inbound(self, connection: int, data: bytes) -> None:
+        """Registra bytes recebidos da central."""
+        self._append(CaptureRecordType.INBOUND, connection, data)
+
+    def outbound(self, connection: int, data: bytes) -> None:
+        """Registra bytes enviados para a central (com a senha mascarada)."""
+        self._append(CaptureRecordType.OUTBOUND, connection, mask_password(data))
+
+    def close(self, connection: int) -> None:
+        """Registra o encerramento de uma conexão."""
+        self._append(CaptureRecordType.CLOSE, connection, b"")
+
+    def _append(self, record_type: CaptureRecordType, connection: int, data: bytes) -> None:
+        """Serializa um registro no buffer."""
+        if len(self._buffer) >= self._max_pending:
+            self.dropped += 1
+            return
+
+        timestamp = time.monotonic_ns() - self._started
+        for start in range(0, max(len(data), 1), MAX_CHUNK):
+            chunk = data[start:start + MAX_CHUNK]
+            self._buffer += RECORD_HEADER.pack(record_type, connection, timestamp, len(chunk))
+            self._buffer += chunk
+            self.records += 1
+
+        if len(self._buffer) >= self._buffer_size:
+            self._wakeup.set()
+
+    async def _flush(self) -> None:
+        """Grava o buffer pendente no executor."""
+        if not self._buffer:
+            return
+        data, self._buffer = bytes(self._buffer), bytearray()
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._writer.write, data)
+        except OSError as e:
+            logger.error(f"Erro ao gravar captura em {self.path}: {e}")
+
+    async def _run(self) -> None:
+        """Loop de gravação periódica."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self._flush()
+
+
+class CaptureReader:
+    """Lê um arquivo de captura registro a registro.
+
+    Example:
+        ```python
+        reader = CaptureReader("trafego.amtcap")
+        for record in reader:
+            if record.type == CaptureRecordType.INBOUND:
+                frames = frame_reader.feed(record.data)
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Abre a captura e valida o cabeçalho.
+
+        Args:
+            path: Caminho do arquivo de captura.
+
+        Raises:
+            CaptureError: Se o arquivo não é uma captura.
+        """
+        self.path = Path(path)
+        self._data = self.path.read_bytes()
+        if len(self._data) < CAPTURE_HEADER.size:
+            raise CaptureError(f"Arquivo de captura truncado: {self.path}")
+
+        magic, self.started_at = CAPTURE_HEADER.unpack_from(self._data, 0)
+        if magic != CAPTURE_MAGIC:
+            raise CaptureError(f"Arquivo não é uma captura AMT: {self.path}")
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        """Itera os registros em ordem cronológica.
+
+        Um registro truncado no fim (servidor encerrado no meio de uma
+        gravação) é ignorado com um aviso.
+
+        Raises:
+            CaptureError: Se um registro tem tipo desconhecido.
+        """
+        data = self._data
+        offset = CAPTURE_HEADER.size
+        while offset < len(data):
+            if offset + RECORD_HEADER.size > len(data):
+                logger.warning(f"Registro truncado no fim de {self.path.name}")
+                return
+            record_type, connection, timestamp, length = RECORD_HEADER.unpack_from(data, offset)
+            offset += RECORD_HEADER.size
+            if offset + length > len(data):
+                logger.warning(f"Registro truncado no fim de {self.path.name}")
+                return
+            try:
+                record_type = CaptureRecordType(record_type)
+            except ValueError:
+                raise CaptureError(
+                    f"Registro inválido (tipo {record_type}) na posição {offset} de {self.path.name}"
+                ) from None
+            yield CaptureRecord(
+                type=record_type,
+                connection=connection,
+                timestamp=timestamp / 1e9,
+                data=data[offset:offset + length],
+            )
+            offset += length
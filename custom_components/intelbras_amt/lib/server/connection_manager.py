@@ -6,14 +6,21 @@ enviar comandos para centrais específicas ou todas ao mesmo tempo.
 
 import asyncio
 import logging
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from ..protocol.isecnet import ISECNetFrameReader
+
 
 logger = logging.getLogger(__name__)
 
 
+PENDING_COMMAND_SIZE = 1024
+"""Estimativa de bytes de um comando na fila (task, future e frame)."""
+
+
 @dataclass
 class AMTConnection:
     """Representa uma conexão com uma central AMT.
@@ -26,6 +33,9 @@ class AMTConnection:
         connected_at: Timestamp da conexão.
         pending_response: Future aguardando resposta.
         metadata: Dados adicionais da conexão.
+        command_lock: Garante um comando por vez na conexão (fila de comandos).
+        queued_commands: Comandos enviados ou aguardando a vez na fila.
+        frame_reader: Leitor de frames dos bytes recebidos da conexão.
     """
     
     id: str
@@ -35,6 +45,9 @@ class AMTConnection:
     connected_at: datetime = field(default_factory=datetime.now)
     pending_response: asyncio.Future | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    command_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    queued_commands: int = 0
+    frame_reader: ISECNetFrameReader = field(default_factory=ISECNetFrameReader, repr=False)
 
     @property
     def host(self) -> str:
@@ -51,6 +64,36 @@ class AMTConnection:
         """Verifica se a conexão está ativa."""
         return not self.writer.is_closing()
 
+    def memory_usage(self) -> dict[str, int]:
+        """Estima os bytes mantidos em memória pela conexão.
+        
+        Soma os buffers de leitura (asyncio e ``frame_reader``), a fila de
+        escrita do transporte, os metadados e os comandos na fila. É uma
+        estimativa: objetos compartilhados e o próprio socket não entram.
+        
+        Returns:
+            Bytes por item (``reader_buffer``, ``frame_buffer``,
+            ``write_buffer``, ``metadata``, ``pending``) e o ``total``.
+        """
+        reader_buffer = getattr(self.reader, "_buffer", None)
+        transport = getattr(self.writer, "transport", None)
+        usage = {
+            "reader_buffer": len(reader_buffer) if reader_buffer is not None else 0,
+            "frame_buffer": self.frame_reader.pending_bytes,
+            "write_buffer": (
+                transport.get_write_buffer_size()
+                if transport is not None and not transport.is_closing()
+                else 0
+            ),
+            "metadata": sys.getsizeof(self.metadata) + sum(
+                sys.getsizeof(key) + sys.getsizeof(value)
+                for key, value in self.metadata.items()
+            ),
+            "pending": self.queued_commands * PENDING_COMMAND_SIZE,
+        }
+        usage["total"] = sum(usage.values())
+        return usage
+
     async def close(self) -> None:
         """Fecha a conexão."""
         if not self.writer.is_closing():
@@ -147,6 +190,36 @@ class ConnectionManager:
                 return connection
         return None
 
+    def select(self, selector: str) -> list[AMTConnection]:
+        """Busca as conexões que correspondem a um seletor.
+
+        O seletor é ``all`` (todas as conexões) ou uma lista separada por
+        vírgulas de IDs de conexão, IPs, contas, finais de MAC (com ou sem
+        ``:``) ou identidades ``conta-MAC``. Conta e MAC só existem depois
+        da identificação da central (0x94). Maiúsculas e minúsculas são
+        equivalentes.
+
+        Args:
+            selector: Seletor (ex: ``all``, ``1234``, ``AA:BB:CC``, ``1234,5678``).
+
+        Returns:
+            Conexões encontradas, na ordem em que conectaram.
+        """
+        terms = {term.strip().lower() for term in selector.split(",") if term.strip()}
+        if "all" in terms:
+            return list(self._connections.values())
+
+        selected = []
+        for connection in self._connections.values():
+            keys = {connection.id, connection.host}
+            info = connection.metadata.get("connection_info")
+            if info:
+                mac_suffix = info.mac_suffix.lower()
+                keys |= {info.account.lower(), mac_suffix, mac_suffix.replace(":", ""), info.identity.lower()}
+            if keys & terms:
+                selected.append(connection)
+        return selected
+
     def all(self) -> dict[str, AMTConnection]:
         """Retorna todas as conexões.
         
@@ -220,22 +293,28 @@ class ConnectionManager:
     def get_stats(self) -> dict[str, Any]:
         """Retorna estatísticas do gerenciador.
         
+        Inclui a memória estimada de cada conexão (``AMTConnection.memory_usage``)
+        e o total.
+        
         Returns:
             Dicionário com estatísticas.
         """
+        connections = [
+            {
+                "id": conn.id,
+                "host": conn.host,
+                "port": conn.port,
+                "connected_at": conn.connected_at.isoformat(),
+                "is_connected": conn.is_connected,
+                "memory": conn.memory_usage(),
+            }
+            for conn in self._connections.values()
+        ]
         return {
             "total_connections": self.count,
             "hosts": self.list_hosts(),
-            "connections": [
-                {
-                    "id": conn.id,
-                    "host": conn.host,
-                    "port": conn.port,
-                    "connected_at": conn.connected_at.isoformat(),
-                    "is_connected": conn.is_connected,
-                }
-                for conn in self._connections.values()
-            ],
+            "total_memory": sum(conn["memory"]["total"] for conn in connections),
+            "connections": connections,
         }
 
     def __len__(self) -> int:
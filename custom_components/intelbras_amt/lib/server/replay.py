@@ -0,0 +1,220 @@
+"""Replay de capturas de tráfego pelo caminho de despacho do servidor.
+
+Reproduz uma captura (``capture``) alimentando os bytes recebidos de cada
+conexão, na fragmentação original, em um ``ISECNetFrameReader`` e no
+despacho de frames do ``AMTServer`` (ACKs automáticos, identificação,
+eventos e callbacks), sem rede. As respostas do servidor são descartadas.
+
+Serve para reproduzir offline um problema visto em campo e para medir a
+vazão do parser com o tráfego real de uma instalação.
+
+Execute com:
+    uv run python -m custom_components.intelbras_amt.lib.server.replay captura.amtcap
+
+Ou em tempo real (respeitando os intervalos gravados):
+    uv run python -m custom_components.intelbras_amt.lib.server.replay captura.amtcap --realtime
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Adiciona custom_components ao path para permitir imports
+_CUSTOM_COMPONENTS_DIR = Path(__file__).parent.parent.parent.parent.parent
+if str(_CUSTOM_COMPONENTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_CUSTOM_COMPONENTS_DIR))
+
+from custom_components.intelbras_amt.lib.server.capture import (
+    CaptureError,
+    CaptureReader,
+    CaptureRecordType,
+)
+from custom_components.intelbras_amt.lib.server.connection_manager import AMTConnection
+from custom_components.intelbras_amt.lib.server.tcp_server import AMTServer, AMTServerConfig
+
+
+logger = logging.getLogger("replay")
+
+
+class _DiscardWriter:
+    """Writer sem rede: descarta e conta os bytes que o servidor enviaria."""
+
+    def __init__(self) -> None:
+        self.written = 0
+        self._closing = False
+
+    def write(self, data: bytes) -> None:
+        self.written += len(data)
+
+    async def drain(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        self._closing = True
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+@dataclass
+class ReplayStats:
+    """Resultado de um replay."""
+
+    connections: int = 0
+    inbound_chunks: int = 0
+    inbound_bytes: int = 0
+    outbound_bytes: int = 0
+    """Bytes enviados pelo servidor original (gravados na captura)."""
+
+    replay_outbound_bytes: int = 0
+    """Bytes que o servidor enviaria no replay (ACKs automáticos)."""
+
+    frames: int = 0
+    commands: Counter = field(default_factory=Counter)
+    """Frames recebidos por código de comando."""
+
+    elapsed: float = 0.0
+    """Tempo de processamento (segundos)."""
+
+
+async def replay(
+    path: str | Path,
+    server: AMTServer | None = None,
+    realtime: bool = False,
+    speed: float = 1.0,
+) -> ReplayStats:
+    """Reproduz uma captura pelo despacho de frames do servidor.
+
+    Args:
+        path: Arquivo de captura.
+        server: Servidor (não iniciado) com os callbacks a exercitar; um
+            novo, com a configuração padrão, se None.
+        realtime: Respeita os intervalos gravados (senão, o mais rápido
+            possível).
+        speed: Fator de velocidade no modo tempo real (2 = duas vezes
+            mais rápido).
+
+    Returns:
+        Estatísticas do replay.
+
+    Raises:
+        CaptureError: Se o arquivo não é uma captura válida.
+    """
+    reader = CaptureReader(path)
+    server = server or AMTServer(AMTServerConfig())
+    stats = ReplayStats()
+    connections: dict[int, AMTConnection] = {}
+
+    loop_start = time.perf_counter()
+    for record in reader:
+        if realtime:
+            delay = loop_start + record.timestamp / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        if record.type == CaptureRecordType.OPEN:
+            connection_id = record.data.decode(errors="replace")
+            host, _, port = connection_id.rpartition(":")
+            connection = AMTConnection(
+                id=connection_id,
+                address=(host, int(port) if port.isdigit() else 0),
+                reader=None,
+                writer=_DiscardWriter(),
+            )
+            server.connections.add(connection)
+            connections[record.connection] = connection
+            stats.connections += 1
+
+        elif record.type == CaptureRecordType.INBOUND:
+            if record.connection not in connections:
+                continue
+            connection = connections[record.connection]
+            stats.inbound_chunks += 1
+            stats.inbound_bytes += len(record.data)
+            frames = connection.frame_reader.feed(record.data)
+            stats.frames += len(frames)
+            for frame in frames:
+                stats.commands[frame.command] += 1
+                await server._dispatch_frame(connection, frame)
+
+        elif record.type == CaptureRecordType.OUTBOUND:
+            stats.outbound_bytes += len(record.data)
+
+        elif record.type == CaptureRecordType.CLOSE:
+            if connection := connections.pop(record.connection, None):
+                server.connections.remove(connection.id)
+                stats.replay_outbound_bytes += connection.writer.written
+
+    stats.elapsed = time.perf_counter() - loop_start
+    for connection in connections.values():
+        server.connections.remove(connection.id)
+        stats.replay_outbound_bytes += connection.writer.written
+    return stats
+
+
+def print_stats(stats: ReplayStats) -> None:
+    """Mostra o resumo do replay e a vazão do parser."""
+    elapsed = stats.elapsed or 1e-9
+    print(f"Conexões:          {stats.connections}")
+    print(f"Pedaços recebidos: {stats.inbound_chunks} ({stats.inbound_bytes} bytes)")
+    print(f"Bytes enviados:    {stats.outbound_bytes} na captura, {stats.replay_outbound_bytes} no replay")
+    print(f"Frames:            {stats.frames}")
+    for command, count in stats.commands.most_common():
+        print(f"  0x{command:02X}:            {count}")
+    print(f"Tempo:             {stats.elapsed:.3f}s")
+    print(
+        f"Vazão:             {stats.frames / elapsed:,.0f} frames/s, "
+        f"{stats.inbound_bytes / elapsed / 1024 / 1024:.2f} MiB/s"
+    )
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description='Reproduz uma captura de tráfego pelo despacho do servidor AMT',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  uv run python -m custom_components.intelbras_amt.lib.server.replay captura.amtcap
+  uv run python -m custom_components.intelbras_amt.lib.server.replay captura.amtcap --realtime --speed 10
+  uv run python -m custom_components.intelbras_amt.lib.server.replay captura.amtcap -v  # mostra cada frame
+        """
+    )
+
+    parser.add_argument('capture', type=Path, help='Arquivo de captura (.amtcap)')
+    parser.add_argument('--realtime', action='store_true', help='Respeita os intervalos gravados')
+    parser.add_argument('--speed', type=float, default=1.0, help='Fator de velocidade no modo tempo real (padrão: 1)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Modo verbose (logs do despacho)')
+
+    args = parser.parse_args()
+    if args.speed <= 0:
+        print("Erro: --speed deve ser maior que zero")
+        sys.exit(1)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format='%(asctime)s │ %(levelname)s │ %(message)s',
+        datefmt='%H:%M:%S',
+    )
+
+    try:
+        stats = asyncio.run(replay(args.capture, realtime=args.realtime, speed=args.speed))
+    except (CaptureError, OSError) as e:
+        print(f"Erro: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        return
+
+    print_stats(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,14 +12,28 @@ Características:
 
 import asyncio
 import logging
+import time
 from typing import Callable, Awaitable
 from dataclasses import dataclass, field
 
-from ..const import DEFAULT_PORT, RESPONSE_TIMEOUT
-from ..protocol.isecnet import ISECNetFrame, ISECNetFrameReader
+from ..const import (
+    DEFAULT_PORT,
+    ISECNET_COMMAND_EVENT,
+    MAX_CONNECTION_MEMORY,
+    MEMORY_CHECK_INTERVAL,
+    MEMORY_THROTTLE_DELAY,
+    READ_BUFFER_LIMIT,
+    RESPONSE_TIMEOUT,
+    WRITE_BUFFER_LIMIT,
+    MemoryPolicy,
+)
+from ..metrics import ServerMetrics
+from ..protocol.isecnet import ISECNetFrame
 from ..protocol.responses import Response
 from ..protocol.commands.connection import ConnectionInfo, CONNECTION_INFO_COMMAND
+from .capture import CaptureRecorder, CaptureWriter
 from .connection_manager import ConnectionManager, AMTConnection
+from .wire_trace import DEFAULT_TRACE_SIZE, WireDirection, WireTrace
 
 
 logger = logging.getLogger(__name__)
@@ -42,6 +56,18 @@ class AMTServerConfig:
         response_timeout: Timeout em segundos para respostas.
         auto_ack_heartbeat: Se True, responde automaticamente aos heartbeats.
         auto_ack_connection: Se True, responde automaticamente ao comando 0x94.
+        auto_ack_events: Se True, confirma automaticamente os eventos (0xB0).
+        capture_path: Se definido, grava todo o tráfego das conexões neste
+            arquivo (ver ``capture``).
+        read_buffer_limit: Limite do buffer de leitura asyncio por conexão.
+        write_buffer_limit: Fila de escrita por conexão acima da qual o
+            envio espera a central ler.
+        max_connection_memory: Memória estimada máxima de uma conexão
+            (None = sem limite).
+        max_total_memory: Memória estimada máxima da soma das conexões; as
+            maiores são penalizadas primeiro (None = sem limite).
+        memory_policy: O que fazer com uma conexão acima do limite.
+        wire_trace_size: Frames mantidos pelo trace (``wire_trace``).
     """
     
     host: str = "0.0.0.0"
@@ -49,6 +75,14 @@ class AMTServerConfig:
     response_timeout: float = RESPONSE_TIMEOUT
     auto_ack_heartbeat: bool = True
     auto_ack_connection: bool = True
+    auto_ack_events: bool = True
+    capture_path: str | None = None
+    read_buffer_limit: int = READ_BUFFER_LIMIT
+    write_buffer_limit: int = WRITE_BUFFER_LIMIT
+    max_connection_memory: int | None = MAX_CONNECTION_MEMORY
+    max_total_memory: int | None = None
+    memory_policy: MemoryPolicy = MemoryPolicy.DISCONNECT
+    wire_trace_size: int = DEFAULT_TRACE_SIZE
 
 
 class AMTServer:
@@ -78,14 +112,20 @@ class AMTServer:
         self._config = config or AMTServerConfig()
         self._server: asyncio.Server | None = None
         self._connection_manager = ConnectionManager()
+        self._metrics = ServerMetrics(self._connection_manager)
+        self._wire_trace = WireTrace(self._config.wire_trace_size)
         
         # Callbacks
         self._frame_callbacks: list[FrameCallback] = []
         self._connect_callbacks: list[ConnectionCallback] = []
         self._disconnect_callbacks: list[ConnectionCallback] = []
+        self._identify_callbacks: list[ConnectionCallback] = []
         
         # Estado
         self._running = False
+        self._capture: CaptureRecorder | None = None
+        self._memory_checked_at = 0.0
+        self._memory_offenders: set[str] = set()
 
     @property
     def config(self) -> AMTServerConfig:
@@ -97,11 +137,28 @@ class AMTServer:
         """Gerenciador de conexões."""
         return self._connection_manager
 
+    @property
+    def metrics(self) -> ServerMetrics:
+        """Métricas do servidor (exportáveis com ``metrics.registry.render()``)."""
+        return self._metrics
+
+    @property
+    def wire_trace(self) -> WireTrace:
+        """Trace amostrado dos frames (desligado por padrão)."""
+        return self._wire_trace
+
     @property
     def is_running(self) -> bool:
         """Verifica se o servidor está rodando."""
         return self._running
 
+    @property
+    def port(self) -> int | None:
+        """Porta em que o servidor escuta (a real, mesmo com ``port=0``)."""
+        if not self._server or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
     def on_frame(self, callback: FrameCallback) -> FrameCallback:
         """Decorator para registrar callback de frames recebidos.
         
@@ -138,21 +195,54 @@ class AMTServer:
         self._disconnect_callbacks.append(callback)
         return callback
 
+    def on_identify(self, callback: ConnectionCallback) -> ConnectionCallback:
+        """Decorator para registrar callback de identificação da central (0x94).
+        
+        Chamado depois que a central se identifica, com
+        ``connection.metadata["connection_info"]`` já preenchido.
+        
+        Args:
+            callback: Função async(connection) a ser chamada.
+            
+        Returns:
+            A própria função callback.
+        """
+        self._identify_callbacks.append(callback)
+        return callback
+
     async def start(self) -> None:
         """Inicia o servidor TCP.
         
         Raises:
             RuntimeError: Se o servidor já estiver rodando.
+            OSError: Se não for possível escutar na porta (ex.: porta em uso).
         """
         if self._running:
             raise RuntimeError("Servidor já está rodando")
         
-        self._server = await asyncio.start_server(
-            self._handle_client,
-            self._config.host,
-            self._config.port,
-            reuse_address=True,
-        )
+        # Captura antes de aceitar conexões, para registrar todas
+        if self._config.capture_path:
+            writer = await asyncio.get_running_loop().run_in_executor(
+                None, CaptureWriter, self._config.capture_path
+            )
+            self._capture = CaptureRecorder(writer)
+            self._capture.start()
+            logger.info(f"Capturando o tráfego em {self._config.capture_path}")
+        
+        try:
+            self._server = await asyncio.start_server(
+                self._handle_client,
+                self._config.host,
+                self._config.port,
+                reuse_address=True,
+                limit=self._config.read_buffer_limit,
+            )
+        except Exception:
+            # Ex.: porta em uso. stop() não roda sem _running: fecha a captura aqui
+            if self._capture:
+                await self._capture.stop()
+                self._capture = None
+            raise
         
         self._running = True
         
@@ -175,6 +265,10 @@ class AMTServer:
             await self._server.wait_closed()
             self._server = None
         
+        if self._capture:
+            await self._capture.stop()
+            self._capture = None
+        
         logger.info("Servidor AMT parado")
 
     async def serve_forever(self) -> None:
@@ -215,6 +309,18 @@ class AMTServer:
         
         return await self._send_and_wait(connection, frame, wait_response)
 
+    def queued_commands(self, connection_id: str | None) -> int:
+        """Número de comandos em andamento ou na fila de uma conexão.
+        
+        Args:
+            connection_id: ID da conexão.
+            
+        Returns:
+            Comandos na fila (0 se a conexão não existir).
+        """
+        connection = self._connection_manager.get(connection_id) if connection_id else None
+        return connection.queued_commands if connection else 0
+
     async def broadcast_command(
         self,
         frame: ISECNetFrame,
@@ -263,9 +369,14 @@ class AMTServer:
             writer=writer,
         )
         
+        writer.transport.set_write_buffer_limits(high=self._config.write_buffer_limit)
         self._connection_manager.add(connection)
+        self._metrics.connections_accepted.inc()
         logger.info(f"Nova conexão de {connection_id}")
         
+        if self._capture:
+            connection.metadata["capture_id"] = self._capture.open(connection_id)
+        
         # Notifica callbacks de conexão
         for callback in self._connect_callbacks:
             try:
@@ -274,7 +385,7 @@ class AMTServer:
                 logger.error(f"Erro em callback de conexão: {e}")
         
         # Processa dados da conexão
-        frame_reader = ISECNetFrameReader()
+        throttled = False
         
         try:
             while not reader.at_eof():
@@ -282,59 +393,27 @@ class AMTServer:
                 if not data:
                     break
                 
-                logger.debug(f"Dados brutos de {connection_id}: {data.hex(' ')}")
-                frames = frame_reader.feed(data)
-                
-                # Log se há bytes pendentes no buffer
-                if frame_reader.pending_bytes > 0:
-                    logger.debug(f"Bytes pendentes no buffer: {frame_reader.pending_bytes}")
-                
-                # Log se há resposta pendente esperando
-                if connection.pending_response:
-                    logger.debug(f"Há resposta pendente aguardando frame...")
+                if self._capture:
+                    self._capture.inbound(connection.metadata["capture_id"], data)
+                await self._process_data(connection, data)
                 
-                if not frames:
-                    logger.debug(f"Nenhum frame completo extraído de {len(data)} bytes recebidos")
-                
-                for frame in frames:
-                    logger.debug(f"Frame recebido de {connection_id}: {frame}")
-                    
-                    # Flags para controlar se o frame deve preencher pending_response
-                    is_auto_handled = False
-                    
-                    # Trata heartbeat automaticamente se configurado
-                    if frame.is_heartbeat and self._config.auto_ack_heartbeat:
-                        await self._handle_heartbeat(connection, frame)
-                        is_auto_handled = True
-                        # Continua para notificar callbacks (para contagem, etc)
-                    
-                    # Trata comando de identificação (0x94) automaticamente
-                    if frame.command == CONNECTION_INFO_COMMAND and self._config.auto_ack_connection:
-                        await self._handle_connection_info(connection, frame)
-                        is_auto_handled = True
-                        # Continua para notificar callbacks também
-                    
-                    # Verifica se há resposta pendente
-                    # IMPORTANTE: Heartbeats e comandos auto-tratados NÃO preenchem pending_response
-                    if connection.pending_response and not is_auto_handled:
-                        logger.debug(
-                            f"Preenchendo resposta pendente de {connection_id} com frame: "
-                            f"command=0x{frame.command:02X}, content={frame.content.hex(' ')}"
+                if usage := self._over_memory_budget(connection):
+                    if self._config.memory_policy == MemoryPolicy.DISCONNECT:
+                        logger.warning(
+                            f"Conexão {connection_id} acima do limite de memória "
+                            f"({usage} bytes), desconectando"
+                        )
+                        break
+                    if not throttled:
+                        logger.warning(
+                            f"Conexão {connection_id} acima do limite de memória "
+                            f"({usage} bytes), pausando a leitura"
                         )
-                        if not connection.pending_response.done():
-                            connection.pending_response.set_result(frame)
-                            connection.pending_response = None
-                        else:
-                            logger.warning(
-                                f"Tentativa de preencher pending_response já concluído para {connection_id}"
-                            )
-                    elif not is_auto_handled:
-                        # Notifica callbacks de frame (apenas se não foi auto-tratado)
-                        for callback in self._frame_callbacks:
-                            try:
-                                await callback(connection, frame)
-                            except Exception as e:
-                                logger.error(f"Erro em callback de frame: {e}")
+                    throttled = True
+                    await asyncio.sleep(MEMORY_THROTTLE_DELAY)
+                elif throttled:
+                    logger.info(f"Conexão {connection_id} de volta ao limite de memória")
+                    throttled = False
         
         except asyncio.CancelledError:
             pass
@@ -343,6 +422,9 @@ class AMTServer:
         finally:
             # Cleanup
             self._connection_manager.remove(connection_id)
+            self._wire_trace.forget(connection_id)
+            if self._capture and "capture_id" in connection.metadata:
+                self._capture.close(connection.metadata["capture_id"])
             
             # Notifica callbacks de desconexão
             for callback in self._disconnect_callbacks:
@@ -359,6 +441,152 @@ class AMTServer:
             
             logger.info(f"Conexão encerrada: {connection_id}")
 
+    def _over_memory_budget(self, connection: AMTConnection) -> int:
+        """Verifica os limites de memória da conexão e o global.
+        
+        O limite global é recalculado no máximo a cada
+        ``MEMORY_CHECK_INTERVAL`` segundos, somando todas as conexões.
+        
+        Args:
+            connection: Conexão que acabou de receber dados.
+            
+        Returns:
+            Memória estimada da conexão se ela passou de algum limite, 0
+            caso contrário.
+        """
+        config = self._config
+        if config.max_total_memory:
+            now = time.monotonic()
+            if now - self._memory_checked_at >= MEMORY_CHECK_INTERVAL:
+                self._memory_checked_at = now
+                self._memory_offenders = self._find_memory_offenders(config.max_total_memory)
+        
+        offender = connection.id in self._memory_offenders
+        if not offender and not config.max_connection_memory:
+            return 0
+        
+        usage = connection.memory_usage()["total"]
+        return usage if offender or usage > config.max_connection_memory else 0
+
+    def _find_memory_offenders(self, budget: int) -> set[str]:
+        """Escolhe as maiores conexões a penalizar até a soma caber no limite.
+        
+        No modo ``DISCONNECT`` as escolhidas são fechadas imediatamente,
+        mesmo sem receber dados (ex: central que não lê as respostas).
+        
+        Args:
+            budget: Limite global de memória (bytes).
+            
+        Returns:
+            IDs das conexões escolhidas.
+        """
+        usages = {
+            connection.id: connection.memory_usage()["total"]
+            for connection in self._connection_manager
+        }
+        total = sum(usages.values())
+        if total <= budget:
+            return set()
+        
+        offenders: set[str] = set()
+        for connection_id, usage in sorted(usages.items(), key=lambda item: item[1], reverse=True):
+            if total <= budget:
+                break
+            offenders.add(connection_id)
+            total -= usage
+        
+        logger.warning(
+            f"Memória das conexões ({sum(usages.values())} bytes) acima do limite "
+            f"de {budget} bytes; {len(offenders)} conexões penalizadas"
+        )
+        if self._config.memory_policy == MemoryPolicy.DISCONNECT:
+            for connection_id in offenders:
+                if connection := self._connection_manager.get(connection_id):
+                    connection.writer.close()
+        return offenders
+
+    async def _process_data(
+        self,
+        connection: AMTConnection,
+        data: bytes,
+    ) -> None:
+        """Extrai os frames de um pedaço de bytes recebido e despacha cada um.
+        
+        Args:
+            connection: Conexão que recebeu os dados.
+            data: Bytes recebidos.
+        """
+        for frame in connection.frame_reader.feed(data):
+            await self._dispatch_frame(connection, frame)
+
+    async def _dispatch_frame(self, connection: AMTConnection, frame: ISECNetFrame) -> None:
+        """Trata um frame recebido de uma central.
+        
+        Responde automaticamente heartbeats, identificação e eventos,
+        entrega respostas a um comando pendente e notifica os callbacks
+        de frame.
+        
+        Args:
+            connection: Conexão que recebeu o frame.
+            frame: Frame recebido.
+        """
+        connection_id = connection.id
+        self._metrics.frame_received(frame)
+        if self._wire_trace.active:
+            self._wire_trace.record(connection_id, WireDirection.RX, frame.command, frame.content)
+        
+        # Flags para controlar se o frame deve preencher pending_response
+        is_auto_handled = False
+        is_event = frame.command == ISECNET_COMMAND_EVENT
+        
+        # Trata heartbeat automaticamente se configurado
+        if frame.is_heartbeat and self._config.auto_ack_heartbeat:
+            await self._handle_heartbeat(connection, frame)
+            is_auto_handled = True
+            # Continua para notificar callbacks (para contagem, etc)
+        
+        # Trata comando de identificação (0x94) automaticamente
+        if frame.command == CONNECTION_INFO_COMMAND and self._config.auto_ack_connection:
+            await self._handle_connection_info(connection, frame)
+            is_auto_handled = True
+            # Continua para notificar callbacks também
+        
+        # Confirma eventos espontâneos da central (0xB0)
+        if is_event and self._config.auto_ack_events:
+            await self._handle_event(connection, frame)
+            is_auto_handled = True
+        
+        # Verifica se há resposta pendente
+        # IMPORTANTE: Heartbeats e comandos auto-tratados NÃO preenchem pending_response
+        if connection.pending_response and not is_auto_handled:
+            if not connection.pending_response.done():
+                connection.pending_response.set_result(frame)
+                connection.pending_response = None
+            else:
+                logger.warning(
+                    f"Tentativa de preencher pending_response já concluído para {connection_id}"
+                )
+        elif not is_auto_handled or is_event:
+            # Notifica callbacks de frame (apenas se não foi auto-tratado,
+            # exceto eventos, que são o motivo de existir dos callbacks)
+            for callback in self._frame_callbacks:
+                try:
+                    await callback(connection, frame)
+                except Exception as e:
+                    logger.error(f"Erro em callback de frame: {e}")
+
+    async def _write(self, connection: AMTConnection, data: bytes) -> None:
+        """Envia bytes para a central (registrando na captura, se ativa)."""
+        if self._capture and "capture_id" in connection.metadata:
+            self._capture.outbound(connection.metadata["capture_id"], data)
+        self._metrics.data_sent(data)
+        if self._wire_trace.active:
+            self._wire_trace.record(
+                connection.id, WireDirection.TX, data[1] if len(data) > 1 else data[0], data
+            )
+        connection.writer.write(data)
+        await connection.writer.drain()
+
     async def _handle_heartbeat(
         self,
         connection: AMTConnection,
@@ -370,15 +598,9 @@ class AMTServer:
             connection: Conexão que enviou o heartbeat.
             frame: Frame de heartbeat recebido.
         """
-        logger.debug(f"Heartbeat recebido de {connection.id}, enviando ACK")
-        
         # Cria e envia resposta ACK simples (frame curto)
         ack_frame = ISECNetFrame.create_simple_ack()
-        ack_data = ack_frame.build()
-        
-        logger.debug(f"ACK heartbeat: {ack_data.hex(' ')}")
-        connection.writer.write(ack_data)
-        await connection.writer.drain()
+        await self._write(connection, ack_frame.build())
         
         # Atualiza timestamp do último heartbeat
         connection.metadata["last_heartbeat"] = asyncio.get_event_loop().time()
@@ -410,16 +632,41 @@ class AMTServer:
             connection.metadata["channel"] = info.channel.name
             connection.metadata["mac_suffix"] = info.mac_suffix
             connection.metadata["connection_info"] = info
+            self._metrics.identified(info.identity)
         else:
             logger.warning(f"Não foi possível parsear comando 0x94: {frame.content.hex()}")
         
         # Envia ACK simples (frame curto)
         ack_frame = ISECNetFrame.create_simple_ack()
-        ack_data = ack_frame.build()
+        await self._write(connection, ack_frame.build())
         
-        logger.debug(f"ACK para 0x94: {ack_data.hex(' ')}")
-        connection.writer.write(ack_data)
-        await connection.writer.drain()
+        if info is None:
+            return
+        
+        # Notifica callbacks de identificação
+        for callback in self._identify_callbacks:
+            try:
+                await callback(connection)
+            except Exception as e:
+                logger.error(f"Erro em callback de identificação: {e}")
+
+    async def _handle_event(
+        self,
+        connection: AMTConnection,
+        frame: ISECNetFrame,
+    ) -> None:
+        """Confirma um evento enviado espontaneamente pela central (0xB0).
+        
+        Sem o ACK a central reenvia o mesmo evento até ser confirmada.
+        
+        Args:
+            connection: Conexão que enviou o evento.
+            frame: Frame de evento recebido.
+        """
+        ack_frame = ISECNetFrame.create_simple_ack()
+        await self._write(connection, ack_frame.build())
+        
+        connection.metadata["last_event"] = asyncio.get_event_loop().time()
 
     async def _send_and_wait(
         self,
@@ -440,32 +687,47 @@ class AMTServer:
         Raises:
             TimeoutError: Se timeout aguardando resposta.
         """
+        # Um comando por vez por conexão: a central não identifica a qual
+        # comando cada resposta pertence
+        connection.queued_commands += 1
+        try:
+            async with connection.command_lock:
+                return await self._send_and_wait_locked(connection, frame, wait_response)
+        finally:
+            connection.queued_commands -= 1
+
+    async def _send_and_wait_locked(
+        self,
+        connection: AMTConnection,
+        frame: ISECNetFrame,
+        wait_response: bool,
+    ) -> Response | None:
+        """Envia frame e aguarda resposta (com a fila da conexão já adquirida)."""
         data = frame.build()
         
         if wait_response:
+            command = ServerMetrics.mobile_command(frame)
             # Prepara para aguardar resposta
             connection.pending_response = asyncio.get_event_loop().create_future()
-            logger.debug(f"Criado pending_response para {connection.id}, aguardando resposta...")
         
         # Envia dados
-        connection.writer.write(data)
-        await connection.writer.drain()
-        
-        logger.debug(f"Enviado para {connection.id}: {data.hex(' ')}")
+        sent_at = time.monotonic()
+        await self._write(connection, data)
         
         if not wait_response:
             return None
         
         # Aguarda resposta com timeout
         try:
-            logger.debug(f"Aguardando resposta de {connection.id} (timeout: {self._config.response_timeout}s)...")
             response_frame = await asyncio.wait_for(
                 connection.pending_response,
                 timeout=self._config.response_timeout,
             )
-            logger.debug(f"Resposta recebida de {connection.id}: {response_frame}")
-            return Response.from_isecnet_frame(response_frame)
+            response = Response.from_isecnet_frame(response_frame)
+            self._metrics.response(command, response, time.monotonic() - sent_at)
+            return response
         except asyncio.TimeoutError:
+            self._metrics.timeouts.inc(command)
             logger.warning(
                 f"Timeout aguardando resposta de {connection.id} "
                 f"({self._config.response_timeout}s). "
@@ -0,0 +1,190 @@
+"""Trace amostrado dos frames trocados com as centrais.
+
+Substitui os logs de debug com ``data.hex()`` no caminho de leitura e
+escrita: o servidor só testa um booleano por frame enquanto o trace está
+desligado. Ligado (para todas as conexões ou só algumas), guarda 1 a cada
+``sample`` frames como registros estruturados num buffer circular, que
+pode ser lido ou gravado sob demanda; nada é formatado na hora. Como na
+captura, a senha dos comandos enviados é mascarada (``mask_password``).
+
+Example:
+    ```python
+    server.wire_trace.enable("192.168.1.50:40000")  # uma conexão
+    server.wire_trace.enable(sample=10)             # todas, 1 a cada 10
+    ...
+    for line in server.wire_trace.format():
+        print(line)
+    ```
+"""
+
+import time
+from collections import deque
+from datetime import datetime
+from enum import StrEnum
+from typing import Iterator, NamedTuple
+
+from .capture import mask_password
+
+
+DEFAULT_TRACE_SIZE = 4096
+"""Registros mantidos no buffer circular (os mais antigos são descartados)."""
+
+
+class WireDirection(StrEnum):
+    """Sentido do frame."""
+
+    RX = "rx"
+    """Recebido da central."""
+
+    TX = "tx"
+    """Enviado para a central."""
+
+
+class WireTraceRecord(NamedTuple):
+    """Um frame registrado no trace."""
+
+    timestamp: float
+    """Epoch em segundos."""
+
+    connection_id: str
+    direction: WireDirection
+    command: int
+    """Comando ISECNet do frame."""
+
+    data: bytes
+    """Conteúdo (recebido) ou bytes serializados com a senha mascarada (enviado)."""
+
+
+class WireTrace:
+    """Buffer circular de frames amostrados, ligado em tempo de execução.
+
+    O teste no caminho quente é ``if trace.active``; ``record`` só é
+    chamado com o trace ligado e decide a conexão e a amostragem.
+    """
+
+    def __init__(self, size: int = DEFAULT_TRACE_SIZE) -> None:
+        """Inicializa o trace desligado.
+
+        Args:
+            size: Registros mantidos no buffer circular.
+        """
+        self._records: deque[WireTraceRecord] = deque(maxlen=size)
+        self._all = False
+        self._connections: set[str] = set()
+        self._excluded: set[str] = set()
+        """Conexões desligadas individualmente enquanto todas são rastreadas."""
+        self._sample = 1
+        self._seen = dict.fromkeys(WireDirection, 0)
+        """Frames vistos por sentido (amostragem independente em cada um)."""
+        self.active = False
+        """Se há alguma conexão sendo rastreada."""
+
+    @property
+    def sample(self) -> int:
+        """Registra 1 a cada ``sample`` frames."""
+        return self._sample
+
+    @property
+    def connections(self) -> set[str] | None:
+        """Conexões rastreadas (None = todas, exceto ``excluded``)."""
+        return None if self._all else set(self._connections)
+
+    @property
+    def excluded(self) -> set[str]:
+        """Conexões não rastreadas enquanto o trace vale para todas."""
+        return set(self._excluded)
+
+    def enable(self, connection_id: str | None = None, sample: int | None = None) -> None:
+        """Liga o trace para uma conexão ou para todas.
+
+        Args:
+            connection_id: Conexão a rastrear (None = todas).
+            sample: Registra 1 a cada ``sample`` frames (mantém o atual se None).
+
+        Raises:
+            ValueError: Se ``sample`` é menor que 1.
+        """
+        if sample is not None:
+            if sample < 1:
+                raise ValueError("A amostragem deve ser pelo menos 1")
+            self._sample = sample
+        if connection_id is None:
+            self._all = True
+            self._connections.clear()
+            self._excluded.clear()
+        elif self._all:
+            self._excluded.discard(connection_id)
+        else:
+            self._connections.add(connection_id)
+        self.active = True
+
+    def disable(self, connection_id: str | None = None) -> None:
+        """Desliga o trace de uma conexão ou de todas.
+
+        Args:
+            connection_id: Conexão a parar de rastrear (None = todas).
+        """
+        if connection_id is None:
+            self._all = False
+            self._connections.clear()
+            self._excluded.clear()
+        elif self._all:
+            self._excluded.add(connection_id)
+        else:
+            self._connections.discard(connection_id)
+        self.active = self._all or bool(self._connections)
+
+    def forget(self, connection_id: str) -> None:
+        """Descarta a configuração de uma conexão encerrada (os registros ficam)."""
+        self._connections.discard(connection_id)
+        self._excluded.discard(connection_id)
+        self.active = self._all or bool(self._connections)
+
+    def record(
+        self,
+        connection_id: str,
+        direction: WireDirection,
+        command: int,
+        data: bytes,
+    ) -> None:
+        """Registra um frame, se a conexão é rastreada e ele cai na amostra.
+
+        Frames enviados (``WireDirection.TX``) são gravados com a senha mascarada.
+        """
+        if self._all:
+            if connection_id in self._excluded:
+                return
+        elif connection_id not in self._connections:
+            return
+        seen = self._seen[direction] = self._seen[direction] + 1
+        if seen % self._sample:
+            return
+        if direction == WireDirection.TX:
+            data = mask_password(data)
+        self._records.append(WireTraceRecord(time.time(), connection_id, direction, command, data))
+
+    def records(self, connection_id: str | None = None) -> list[WireTraceRecord]:
+        """Registros do buffer, do mais antigo ao mais novo.
+
+        Args:
+            connection_id: Só os registros desta conexão (None = todos).
+        """
+        if connection_id is None:
+            return list(self._records)
+        return [record for record in self._records if record.connection_id == connection_id]
+
+    def format(self, connection_id: str | None = None) -> Iterator[str]:
+        """Formata os registros, um por linha (hora, conexão, sentido, comando, hex)."""
+        for record in self.records(connection_id):
+            moment = datetime.fromtimestamp(record.timestamp).strftime("%H:%M:%S.%f")[:-3]
+            yield (
+                f"{moment} {record.connection_id} {record.direction.upper()} "
+                f"0x{record.command:02X} {record.data.hex(' ')}"
+            )
+
+    def clear(self) -> None:
+        """Esvazia o buffer."""
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
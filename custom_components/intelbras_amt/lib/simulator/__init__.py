@@ -0,0 +1,13 @@
+"""Centrais AMT simuladas para testes de carga do servidor.
+
+Cada ``SimulatedPanel`` emula uma AMT 2018 E/EG ou AMT 4010 conectada ao
+``AMTServer``: identificação (0x94), heartbeats (0xF7), status parcial e
+completo e respostas ACK/NACK aos comandos de arme, PGM e sirene.
+
+Execute com:
+    uv run python -m custom_components.intelbras_amt.lib.simulator --count 1000
+"""
+
+from .panel import LinkProfile, PanelStats, SimulatedPanel
+
+__all__ = ["LinkProfile", "PanelStats", "SimulatedPanel"]
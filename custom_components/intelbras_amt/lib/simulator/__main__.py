@@ -0,0 +1,163 @@
+"""Gerador de carga: várias centrais simuladas conectando ao servidor.
+
+Execute com:
+    uv run python -m custom_components.intelbras_amt.lib.simulator
+
+Ou com opções:
+    uv run python -m custom_components.intelbras_amt.lib.simulator \\
+        --count 5000 --ramp 500 --latency-ms 80 --jitter-ms 40 --corruption 0.001
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Adiciona custom_components ao path para permitir imports
+_CUSTOM_COMPONENTS_DIR = Path(__file__).parent.parent.parent.parent.parent
+if str(_CUSTOM_COMPONENTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_CUSTOM_COMPONENTS_DIR))
+
+from custom_components.intelbras_amt.lib.const import DEFAULT_PORT
+from custom_components.intelbras_amt.lib.simulator import PanelStats, SimulatedPanel
+from custom_components.intelbras_amt.lib.simulator.cli import (
+    add_panel_arguments,
+    create_panels,
+    raise_file_limit,
+    validate_panel_arguments,
+)
+
+
+logger = logging.getLogger("simulator")
+
+
+def aggregate(panels: list[SimulatedPanel]) -> PanelStats:
+    """Soma os contadores de todas as centrais."""
+    total = PanelStats()
+    for panel in panels:
+        total.merge(panel.stats)
+    return total
+
+
+async def report_loop(panels: list[SimulatedPanel], interval: float) -> None:
+    """Mostra periodicamente o total de conexões e comandos atendidos."""
+    last_commands = 0
+    last_time = time.monotonic()
+
+    while True:
+        await asyncio.sleep(interval)
+        now = time.monotonic()
+        stats = aggregate(panels)
+        rate = (stats.commands - last_commands) / (now - last_time)
+        last_commands, last_time = stats.commands, now
+
+        connected = sum(1 for panel in panels if panel.connected)
+        logger.info(
+            f"Conectadas: {connected}/{len(panels)} │ "
+            f"Comandos: {stats.commands} ({rate:.1f}/s) │ "
+            f"Status: {stats.status_replies} │ ACK: {stats.acks} │ NACK: {stats.nacks} │ "
+            f"Heartbeats: {stats.heartbeats} │ Corrompidos: {stats.corrupted}"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Conecta as centrais no ritmo de ``--ramp`` e mantém até ``--duration``."""
+    panels = create_panels(args, args.count, args.heartbeat)
+    connected: list[SimulatedPanel] = []
+    failures = 0
+    reporter = asyncio.create_task(report_loop(connected, args.report))
+    started = time.monotonic()
+
+    try:
+        # Conecta em lotes de até 1/10 s para manter a taxa de ramp
+        batch = max(1, int(args.ramp / 10)) if args.ramp > 0 else len(panels)
+        for start in range(0, len(panels), batch):
+            chunk = panels[start:start + batch]
+            results = await asyncio.gather(
+                *(panel.connect(args.host, args.port) for panel in chunk),
+                return_exceptions=True,
+            )
+            for panel, result in zip(chunk, results):
+                if isinstance(result, BaseException):
+                    failures += 1
+                    logger.debug(f"{panel} falhou ao conectar: {result}")
+                else:
+                    connected.append(panel)
+            if args.ramp > 0:
+                await asyncio.sleep(len(chunk) / args.ramp)
+
+        logger.info(
+            f"{len(connected)} centrais conectadas em {time.monotonic() - started:.1f}s "
+            f"({failures} falhas)"
+        )
+
+        if args.duration > 0:
+            await asyncio.sleep(max(0.0, args.duration - (time.monotonic() - started)))
+        else:
+            await asyncio.Event().wait()
+    finally:
+        reporter.cancel()
+        await asyncio.gather(*(panel.close() for panel in connected), return_exceptions=True)
+
+        stats = aggregate(connected)
+        print()
+        print(f"Centrais conectadas: {len(connected)} ({failures} falhas)")
+        print(f"Comandos atendidos:  {stats.commands}")
+        print(f"  Status:            {stats.status_replies}")
+        print(f"  ACK:               {stats.acks}")
+        print(f"  NACK:              {stats.nacks}")
+        for code, count in sorted(stats.nack_codes.items()):
+            print(f"    0x{code:02X}:            {count}")
+        print(f"Heartbeats:          {stats.heartbeats}")
+        print(f"Frames corrompidos:  {stats.corrupted}")
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description='Centrais Intelbras AMT simuladas para teste de carga do servidor',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  uv run python -m custom_components.intelbras_amt.lib.simulator --count 10
+  uv run python -m custom_components.intelbras_amt.lib.simulator --count 5000 --ramp 500
+  uv run python -m custom_components.intelbras_amt.lib.simulator --latency-ms 200 --jitter-ms 100 --corruption 0.01
+        """
+    )
+
+    parser.add_argument('--host', default='127.0.0.1', help='Endereço do servidor (padrão: 127.0.0.1)')
+    parser.add_argument('-p', '--port', type=int, default=DEFAULT_PORT, help=f'Porta TCP (padrão: {DEFAULT_PORT})')
+    parser.add_argument('-n', '--count', type=int, default=1, help='Número de centrais (padrão: 1)')
+    add_panel_arguments(parser)
+    parser.add_argument('--heartbeat', type=float, default=60.0, help='Intervalo de heartbeat em segundos (padrão: 60, 0 = desliga)')
+    parser.add_argument('--ramp', type=float, default=200.0, help='Novas conexões por segundo (padrão: 200, 0 = todas de uma vez)')
+    parser.add_argument('--duration', type=float, default=0.0, help='Duração do teste em segundos (padrão: até Ctrl+C)')
+    parser.add_argument('--report', type=float, default=5.0, help='Intervalo do relatório em segundos (padrão: 5)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Modo verbose')
+
+    args = parser.parse_args()
+
+    if error := validate_panel_arguments(args):
+        print(f"Erro: {error}")
+        sys.exit(1)
+    if not 1 <= args.count <= 0x1000000:
+        print("Erro: --count deve estar entre 1 e 16777216")
+        sys.exit(1)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s │ %(levelname)s │ %(message)s',
+        datefmt='%H:%M:%S',
+    )
+    raise_file_limit(args.count)
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
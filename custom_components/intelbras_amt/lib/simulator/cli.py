@@ -0,0 +1,106 @@
+"""Funções compartilhadas pelas ferramentas de linha de comando do simulador."""
+
+import argparse
+import logging
+
+from ..const import CentralModel
+from .panel import LinkProfile, SimulatedPanel
+
+
+logger = logging.getLogger(__name__)
+
+
+MODELS = {
+    "2018": [CentralModel.AMT_2018_E],
+    "4010": [CentralModel.AMT_4010],
+    "mixed": [CentralModel.AMT_2018_E, CentralModel.AMT_4010],
+}
+"""Opção ``--model`` -> modelos usados (alternados entre as centrais)."""
+
+
+def add_panel_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adiciona as opções de modelo e qualidade do link das centrais."""
+    parser.add_argument('--model', choices=sorted(MODELS), default='mixed', help='Modelo emulado (padrão: mixed)')
+    parser.add_argument('--password', default='1234', help='Senha aceita pelas centrais (padrão: 1234)')
+    parser.add_argument('--partitions', action='store_true', help='Centrais particionadas')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Latência das respostas em ms (padrão: 0)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Variação da latência em ms (padrão: 0)')
+    parser.add_argument('--corruption', type=float, default=0.0, help='Probabilidade de corromper cada frame (padrão: 0)')
+
+
+def validate_panel_arguments(args: argparse.Namespace) -> str | None:
+    """Valida as opções de ``add_panel_arguments``.
+
+    Returns:
+        Mensagem de erro, ou None se as opções são válidas.
+    """
+    if not 4 <= len(args.password) <= 6:
+        return "Senha deve ter entre 4 e 6 dígitos"
+    if not 0.0 <= args.corruption <= 1.0:
+        return "--corruption deve estar entre 0 e 1"
+    return None
+
+
+def create_panels(
+    args: argparse.Namespace,
+    count: int,
+    heartbeat_interval: float = 0.0,
+) -> list[SimulatedPanel]:
+    """Cria ``count`` centrais com conta e MAC únicos por índice.
+
+    Args:
+        args: Opções de ``add_panel_arguments``.
+        count: Número de centrais.
+        heartbeat_interval: Intervalo entre heartbeats (0 = sem heartbeat).
+
+    Returns:
+        Centrais ainda não conectadas.
+    """
+    models = MODELS[args.model]
+    link = LinkProfile(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        corruption=args.corruption,
+    )
+    return [
+        SimulatedPanel(
+            model=models[i % len(models)],
+            account=f"{i % 0x10000:04X}",
+            mac_suffix=i.to_bytes(3, "big"),
+            password=args.password,
+            link=link,
+            heartbeat_interval=heartbeat_interval,
+            partitions_enabled=args.partitions,
+            seed=i,
+        )
+        for i in range(count)
+    ]
+
+
+def raise_file_limit(count: int) -> None:
+    """Aumenta o limite de descritores abertos para ``count`` conexões.
+
+    Cada central simulada usa um socket (dois, se o servidor roda no mesmo
+    processo); o limite padrão (1024) não basta para milhares de centrais.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = count + 256
+    if soft >= wanted:
+        return
+
+    new_soft = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (new_soft, hard))
+    except (ValueError, OSError) as e:
+        logger.warning(f"Não foi possível aumentar o limite de arquivos: {e}")
+        return
+    if new_soft < wanted:
+        logger.warning(
+            f"Limite de arquivos ({new_soft}) menor que o necessário ({wanted}), "
+            f"aumente com 'ulimit -n'"
+        )
@@ -0,0 +1,416 @@
+"""Benchmark de latência ponta a ponta dos comandos.
+
+Sobe um ``AMTServer`` e centrais simuladas no mesmo processo (loopback) e
+mede o tempo entre ``send_command`` e a ``Response`` já parseada (para o
+status, inclui o parsing do payload) de cada tipo de comando: status,
+arme/desarme, PGM e sirene.
+
+A carga é de laço aberto: os comandos são disparados na taxa pedida, em
+rodízio pelas conexões e tipos, independente das respostas. Assim a fila
+por conexão (um comando por vez) aparece na latência quando a taxa passa
+do que a conexão atende.
+
+Para cada número de conexões e cada taxa, mostra p50/p95/p99 em uma
+tabela e, opcionalmente, grava um CSV para comparar execuções.
+
+Execute com:
+    uv run python -m custom_components.intelbras_amt.lib.simulator.latency
+
+Ou com opções:
+    uv run python -m custom_components.intelbras_amt.lib.simulator.latency \\
+        --connections 1,10,100,1000 --rates 100,1000,5000 --duration 10 --csv latencia.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+# Adiciona custom_components ao path para permitir imports
+_CUSTOM_COMPONENTS_DIR = Path(__file__).parent.parent.parent.parent.parent
+if str(_CUSTOM_COMPONENTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_CUSTOM_COMPONENTS_DIR))
+
+from custom_components.intelbras_amt.lib.const import PGMAction, RESPONSE_TIMEOUT
+from custom_components.intelbras_amt.lib.protocol.commands import (
+    ActivationCommand,
+    CentralStatus,
+    DeactivationCommand,
+    PartialCentralStatus,
+    PartialStatusRequestCommand,
+    PGMCommand,
+    SirenCommand,
+)
+from custom_components.intelbras_amt.lib.protocol.isecnet import ISECNetFrame
+from custom_components.intelbras_amt.lib.protocol.responses import ResponseType
+from custom_components.intelbras_amt.lib.server import AMTServer, AMTServerConfig
+from custom_components.intelbras_amt.lib.simulator import SimulatedPanel
+from custom_components.intelbras_amt.lib.simulator.cli import (
+    add_panel_arguments,
+    create_panels,
+    raise_file_limit,
+    validate_panel_arguments,
+)
+
+
+logger = logging.getLogger("latency")
+
+
+COMMAND_KINDS = ("status", "arm", "pgm", "siren")
+"""Tipos de comando medidos."""
+
+STATUS_PARSERS = {43: PartialCentralStatus.parse, 54: CentralStatus.parse}
+"""Tamanho do payload de status -> parser."""
+
+CONNECT_BATCH = 500
+"""Conexões abertas em paralelo ao subir as centrais."""
+
+
+def build_frames(password: str) -> dict[str, list[ISECNetFrame]]:
+    """Frames de cada tipo de comando, montados uma vez só.
+
+    Arme, PGM e sirene alternam entre ligar e desligar para que o estado
+    das centrais não fique parado.
+    """
+    return {
+        "status": [PartialStatusRequestCommand(password).build_net_frame()],
+        "arm": [
+            ActivationCommand(password).build_net_frame(),
+            DeactivationCommand(password).build_net_frame(),
+        ],
+        "pgm": [
+            PGMCommand(password, PGMAction.TURN_ON, 1).build_net_frame(),
+            PGMCommand(password, PGMAction.TURN_OFF, 1).build_net_frame(),
+        ],
+        "siren": [
+            SirenCommand(password, True).build_net_frame(),
+            SirenCommand(password, False).build_net_frame(),
+        ],
+    }
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Percentil pelo método nearest-rank.
+
+    Args:
+        samples: Amostras já ordenadas.
+        p: Percentil (0-100).
+
+    Returns:
+        Valor do percentil, 0 se não há amostras.
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, -(-len(samples) * p // 100))  # ceil
+    return samples[int(rank) - 1]
+
+
+@dataclass
+class LatencyResult:
+    """Latências de um tipo de comando em um passo (conexões x taxa).
+
+    Tempos em milissegundos; ``throughput`` em comandos respondidos por
+    segundo (todos os tipos do passo).
+    """
+
+    connections: int
+    rate: float
+    command: str
+    sent: int
+    ok: int
+    nacks: int
+    timeouts: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    throughput: float
+
+
+@dataclass
+class _Samples:
+    """Amostras e contadores de um tipo de comando durante um passo."""
+
+    latencies: list[float]
+    sent: int = 0
+    nacks: int = 0
+    timeouts: int = 0
+    errors: int = 0
+
+
+async def _timed_command(
+    server: AMTServer,
+    connection_id: str,
+    frame: ISECNetFrame,
+    samples: _Samples,
+) -> None:
+    """Envia um comando e registra a latência até a resposta parseada."""
+    samples.sent += 1
+    started = time.perf_counter()
+    try:
+        response = await server.send_command(connection_id, frame)
+        if response is not None and response.response_type == ResponseType.DATA:
+            STATUS_PARSERS[len(response.data)](response.data)
+    except TimeoutError:
+        samples.timeouts += 1
+        return
+    except Exception as e:
+        logger.debug(f"Erro no comando para {connection_id}: {e}")
+        samples.errors += 1
+        return
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if response is None or response.is_error:
+        samples.nacks += 1
+    else:
+        samples.latencies.append(elapsed)
+
+
+async def measure_step(
+    server: AMTServer,
+    connection_ids: list[str],
+    frames: dict[str, list[ISECNetFrame]],
+    kinds: list[str],
+    rate: float,
+    duration: float,
+) -> list[LatencyResult]:
+    """Dispara ``rate`` comandos/s durante ``duration`` segundos e mede.
+
+    O comando ``i`` vai para a conexão ``i % conexões``, com o tipo
+    avançando a cada volta pelas conexões: toda conexão recebe todos os
+    tipos, em qualquer combinação de números.
+
+    Args:
+        server: Servidor com as centrais conectadas.
+        connection_ids: Conexões usadas.
+        frames: Frames de cada tipo (``build_frames``).
+        kinds: Tipos de comando medidos.
+        rate: Comandos por segundo (todas as conexões).
+        duration: Duração do passo em segundos.
+
+    Returns:
+        Um resultado por tipo de comando.
+    """
+    samples = {kind: _Samples(latencies=[]) for kind in kinds}
+    total = max(1, int(rate * duration))
+    connections = len(connection_ids)
+    tasks: list[asyncio.Task] = []
+
+    started = time.perf_counter()
+    for i in range(total):
+        delay = started + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        kind = kinds[(i // connections) % len(kinds)]
+        variants = frames[kind]
+        frame = variants[(i // (connections * len(kinds))) % len(variants)]
+        tasks.append(asyncio.create_task(
+            _timed_command(server, connection_ids[i % connections], frame, samples[kind])
+        ))
+
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    answered = sum(len(s.latencies) + s.nacks for s in samples.values())
+
+    results = []
+    for kind in kinds:
+        s = samples[kind]
+        latencies = sorted(s.latencies)
+        results.append(LatencyResult(
+            connections=connections,
+            rate=rate,
+            command=kind,
+            sent=s.sent,
+            ok=len(latencies),
+            nacks=s.nacks,
+            timeouts=s.timeouts,
+            errors=s.errors,
+            p50=percentile(latencies, 50),
+            p95=percentile(latencies, 95),
+            p99=percentile(latencies, 99),
+            max=latencies[-1] if latencies else 0.0,
+            throughput=answered / elapsed,
+        ))
+    return results
+
+
+async def run_connections(
+    args: argparse.Namespace,
+    count: int,
+    kinds: list[str],
+) -> list[LatencyResult]:
+    """Sobe servidor e ``count`` centrais e mede todas as taxas pedidas."""
+    server = AMTServer(AMTServerConfig(
+        host="127.0.0.1",
+        port=0,
+        response_timeout=args.timeout,
+    ))
+    identified = asyncio.Event()
+
+    @server.on_identify
+    async def _on_identify(connection) -> None:
+        if server.connections.count >= count:
+            identified.set()
+
+    await server.start()
+    panels: list[SimulatedPanel] = create_panels(args, count)
+    results: list[LatencyResult] = []
+
+    try:
+        for start in range(0, count, CONNECT_BATCH):
+            await asyncio.gather(*(
+                panel.connect("127.0.0.1", server.port)
+                for panel in panels[start:start + CONNECT_BATCH]
+            ))
+        await asyncio.wait_for(identified.wait(), timeout=30)
+
+        connection_ids = list(server.connections.all())
+        frames = build_frames(args.password)
+        for rate in args.rates:
+            if args.warmup > 0:
+                await measure_step(server, connection_ids, frames, kinds, rate, args.warmup)
+            step = await measure_step(server, connection_ids, frames, kinds, rate, args.duration)
+            results.extend(step)
+            print_table(step, header=rate == args.rates[0])
+    finally:
+        await asyncio.gather(*(panel.close() for panel in panels), return_exceptions=True)
+        await server.stop()
+
+    return results
+
+
+TABLE_COLUMNS = (
+    ("Conexões", "connections", "{:>8d}"),
+    ("cmd/s", "rate", "{:>8.0f}"),
+    ("Comando", "command", "{:<7}"),
+    ("Enviados", "sent", "{:>8d}"),
+    ("OK", "ok", "{:>7d}"),
+    ("NACK", "nacks", "{:>5d}"),
+    ("Timeout", "timeouts", "{:>7d}"),
+    ("p50 ms", "p50", "{:>8.2f}"),
+    ("p95 ms", "p95", "{:>8.2f}"),
+    ("p99 ms", "p99", "{:>8.2f}"),
+    ("máx ms", "max", "{:>8.2f}"),
+    ("Vazão/s", "throughput", "{:>8.0f}"),
+)
+"""Título, campo de ``LatencyResult`` e formato de cada coluna da tabela."""
+
+
+def print_table(results: list[LatencyResult], header: bool = True) -> None:
+    """Imprime os resultados em tabela (cabeçalho opcional).
+
+    Os formatos das colunas têm largura fixa, então as linhas de chamadas
+    diferentes ficam alinhadas sob o mesmo cabeçalho.
+    """
+    rows = [
+        [fmt.format(getattr(result, field)) for _, field, fmt in TABLE_COLUMNS]
+        for result in results
+    ]
+    widths = [
+        max(len(title), *(len(row[i]) for row in rows))
+        for i, (title, _, _) in enumerate(TABLE_COLUMNS)
+    ]
+
+    if header:
+        print(" │ ".join(title.rjust(w) for w, (title, _, _) in zip(widths, TABLE_COLUMNS)))
+        print("─┼─".join("─" * w for w in widths))
+    for row in rows:
+        print(" │ ".join(cell.rjust(w) for w, cell in zip(widths, row)))
+    sys.stdout.flush()
+
+
+def write_csv(path: Path, results: list[LatencyResult]) -> None:
+    """Grava os resultados em CSV (uma linha por passo e comando)."""
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(LatencyResult)])
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+
+
+async def run(args: argparse.Namespace) -> list[LatencyResult]:
+    """Mede cada número de conexões pedido, em ordem."""
+    results: list[LatencyResult] = []
+    for count in args.connections:
+        results.extend(await run_connections(args, count, args.commands))
+    return results
+
+
+def _number_list(text: str) -> list[float]:
+    """Converte "1,10,100" em números (argparse)."""
+    try:
+        values = [float(item) for item in text.split(",") if item.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Lista de números inválida: '{text}'")
+    if not values or any(value <= 0 for value in values):
+        raise argparse.ArgumentTypeError("Os valores devem ser maiores que zero")
+    return values
+
+
+def _command_list(text: str) -> list[str]:
+    """Converte "status,arm" em tipos de comando (argparse)."""
+    kinds = [item.strip() for item in text.split(",") if item.strip()]
+    invalid = [kind for kind in kinds if kind not in COMMAND_KINDS]
+    if not kinds or invalid:
+        raise argparse.ArgumentTypeError(
+            f"Comandos inválidos: {', '.join(invalid) or text} (use {', '.join(COMMAND_KINDS)})"
+        )
+    return kinds
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description='Latência ponta a ponta dos comandos com centrais simuladas',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  uv run python -m custom_components.intelbras_amt.lib.simulator.latency
+  uv run python -m custom_components.intelbras_amt.lib.simulator.latency --connections 1,100,1000 --rates 100,1000
+  uv run python -m custom_components.intelbras_amt.lib.simulator.latency --commands status --latency-ms 50 --csv status.csv
+        """
+    )
+
+    parser.add_argument('--connections', type=_number_list, default=[1, 10, 100], help='Números de conexões simultâneas (padrão: 1,10,100)')
+    parser.add_argument('--rates', type=_number_list, default=[50, 200, 1000], help='Taxas de comandos por segundo (padrão: 50,200,1000)')
+    parser.add_argument('--commands', type=_command_list, default=list(COMMAND_KINDS), help=f'Comandos medidos (padrão: {",".join(COMMAND_KINDS)})')
+    parser.add_argument('--duration', type=float, default=5.0, help='Duração de cada passo em segundos (padrão: 5)')
+    parser.add_argument('--warmup', type=float, default=1.0, help='Aquecimento antes de cada passo em segundos (padrão: 1, 0 = sem)')
+    parser.add_argument('--timeout', type=float, default=RESPONSE_TIMEOUT, help=f'Timeout de resposta do servidor (padrão: {RESPONSE_TIMEOUT})')
+    add_panel_arguments(parser)
+    parser.add_argument('--csv', type=Path, help='Grava os resultados neste arquivo CSV')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Modo verbose (logs do servidor)')
+
+    args = parser.parse_args()
+    args.connections = [int(count) for count in args.connections]
+
+    if error := validate_panel_arguments(args):
+        print(f"Erro: {error}")
+        sys.exit(1)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format='%(asctime)s │ %(levelname)s │ %(message)s',
+        datefmt='%H:%M:%S',
+    )
+    # Servidor e centrais no mesmo processo: dois sockets por conexão
+    raise_file_limit(2 * max(args.connections))
+
+    try:
+        results = asyncio.run(run(args))
+    except KeyboardInterrupt:
+        return
+
+    if args.csv:
+        write_csv(args.csv, results)
+        print(f"\nResultados gravados em {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
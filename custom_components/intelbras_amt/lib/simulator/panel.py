@@ -0,0 +1,411 @@
+"""Central AMT simulada.
+
+Emula uma central AMT 2018 E/EG ou AMT 4010 do ponto de vista da rede:
+conecta ao ``AMTServer``, se identifica (0x94), envia heartbeats (0xF7) e
+responde aos comandos ISECMobile como a central real:
+
+| Comando        | Resposta                                            |
+|----------------|-----------------------------------------------------|
+| 0x5A           | Status parcial (43 bytes)                           |
+| 0x5B           | Status completo (54 bytes, só AMT 4010)             |
+| 0x41 / 0x44    | ACK, ou NACK (senha, partição, zonas abertas)       |
+| 0x50 (PGM)     | ACK, ou NACK se a PGM não existe no modelo          |
+| 0x43 / 0x63    | ACK (sirene liga/desliga)                           |
+| outros         | NACK 0xE2 (comando inválido)                        |
+
+O estado é mantido direto nos payloads de status (um por layout
+suportado pelo modelo) e alterado com os mesmos ``StatusLayout`` usados
+pelo parser, então o status devolvido é sempre consistente com os
+comandos recebidos.
+
+A qualidade do link é configurável (``LinkProfile``): latência, jitter e
+probabilidade de corromper cada frame enviado.
+"""
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ..const import (
+    CentralModel,
+    CommandCode,
+    ISECMOBILE_FRAME_DELIMITER,
+    ISECNET_COMMAND_HEARTBEAT,
+    PartitionCode,
+    PGMAction,
+    ResponseCode,
+)
+from ..protocol.commands.connection import CONNECTION_INFO_COMMAND, ConnectionChannel
+from ..protocol.commands.status import (
+    FULL_STATUS_LAYOUT,
+    PARTIAL_STATUS_LAYOUT,
+    STATUS_LAYOUTS,
+    StatusLayout,
+    set_bit,
+)
+from ..protocol.isecnet import ISECNetFrame, ISECNetFrameReader
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FIRMWARE = 0x31
+"""Versão de firmware reportada no status (nibbles: 3.1)."""
+
+DEFAULT_HEARTBEAT_INTERVAL = 60.0
+"""Intervalo entre heartbeats (segundos), como a central real."""
+
+
+@dataclass
+class LinkProfile:
+    """Qualidade simulada do link entre a central e o servidor.
+
+    Attributes:
+        latency: Atraso (segundos) antes de cada resposta.
+        jitter: Variação máxima (± segundos) aplicada à latência.
+        corruption: Probabilidade (0-1) de corromper um frame enviado.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    corruption: float = 0.0
+
+    def delay(self, rng: random.Random) -> float:
+        """Sorteia o atraso de uma resposta."""
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+
+
+@dataclass
+class PanelStats:
+    """Contadores de uma central simulada."""
+
+    commands: int = 0
+    acks: int = 0
+    nacks: int = 0
+    status_replies: int = 0
+    heartbeats: int = 0
+    corrupted: int = 0
+    nack_codes: dict[int, int] = field(default_factory=dict)
+
+    def merge(self, other: "PanelStats") -> None:
+        """Soma os contadores de outra central."""
+        self.commands += other.commands
+        self.acks += other.acks
+        self.nacks += other.nacks
+        self.status_replies += other.status_replies
+        self.heartbeats += other.heartbeats
+        self.corrupted += other.corrupted
+        for code, count in other.nack_codes.items():
+            self.nack_codes[code] = self.nack_codes.get(code, 0) + count
+
+
+class SimulatedPanel:
+    """Central AMT simulada conectando a um ``AMTServer``.
+
+    Example:
+        ```python
+        panel = SimulatedPanel(CentralModel.AMT_4010, account="1234")
+        await panel.connect("127.0.0.1", 9009)
+        await panel.wait_closed()
+        ```
+    """
+
+    def __init__(
+        self,
+        model: int = CentralModel.AMT_4010,
+        account: str = "1234",
+        mac_suffix: bytes = b"\x00\x00\x01",
+        password: str = "1234",
+        link: LinkProfile | None = None,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        partitions_enabled: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """Inicializa a central simulada.
+
+        Args:
+            model: Modelo emulado (``CentralModel.AMT_2018_E`` ou ``AMT_4010``).
+            account: Conta Contact-ID (4 dígitos hexadecimais).
+            mac_suffix: 3 últimos bytes do MAC.
+            password: Senha aceita nos comandos.
+            link: Qualidade do link (padrão: perfeito).
+            heartbeat_interval: Intervalo entre heartbeats (0 = sem heartbeat).
+            partitions_enabled: Se a central está particionada.
+            seed: Semente do gerador aleatório (jitter, corrupção).
+        """
+        if model not in (CentralModel.AMT_2018_E, CentralModel.AMT_4010):
+            raise ValueError(f"Modelo não suportado: 0x{model:02X}")
+        if len(account) != 4 or len(mac_suffix) != 3:
+            raise ValueError("Conta deve ter 4 dígitos e o MAC 3 bytes")
+
+        self.model = model
+        self.account = account
+        self.mac_suffix = bytes(mac_suffix)
+        self.password = password.encode("ascii")
+        self.link = link or LinkProfile()
+        self.heartbeat_interval = heartbeat_interval
+        self.stats = PanelStats()
+        self._rng = random.Random(seed)
+
+        # Status parcial sempre; completo só na AMT 4010
+        layouts = [PARTIAL_STATUS_LAYOUT]
+        if model == CentralModel.AMT_4010:
+            layouts.append(FULL_STATUS_LAYOUT)
+        self._payloads: dict[int, bytearray] = {}
+        for layout in layouts:
+            payload = bytearray(layout.size)
+            payload[layout.model] = model
+            payload[layout.firmware] = DEFAULT_FIRMWARE
+            payload[layout.partitions_enabled] = 0x01 if partitions_enabled else 0x00
+            self._payloads[layout.size] = payload
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def identity(self) -> str:
+        """Identidade como o servidor a vê (``ConnectionInfo.identity``)."""
+        mac = ":".join(f"{b:02X}" for b in self.mac_suffix)
+        return f"{self.account}-{mac}"
+
+    @property
+    def connected(self) -> bool:
+        """Se a conexão com o servidor está aberta."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    # =========================================================================
+    # Estado
+    # =========================================================================
+
+    def _layouts(self) -> list[tuple[StatusLayout, bytearray]]:
+        """Layouts suportados e o payload de cada um."""
+        return [(STATUS_LAYOUTS[size], payload) for size, payload in self._payloads.items()]
+
+    def set_zone(self, zone: int, open_: bool) -> None:
+        """Abre ou fecha uma zona (aparece no próximo status).
+
+        Args:
+            zone: Número da zona.
+            open_: True para abrir.
+        """
+        for layout, payload in self._layouts():
+            set_bit(payload, layout.open_zones.bit(zone), open_)
+
+    def status_payload(self, size: int) -> bytes | None:
+        """Monta o payload de status com o relógio atual.
+
+        Args:
+            size: 43 (parcial) ou 54 (completo).
+
+        Returns:
+            Payload, ou None se o modelo não suporta o tamanho.
+        """
+        payload = self._payloads.get(size)
+        if payload is None:
+            return None
+        layout = STATUS_LAYOUTS[size]
+
+        # Data/hora logo após o byte de funcionamento (hexadecimal puro)
+        now = datetime.now()
+        clock = layout.functioning + 1
+        payload[clock:clock + 5] = bytes([now.hour, now.minute, now.day, now.month, now.year - 2000])
+        return bytes(payload)
+
+    def _any_zone_open(self) -> bool:
+        """Se há zonas abertas (impede o arme)."""
+        partial = self._payloads[PARTIAL_STATUS_LAYOUT.size]
+        return PARTIAL_STATUS_LAYOUT.open_zones.mask(partial) != 0
+
+    # =========================================================================
+    # Comandos
+    # =========================================================================
+
+    def handle_command(self, frame: ISECNetFrame) -> bytes | int:
+        """Executa um comando ISECMobile recebido do servidor.
+
+        Args:
+            frame: Frame ISECNet 0xE9 com o frame ISECMobile.
+
+        Returns:
+            Payload de status (bytes) ou código de resposta (ACK/NACK).
+        """
+        data = frame.content
+        if (
+            len(data) < len(self.password) + 3
+            or data[0] != ISECMOBILE_FRAME_DELIMITER
+            or data[-1] != ISECMOBILE_FRAME_DELIMITER
+        ):
+            return ResponseCode.NACK_INVALID_PACKET
+
+        inner = data[1:-1]
+        if not inner.startswith(self.password):
+            return ResponseCode.NACK_WRONG_PASSWORD
+
+        command = inner[len(self.password)]
+        content = inner[len(self.password) + 1:]
+
+        if command == CommandCode.STATUS_REQUEST_PARTIAL:
+            return self.status_payload(PARTIAL_STATUS_LAYOUT.size)
+        if command == CommandCode.STATUS_REQUEST:
+            return self.status_payload(FULL_STATUS_LAYOUT.size) or ResponseCode.NACK_INVALID_COMMAND
+        if command in (CommandCode.ACTIVATION, CommandCode.DEACTIVATION):
+            return self._handle_arming(command == CommandCode.ACTIVATION, content)
+        if command == CommandCode.PGM_CONTROL:
+            return self._handle_pgm(content)
+        if command in (CommandCode.SIREN_ON, CommandCode.SIREN_OFF):
+            for layout, payload in self._layouts():
+                layout.set_siren(payload, command == CommandCode.SIREN_ON)
+            return ResponseCode.ACK
+        return ResponseCode.NACK_INVALID_COMMAND
+
+    def _handle_arming(self, arm: bool, content: bytes) -> int:
+        """Arma ou desarma (todas as partições, uma partição ou stay)."""
+        partition: str | None = None
+        if content and content[0] not in (PartitionCode.ALL, PartitionCode.STAY_MODE):
+            try:
+                partition = PartitionCode(content[0]).letter
+            except ValueError:
+                partition = None
+            if partition is None:
+                return ResponseCode.NACK_INVALID_PACKET
+
+            partial = self._payloads[PARTIAL_STATUS_LAYOUT.size]
+            if partial[PARTIAL_STATUS_LAYOUT.partitions_enabled] != 0x01:
+                return ResponseCode.NACK_NOT_PARTITIONED
+            if all(partition not in layout.partitions for layout, _ in self._layouts()):
+                return ResponseCode.NACK_NO_ZONES_IN_PARTITION
+
+        if arm and self._any_zone_open():
+            return ResponseCode.NACK_ZONES_OPEN
+
+        for layout, payload in self._layouts():
+            # Partições C/D só existem no status completo
+            if partition is None or partition in layout.partitions:
+                layout.set_armed(payload, partition, arm)
+        return ResponseCode.ACK
+
+    def _handle_pgm(self, content: bytes) -> int:
+        """Liga ou desliga uma PGM."""
+        if len(content) != 2 or content[0] not in (PGMAction.TURN_ON, PGMAction.TURN_OFF):
+            return ResponseCode.NACK_INVALID_PACKET
+
+        number = content[1] - 0x30
+        layouts = [(layout, payload) for layout, payload in self._layouts() if number in layout.pgm]
+        if not layouts:
+            return ResponseCode.NACK_INVALID_COMMAND
+
+        for layout, payload in layouts:
+            set_bit(payload, layout.pgm[number], content[0] == PGMAction.TURN_ON)
+        return ResponseCode.ACK
+
+    # =========================================================================
+    # Rede
+    # =========================================================================
+
+    def identification_frame(self) -> ISECNetFrame:
+        """Frame 0x94 com conta e MAC, enviado logo após conectar."""
+        account = int(self.account, 16).to_bytes(2, "big")
+        return ISECNetFrame(
+            command=CONNECTION_INFO_COMMAND,
+            content=bytes([ConnectionChannel.ETHERNET.value]) + account + self.mac_suffix,
+        )
+
+    async def connect(self, host: str, port: int) -> None:
+        """Conecta ao servidor, se identifica e começa a atender comandos.
+
+        Args:
+            host: Endereço do servidor.
+            port: Porta do servidor.
+        """
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+        await self._send(self.identification_frame().build())
+
+        self._tasks.append(asyncio.create_task(self._read_loop()))
+        if self.heartbeat_interval > 0:
+            self._tasks.append(asyncio.create_task(self._heartbeat_loop()))
+
+    async def wait_closed(self) -> None:
+        """Aguarda até o servidor encerrar a conexão."""
+        if self._tasks:
+            await self._tasks[0]
+
+    async def close(self) -> None:
+        """Encerra a conexão."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+            self._writer = None
+
+    async def _send(self, data: bytes) -> None:
+        """Envia bytes, corrompendo o frame de acordo com o ``LinkProfile``."""
+        if self._writer is None:
+            return
+        if self.link.corruption and self._rng.random() < self.link.corruption:
+            corrupted = bytearray(data)
+            corrupted[self._rng.randrange(len(corrupted))] ^= 1 << self._rng.randrange(8)
+            data = bytes(corrupted)
+            self.stats.corrupted += 1
+        self._writer.write(data)
+        await self._writer.drain()
+
+    async def _heartbeat_loop(self) -> None:
+        """Envia heartbeats periódicos (1 byte 0xF7)."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            self.stats.heartbeats += 1
+            await self._send(bytes([ISECNET_COMMAND_HEARTBEAT]))
+
+    async def _read_loop(self) -> None:
+        """Lê os frames do servidor e responde aos comandos, um por vez."""
+        assert self._reader is not None
+        frame_reader = ISECNetFrameReader()
+
+        try:
+            while data := await self._reader.read(1024):
+                for frame in frame_reader.feed(data):
+                    if not frame.is_mobile_command:
+                        # ACKs do servidor (heartbeat, identificação)
+                        continue
+                    await self._reply(frame)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            logger.debug(f"Central simulada {self.identity} desconectada: {e}")
+
+    async def _reply(self, frame: ISECNetFrame) -> None:
+        """Responde a um comando após a latência simulada."""
+        self.stats.commands += 1
+        result = self.handle_command(frame)
+
+        if isinstance(result, bytes):
+            self.stats.status_replies += 1
+            content = result
+        elif result == ResponseCode.ACK:
+            self.stats.acks += 1
+            content = bytes([result])
+        else:
+            self.stats.nacks += 1
+            self.stats.nack_codes[result] = self.stats.nack_codes.get(result, 0) + 1
+            content = bytes([result])
+
+        delay = self.link.delay(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+        await self._send(ISECNetFrame.create_mobile_frame(content).build())
+
+    def __repr__(self) -> str:
+        return (
+            f"SimulatedPanel(model={CentralModel.get_name(self.model)}, "
+            f"identity='{self.identity}')"
+        )
@@ -0,0 +1 @@
+"""Testes da biblioteca ISECNet/ISECMobile."""
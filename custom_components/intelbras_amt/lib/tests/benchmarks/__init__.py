@@ -0,0 +1 @@
+"""Benchmarks da camada de protocolo (pytest-benchmark)."""
@@ -0,0 +1,106 @@
+"""Fixtures dos benchmarks: payloads e streams representativos.
+
+Os payloads de status vêm de uma central simulada (``lib.simulator``),
+com zonas abertas, partição armada e PGM ligada, para que os parsers
+percorram os mesmos caminhos de uma central real.
+
+Os streams misturam o tráfego típico de uma conexão: heartbeats, ACKs,
+eventos Contact-ID (0xB0) e respostas de status de 43/54 bytes.
+"""
+
+import random
+
+import pytest
+
+from ...const import CentralModel, ISECNET_COMMAND_EVENT, ISECNET_COMMAND_HEARTBEAT
+from ...protocol.commands.status import FULL_STATUS_LAYOUT, PARTIAL_STATUS_LAYOUT
+from ...protocol.isecnet import ISECNetFrame
+from ...simulator import SimulatedPanel
+
+
+STREAM_REPEAT = 50
+"""Repetições do bloco de tráfego em cada stream (~5 KB)."""
+
+SEED = 0xA317
+"""Semente fixa: fragmentação e ruído iguais entre execuções."""
+
+EVENT_CONTENT = bytes([0x01, 0x02, 0x03, 0x04, 0x01, 0x01, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05])
+"""Evento Contact-ID (13 dígitos): conta 1234, disparo (130) da zona 5 na partição 1."""
+
+
+def _panel() -> SimulatedPanel:
+    """AMT 4010 com zonas abertas, armada e com PGM 1 ligada."""
+    panel = SimulatedPanel(CentralModel.AMT_4010, partitions_enabled=True, heartbeat_interval=0)
+    for layout, payload in panel._layouts():
+        layout.set_armed(payload, "A", True)
+        layout.set_siren(payload, True)
+    for zone in (1, 5, 12, 17):
+        panel.set_zone(zone, True)
+    return panel
+
+
+@pytest.fixture(scope="session")
+def full_status_payload() -> bytes:
+    """Payload do status completo (54 bytes)."""
+    return _panel().status_payload(FULL_STATUS_LAYOUT.size)
+
+
+@pytest.fixture(scope="session")
+def partial_status_payload() -> bytes:
+    """Payload do status parcial (43 bytes)."""
+    return _panel().status_payload(PARTIAL_STATUS_LAYOUT.size)
+
+
+@pytest.fixture(scope="session")
+def status_frame(full_status_payload: bytes) -> bytes:
+    """Resposta de status completo já enquadrada (0xE9)."""
+    return ISECNetFrame.create_mobile_frame(full_status_payload).build()
+
+
+@pytest.fixture(scope="session")
+def clean_stream(full_status_payload: bytes, partial_status_payload: bytes) -> bytes:
+    """Tráfego típico, sem ruído, em um único buffer."""
+    block = b"".join([
+        bytes([ISECNET_COMMAND_HEARTBEAT]),
+        ISECNetFrame.create_ack_response().build(),
+        ISECNetFrame(command=ISECNET_COMMAND_EVENT, content=EVENT_CONTENT).build(),
+        ISECNetFrame.create_mobile_frame(partial_status_payload).build(),
+        ISECNetFrame.create_mobile_frame(full_status_payload).build(),
+    ])
+    return block * STREAM_REPEAT
+
+
+@pytest.fixture(scope="session")
+def clean_stream_frames() -> int:
+    """Número de frames no stream limpo."""
+    return 5 * STREAM_REPEAT
+
+
+@pytest.fixture(scope="session")
+def fragmented_stream(clean_stream: bytes) -> list[bytes]:
+    """O stream limpo em pedaços de 1 a 16 bytes, como leituras TCP curtas."""
+    rng = random.Random(SEED)
+    chunks: list[bytes] = []
+    position = 0
+    while position < len(clean_stream):
+        size = rng.randint(1, 16)
+        chunks.append(clean_stream[position:position + size])
+        position += size
+    return chunks
+
+
+@pytest.fixture(scope="session")
+def noisy_stream(clean_stream: bytes) -> bytes:
+    """O stream limpo com ~5% de bytes aleatórios inseridos em posições aleatórias.
+
+    O lixo no meio de um frame o invalida, forçando o leitor a descartar
+    byte a byte até ressincronizar.
+    """
+    rng = random.Random(SEED)
+    noisy = bytearray()
+    for byte in clean_stream:
+        if rng.random() < 0.05:
+            # Evita 0xF7, que seria lido como heartbeat válido
+            noisy.append(rng.choice([b for b in range(256) if b != ISECNET_COMMAND_HEARTBEAT]))
+        noisy.append(byte)
+    return bytes(noisy)
@@ -0,0 +1,27 @@
+"""Benchmarks do checksum ISECNet e do CRC16."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ...protocol.checksum import CRC16, Checksum
+
+
+@pytest.mark.benchmark(group="checksum")
+def test_checksum_calculate(benchmark, status_frame):
+    benchmark(Checksum.calculate, status_frame[:-1])
+
+
+@pytest.mark.benchmark(group="checksum")
+def test_checksum_validate_packet(benchmark, status_frame):
+    assert benchmark(Checksum.validate_packet, status_frame)
+
+
+@pytest.mark.benchmark(group="checksum")
+def test_crc16_calculate(benchmark, status_frame):
+    benchmark(CRC16.calculate, status_frame)
+
+
+@pytest.mark.benchmark(group="checksum")
+def test_crc16_validate_packet(benchmark, status_frame):
+    assert benchmark(CRC16.validate_packet, CRC16.append(status_frame))
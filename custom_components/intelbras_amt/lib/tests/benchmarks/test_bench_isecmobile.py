@@ -0,0 +1,30 @@
+"""Benchmarks do frame ISECMobile (comandos enviados à central)."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ...const import CommandCode, PartitionCode
+from ...protocol.isecmobile import ISECMobileFrame
+
+
+@pytest.mark.benchmark(group="isecmobile")
+def test_create(benchmark):
+    frame = benchmark(
+        ISECMobileFrame.create, "123456", CommandCode.ACTIVATION, bytes([PartitionCode.PARTITION_A])
+    )
+    assert frame.command_code == CommandCode.ACTIVATION
+
+
+@pytest.mark.benchmark(group="isecmobile")
+def test_build(benchmark):
+    frame = ISECMobileFrame.create("123456", CommandCode.ACTIVATION, bytes([PartitionCode.PARTITION_A]))
+    data = benchmark(frame.build)
+    assert data[0] == data[-1] == 0x21
+
+
+@pytest.mark.benchmark(group="isecmobile")
+def test_parse(benchmark):
+    data = ISECMobileFrame.create("123456", CommandCode.ACTIVATION, bytes([PartitionCode.PARTITION_A])).build()
+    frame = benchmark(ISECMobileFrame.parse, data)
+    assert frame.password_str == "123456"
@@ -0,0 +1,47 @@
+"""Benchmarks do enquadramento ISECNet e do leitor de stream."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ...protocol.isecnet import ISECNetFrame, ISECNetFrameReader
+
+
+def _read_all(chunks: list[bytes]) -> int:
+    """Alimenta um leitor novo com todos os pedaços e conta os frames."""
+    reader = ISECNetFrameReader()
+    return sum(len(reader.feed(chunk)) for chunk in chunks)
+
+
+@pytest.mark.benchmark(group="isecnet-reader")
+def test_reader_clean_stream(benchmark, clean_stream, clean_stream_frames):
+    """Stream inteiro em uma única leitura."""
+    frames = benchmark(_read_all, [clean_stream])
+    assert frames == clean_stream_frames
+
+
+@pytest.mark.benchmark(group="isecnet-reader")
+def test_reader_fragmented_stream(benchmark, fragmented_stream, clean_stream_frames):
+    """Stream em leituras de 1 a 16 bytes."""
+    frames = benchmark(_read_all, fragmented_stream)
+    assert frames == clean_stream_frames
+
+
+@pytest.mark.benchmark(group="isecnet-reader")
+def test_reader_noisy_stream(benchmark, noisy_stream, clean_stream_frames):
+    """Stream com lixo no meio dos frames (ressincronização byte a byte)."""
+    frames = benchmark(_read_all, [noisy_stream])
+    assert 0 < frames < clean_stream_frames
+
+
+@pytest.mark.benchmark(group="isecnet-frame")
+def test_frame_build(benchmark, full_status_payload):
+    frame = ISECNetFrame.create_mobile_frame(full_status_payload)
+    data = benchmark(frame.build)
+    assert len(data) == len(full_status_payload) + 3
+
+
+@pytest.mark.benchmark(group="isecnet-frame")
+def test_frame_parse(benchmark, status_frame):
+    frame = benchmark(ISECNetFrame.parse, status_frame)
+    assert frame.is_mobile_command
@@ -0,0 +1,45 @@
+"""Benchmarks do parsing de respostas e dos dois formatos de status."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ...const import ResponseCode
+from ...protocol.commands.status import CentralStatus, PartialCentralStatus
+from ...protocol.isecnet import ISECNetFrame
+from ...protocol.responses import Response, ResponseType
+
+
+@pytest.mark.benchmark(group="response")
+def test_response_ack(benchmark):
+    frame = ISECNetFrame.create_ack_response()
+    response = benchmark(Response.from_isecnet_frame, frame)
+    assert response.response_type == ResponseType.ACK
+
+
+@pytest.mark.benchmark(group="response")
+def test_response_nack(benchmark):
+    frame = ISECNetFrame.create_mobile_frame(bytes([ResponseCode.NACK_WRONG_PASSWORD]))
+    response = benchmark(Response.from_isecnet_frame, frame)
+    assert response.response_type == ResponseType.NACK
+
+
+@pytest.mark.benchmark(group="response")
+def test_response_status(benchmark, full_status_payload):
+    frame = ISECNetFrame.create_mobile_frame(full_status_payload)
+    response = benchmark(Response.from_isecnet_frame, frame)
+    assert response.response_type == ResponseType.DATA
+
+
+@pytest.mark.benchmark(group="status")
+def test_full_status_parse(benchmark, full_status_payload):
+    status = benchmark(CentralStatus.parse, full_status_payload)
+    assert status.armed
+    assert 5 in status.zones.open_zones
+
+
+@pytest.mark.benchmark(group="status")
+def test_partial_status_parse(benchmark, partial_status_payload):
+    status = benchmark(PartialCentralStatus.parse, partial_status_payload)
+    assert status.armed
+    assert 5 in status.zones.open_zones
@@ -0,0 +1,34 @@
+"""Testes da máscara de senha da captura de tráfego."""
+
+import pytest
+
+from ..protocol.commands import PGMCommand
+from ..protocol.isecmobile import ISECMobileFrame
+from ..protocol.isecnet import ISECNetFrame
+from ..server.capture import mask_password
+
+
+@pytest.mark.parametrize("password", ["1234", "123456"])
+def test_mask_password(password):
+    sent = PGMCommand.turn_on(password, 1).build_net_frame().build()
+    masked = mask_password(sent)
+    assert password.encode() not in masked
+    assert len(masked) == len(sent)
+
+    # Continua um frame válido, com o mesmo comando e conteúdo
+    mobile = ISECMobileFrame.parse(ISECNetFrame.parse(masked).content)
+    assert mobile.password == b"*" * len(password)
+    assert mobile.command_code == 0x50
+    assert mobile.content == bytes([0x4C, 0x31])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        ISECNetFrame.create_heartbeat().build(),
+        ISECNetFrame.create_ack_response().build(),
+        ISECNetFrame.create_simple_ack().build(),
+    ],
+)
+def test_non_command_untouched(data):
+    assert mask_password(data) == data
@@ -0,0 +1,60 @@
+"""Testes da execução de scripts do console com várias centrais."""
+
+import asyncio
+import socket
+
+from ..console import AMTConsole
+from ..const import CentralModel
+from ..profiling import Profiler
+from ..protocol.commands import PARTIAL_STATUS_LAYOUT
+from ..server import AMTServer, AMTServerConfig
+from ..simulator import SimulatedPanel
+
+
+async def _lines(*lines: str):
+    for line in lines:
+        yield line
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _pgm_on(panel: SimulatedPanel, number: int) -> bool:
+    offset, mask = PARTIAL_STATUS_LAYOUT.pgm[number]
+    return bool(panel.status_payload(PARTIAL_STATUS_LAYOUT.size)[offset] & mask)
+
+
+async def _run_script(tmp_path, *lines: str) -> list[SimulatedPanel]:
+    port = _free_port()
+    server = AMTServer(AMTServerConfig(host="127.0.0.1", port=port))
+    console = AMTConsole(server, "1234", Profiler(str(tmp_path)))
+    panels = [
+        SimulatedPanel(
+            CentralModel.AMT_2018_E,
+            account=f"000{n}",
+            mac_suffix=bytes([0, 0, n]),
+            heartbeat_interval=0,
+        )
+        for n in (1, 2, 3)
+    ]
+    await server.start()
+    try:
+        for panel in panels:
+            await panel.connect("127.0.0.1", port)
+        while sum("connection_info" in c.metadata for c in server.connections) < len(panels):
+            await asyncio.sleep(0.01)
+        await console.run_script(_lines(*lines))
+    finally:
+        for panel in panels:
+            await panel.close()
+        await server.stop()
+    return panels
+
+
+def test_script_keeps_order_per_panel(tmp_path):
+    # O comando para todas entra na fila de cada central antes do seguinte
+    panels = asyncio.run(_run_script(tmp_path, "pgm 1 on all", "pgm 1 off 0002"))
+    assert [_pgm_on(panel, 1) for panel in panels] == [True, False, True]
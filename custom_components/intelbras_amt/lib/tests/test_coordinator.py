@@ -0,0 +1,82 @@
+"""Testes da consulta de verificação do coordinator após um comando."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant
+
+from ... import coordinator as coordinator_module
+from ...coordinator import AMTCoordinator
+from ..const import CentralModel, ISECNET_COMMAND_MOBILE, CommandCode, ResponseCode
+from ..metrics import ServerMetrics
+from ..protocol.commands import PGMCommand
+from ..protocol.isecnet import ISECNetFrame
+from ..protocol.responses import Response
+from ..server.connection_manager import ConnectionManager
+from ..simulator import SimulatedPanel
+
+
+VERIFY_DELAY = timedelta(seconds=0.05)
+"""Atraso da verificação nos testes (o real é de 3 s)."""
+
+
+class FakeServer:
+    """Servidor que responde com uma central simulada, sem rede.
+
+    A central confirma (ACK) os comandos de PGM sem ligar a saída, como uma
+    PGM que não obedeceu: só a consulta de verificação mostra o estado real.
+    """
+
+    def __init__(self) -> None:
+        self.panel = SimulatedPanel(CentralModel.AMT_2018_E, heartbeat_interval=0)
+        self.connections = ConnectionManager()
+        self.metrics = ServerMetrics(self.connections)
+        self.status_requests = 0
+
+    async def send_command(self, connection_id, frame, wait_response=True):
+        command = frame.content[1 + len(self.panel.password)]
+        if command == CommandCode.PGM_CONTROL:
+            result = ResponseCode.ACK
+        else:
+            self.status_requests += 1
+            result = self.panel.handle_command(frame)
+        content = result if isinstance(result, bytes) else bytes([result])
+        return Response.from_isecnet_frame(ISECNetFrame(command=ISECNET_COMMAND_MOBILE, content=content))
+
+    def queued_commands(self, connection_id):
+        return 0
+
+
+async def _run_command(config_dir) -> tuple[FakeServer, AMTCoordinator, list[bool]]:
+    hass = HomeAssistant(str(config_dir))
+    server = FakeServer()
+    coordinator = AMTCoordinator(hass, server, "sim", "1234", "entry")
+    # Com uma entidade ouvindo, o HA mantém o timer da consulta periódica armado
+    remove_listener = coordinator.async_add_listener(lambda: None)
+    await coordinator.async_refresh()
+    assert server.status_requests == 1
+
+    states = [coordinator.data.pgm.is_on(1)]
+    assert await coordinator.async_execute_command(PGMCommand.turn_on("1234", 1), "ligar PGM 1")
+    states.append(coordinator.data.pgm.is_on(1))
+
+    await asyncio.sleep(VERIFY_DELAY.total_seconds() * 4)
+    states.append(coordinator.data.pgm.is_on(1))
+    remove_listener()
+    await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
+    return server, coordinator, states
+
+
+def test_verification_poll_after_ack(tmp_path, monkeypatch):
+    monkeypatch.setattr(coordinator_module, "VERIFY_DELAY", VERIFY_DELAY)
+    server, coordinator, states = asyncio.run(_run_command(tmp_path))
+
+    # Previsão publicada na hora, desfeita pela consulta de verificação
+    assert server.status_requests == 2
+    assert states == [False, True, False]
+    assert coordinator.merged_refresh_requests == 0
@@ -0,0 +1,39 @@
+"""Testes dos eventos Contact-ID (0xB0) aplicados sobre o status."""
+
+import pytest
+
+from ..protocol.commands import PartialCentralStatus
+from ..protocol.events import PanelEvent
+
+
+ALARM = bytes.fromhex("01 02 03 04 01 01 03 00 00 01 00 00 05")
+"""Exemplo da documentação do módulo: disparo (E130) da zona 5, partição A."""
+
+ALARM_RESTORE = bytes.fromhex("01 02 03 04 03 01 03 00 00 01 00 00 05")
+
+
+def test_parse_documented_example():
+    event = PanelEvent.parse(ALARM)
+    assert (event.account, event.qualifier, event.code, event.partition, event.zone) == ("1234", 1, 130, 1, 5)
+    assert event.is_alarm
+
+
+def test_alarm_sets_violated_and_triggered_only():
+    status = PartialCentralStatus.parse(PanelEvent.parse(ALARM).apply_to(bytes(43)))
+    assert status.triggered
+    assert status.zones.violated_zones == {5}
+    assert not status.zones.open_zones
+
+
+def test_alarm_restore_requires_poll():
+    triggered = PanelEvent.parse(ALARM).apply_to(bytes(43))
+    assert PanelEvent.parse(ALARM_RESTORE).apply_to(triggered) is None
+
+
+@pytest.mark.parametrize("code", [120, 121, 122])
+def test_user_alarm_requires_poll(code):
+    # Pânico/coação do usuário 3: o campo zona é o usuário, não a zona 3
+    digits = [0x01, 0x02, 0x03, 0x04, 0x01, *(int(d) for d in str(code)), 0x00, 0x01, 0x00, 0x00, 0x03]
+    event = PanelEvent.parse(bytes(digits))
+    assert event.is_alarm and not event.is_zone_alarm
+    assert event.apply_to(bytes(43)) is None
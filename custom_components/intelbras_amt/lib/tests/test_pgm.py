@@ -0,0 +1,32 @@
+"""Testes do comando de controle PGM (0x50)."""
+
+import pytest
+
+from ..const import PGMOutput
+from ..protocol.commands import PGMCommand
+
+
+@pytest.mark.parametrize(
+    ("number", "output"),
+    [(1, PGMOutput.PGM_1), (19, PGMOutput.PGM_19)],
+)
+def test_turn_on_off_by_number(number, output):
+    # Os switches do HA passam o número da PGM (1-19), não o enum
+    on = PGMCommand.turn_on("1234", number)
+    off = PGMCommand.turn_off("1234", number)
+    assert on.output == off.output == output
+    assert on.output_number == off.output_number == number
+    assert on.build_content() == bytes([0x4C, output.value])
+    assert off.build_content() == bytes([0x44, output.value])
+
+
+def test_documented_frame():
+    # Exemplo da documentação: ligar PGM 1 com senha 1234
+    frame = PGMCommand.turn_on("1234", 1).build_net_frame().build()
+    assert frame == bytes.fromhex("0A E9 21 31 32 33 34 50 4C 31 21 35")
+
+
+@pytest.mark.parametrize("number", [0, 20])
+def test_invalid_number(number):
+    with pytest.raises(ValueError):
+        PGMCommand.turn_on("1234", number)
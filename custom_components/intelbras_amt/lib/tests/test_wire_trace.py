@@ -0,0 +1,25 @@
+"""Testes do trace de frames do servidor."""
+
+from ..protocol.commands import PGMCommand
+from ..server.wire_trace import WireDirection, WireTrace
+
+
+def test_tx_password_masked():
+    trace = WireTrace()
+    trace.enable()
+    sent = PGMCommand.turn_on("1234", 1).build_net_frame().build()
+    trace.record("c1", WireDirection.TX, sent[1], sent)
+
+    (record,) = trace.records()
+    assert b"1234" not in record.data
+    assert "31 32 33 34" not in next(trace.format())
+
+
+def test_disable_one_while_tracing_all():
+    trace = WireTrace()
+    trace.enable()
+    trace.disable("c2")
+    trace.record("c1", WireDirection.RX, 0xF7, b"")
+    trace.record("c2", WireDirection.RX, 0xF7, b"")
+    assert [record.connection_id for record in trace.records()] == ["c1"]
+    assert trace.active
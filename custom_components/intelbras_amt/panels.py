@@ -0,0 +1,259 @@
+"""Coordinators por central, para várias centrais na mesma porta.
+
+Cada central que conecta ao servidor é identificada pelo comando 0x94
+(conta + MAC parcial) e ganha o seu próprio coordinator, com consulta
+periódica, dispositivo e entidades independentes. Se a central não se
+identificar em ``IDENTIFY_TIMEOUT``, o IP da conexão é usado no lugar.
+
+A primeira central vista fica com o coordinator principal da entry (IDs
+legados, ``<entry_id>_...``), então instalações com uma central só não
+mudam. As demais ganham IDs ``<entry_id>_<identidade>_...`` e são
+lembradas entre reinícios.
+"""
+
+import logging
+import os
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .const import DOMAIN, HISTORY_MAX_SEGMENTS, STORAGE_KEY, STORAGE_VERSION
+from .coordinator import AMTCoordinator
+from .lib.history import SnapshotLogRecorder, SnapshotLogWriter
+from .lib.server import AMTServer
+from .lib.server.connection_manager import AMTConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+IDENTIFY_TIMEOUT = 10.0
+"""Espera (segundos) pelo comando 0x94 antes de identificar a central pelo IP."""
+
+PanelCallback = Callable[[AMTCoordinator], None]
+
+
+def _panels_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Store com as centrais conhecidas da entry."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}.panels")
+
+
+async def async_remove_panel_storage(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove os dados persistidos de todas as centrais da entry.
+
+    Args:
+        hass: Instância do Home Assistant.
+        entry_id: ID da config entry removida.
+    """
+    store = _panels_store(hass, entry_id)
+    data = await store.async_load() or {}
+    for key in data.get("known", []):
+        coordinator_store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}_{slugify(key)}"
+        )
+        await coordinator_store.async_remove()
+    await store.async_remove()
+
+
+class AMTPanelManager:
+    """Mantém um coordinator por central conectada ao servidor."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        server: AMTServer,
+        primary: AMTCoordinator,
+        history_directory: str | None = None,
+    ) -> None:
+        """Inicializa o gerenciador.
+
+        Args:
+            hass: Instância do Home Assistant.
+            entry: Config entry.
+            server: Servidor AMT compartilhado pelas centrais.
+            primary: Coordinator principal da entry (IDs legados).
+            history_directory: Diretório do histórico da central principal
+                (None = histórico desligado). Cada central adicional grava
+                num subdiretório com a sua identidade.
+        """
+        self.hass = hass
+        self.entry = entry
+        self.server = server
+        self.primary = primary
+        self.history_directory = history_directory
+        self._primary_key: str | None = None
+        """Identidade da central atendida pelo coordinator principal."""
+        self._coordinators: dict[str, AMTCoordinator] = {}
+        """Coordinators por identidade da central (inclui o principal)."""
+        self._pending: dict[str, CALLBACK_TYPE] = {}
+        """Conexões aguardando o 0x94 -> cancela o timeout de identificação."""
+        self._store = _panels_store(hass, entry.entry_id)
+        self.signal_new_panel = f"{DOMAIN}_new_panel_{entry.entry_id}"
+        """Sinal do dispatcher enviado com o coordinator de uma nova central."""
+
+    @property
+    def coordinators(self) -> list[AMTCoordinator]:
+        """Todos os coordinators, o principal primeiro."""
+        secondary = [c for c in self._coordinators.values() if c is not self.primary]
+        return [self.primary, *secondary]
+
+    def coordinator_for(self, connection_id: str) -> AMTCoordinator | None:
+        """Coordinator ligado a uma conexão, None se ainda não identificada."""
+        for coordinator in self.coordinators:
+            if coordinator.connection_id == connection_id:
+                return coordinator
+        return None
+
+    async def async_load(self) -> None:
+        """Recria os coordinators das centrais vistas em execuções anteriores.
+
+        Assim as entidades das centrais adicionais existem (indisponíveis)
+        desde o início, antes de a central conectar.
+        """
+        data = await self._store.async_load() or {}
+        self._primary_key = data.get("primary")
+        if self._primary_key:
+            self._coordinators[self._primary_key] = self.primary
+
+        for key in data.get("known", []):
+            if key not in self._coordinators:
+                await self._async_create_coordinator(key)
+
+    @callback
+    def async_add_panel_listener(self, add_panel: PanelCallback) -> CALLBACK_TYPE:
+        """Chama ``add_panel`` para cada central, atual e futura.
+
+        Usado pelas plataformas para criar as entidades de cada central.
+
+        Args:
+            add_panel: Função que recebe o coordinator da central.
+
+        Returns:
+            Função que cancela o registro para centrais futuras.
+        """
+        for coordinator in self.coordinators:
+            add_panel(coordinator)
+        return async_dispatcher_connect(self.hass, self.signal_new_panel, add_panel)
+
+    async def async_connected(self, connection: AMTConnection) -> None:
+        """Aguarda a identificação (0x94) de uma nova conexão."""
+        self._pending[connection.id] = async_call_later(
+            self.hass,
+            IDENTIFY_TIMEOUT,
+            partial(self._async_identify_timeout, connection.id),
+        )
+
+    async def async_identified(self, connection: AMTConnection) -> None:
+        """Liga a conexão ao coordinator da central identificada."""
+        info = connection.metadata.get("connection_info")
+        if info is None:
+            return
+        if unsub := self._pending.pop(connection.id, None):
+            unsub()
+        await self._async_attach(connection, info.identity)
+
+    async def _async_identify_timeout(self, connection_id: str, _now: datetime) -> None:
+        """Identifica pelo IP a central que não enviou o 0x94."""
+        self._pending.pop(connection_id, None)
+        connection = self.server.connections.get(connection_id)
+        if connection is None:
+            return
+        _LOGGER.warning(
+            f"Central {connection_id} não se identificou (0x94), usando o IP {connection.host}"
+        )
+        await self._async_attach(connection, f"ip-{connection.host}")
+
+    async def async_disconnected(self, connection: AMTConnection) -> AMTCoordinator | None:
+        """Desliga o coordinator da conexão encerrada.
+
+        Returns:
+            Coordinator que estava ligado à conexão, se havia.
+        """
+        if unsub := self._pending.pop(connection.id, None):
+            unsub()
+        coordinator = self.coordinator_for(connection.id)
+        if coordinator is not None:
+            coordinator.async_detach()
+        return coordinator
+
+    async def _async_attach(self, connection: AMTConnection, key: str) -> None:
+        """Liga uma conexão ao coordinator da central ``key``, criando se preciso."""
+        coordinator = self._coordinators.get(key)
+
+        if coordinator is None and self._primary_key is None:
+            # Primeira central vista fica com o coordinator principal
+            _LOGGER.info(f"Central {key} associada ao dispositivo principal")
+            self._primary_key = key
+            coordinator = self._coordinators[key] = self.primary
+            self._save()
+        elif coordinator is None:
+            _LOGGER.info(f"Nova central {key}, criando dispositivo")
+            coordinator = await self._async_create_coordinator(key)
+            self._save()
+            async_dispatcher_send(self.hass, self.signal_new_panel, coordinator)
+
+        if coordinator.connection_id == connection.id:
+            return
+        if coordinator.connection_id is not None:
+            _LOGGER.warning(
+                f"Central {key} conectou de novo ({connection.id}), "
+                f"substituindo a conexão {coordinator.connection_id}"
+            )
+        coordinator.connection_id = connection.id
+        await coordinator.async_request_refresh()
+
+    async def _async_create_coordinator(self, key: str) -> AMTCoordinator:
+        """Cria o coordinator de uma central adicional."""
+        coordinator = AMTCoordinator(
+            hass=self.hass,
+            server=self.server,
+            connection_id=None,
+            password=self.primary.password,
+            entry_id=self.entry.entry_id,
+            refresh_window=self.primary.refresh_window,
+            panel_key=key,
+        )
+        await coordinator.async_load_storage()
+        if self.history_directory is not None:
+            coordinator.history = SnapshotLogRecorder(
+                SnapshotLogWriter(
+                    os.path.join(self.history_directory, slugify(key)),
+                    max_segments=HISTORY_MAX_SEGMENTS,
+                )
+            )
+            coordinator.history.start()
+        self._coordinators[key] = coordinator
+        return coordinator
+
+    def _save(self) -> None:
+        """Salva as centrais conhecidas."""
+        self._store.async_delay_save(self._store_data, 1)
+
+    def _store_data(self) -> dict[str, Any]:
+        """Dados persistidos no Store."""
+        return {
+            "primary": self._primary_key,
+            "known": [key for key in self._coordinators if key != self._primary_key],
+        }
+
+    async def async_shutdown(self) -> None:
+        """Cancela as identificações pendentes e encerra os coordinators adicionais.
+
+        Grava também os snapshots pendentes do histórico das centrais adicionais
+        (o da principal é encerrado por ``async_unload_entry``).
+        """
+        for unsub in self._pending.values():
+            unsub()
+        self._pending.clear()
+        for coordinator in self.coordinators:
+            if coordinator is not self.primary:
+                await coordinator.async_shutdown()
+                if coordinator.history is not None:
+                    await coordinator.history.stop()
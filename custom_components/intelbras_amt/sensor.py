@@ -1,19 +1,26 @@
 """Sensors para informações de status da central."""
 
 import logging
-from datetime import datetime
-from typing import Any
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable
 from zoneinfo import ZoneInfo
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.util import dt as dt_util
 
 from .coordinator import AMTCoordinator
-from .const import DOMAIN
+from .entity import AMTEntity
+from .panels import AMTPanelManager
+from .const import DOMAIN, CONF_AGGREGATE_ZONES, DEFAULT_AGGREGATE_ZONES
+from .zones import ZONE_TYPES
+from .lib.metrics import ServerMetrics
+from .lib.protocol.commands import STATUS_LAYOUTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,23 +31,71 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Configura os sensors."""
-    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    panels: AMTPanelManager = hass.data[DOMAIN][entry.entry_id]["panels"]
+    aggregate = entry.options.get(CONF_AGGREGATE_ZONES, DEFAULT_AGGREGATE_ZONES)
     
-    entities: list[SensorEntity] = [
-        AMTModelSensor(coordinator, entry),
-        AMTFirmwareSensor(coordinator, entry),
-        AMTDateTimeSensor(coordinator, entry),
-        AMTZonesOpenSensor(coordinator, entry),
-        AMTZonesViolatedSensor(coordinator, entry),
-        AMTZonesBypassedSensor(coordinator, entry),
-        AMTSirenStatusSensor(coordinator, entry),
-        AMTArmedStatusSensor(coordinator, entry),
-    ]
+    @callback
+    def async_add_panel(coordinator: AMTCoordinator) -> None:
+        """Cria os sensors de uma central."""
+        entities: list[SensorEntity] = [
+            AMTModelSensor(coordinator, entry),
+            AMTFirmwareSensor(coordinator, entry),
+            AMTDateTimeSensor(coordinator, entry),
+            AMTZonesOpenSensor(coordinator, entry),
+            AMTZonesViolatedSensor(coordinator, entry),
+            AMTZonesBypassedSensor(coordinator, entry),
+            AMTSirenStatusSensor(coordinator, entry),
+            AMTArmedStatusSensor(coordinator, entry),
+        ]
+        
+        # Modo agregado: um sensor por categoria de zona no lugar dos binary sensors
+        if aggregate:
+            entities.extend(
+                AMTZoneMapSensor(coordinator, entry, zone_type, name)
+                for zone_type, name in ZONE_MAP_NAMES.items()
+            )
+        
+        # Métricas são do servidor (todas as centrais da entry): só na principal
+        if coordinator.panel_key is None:
+            entities.extend(
+                AMTMetricSensor(coordinator, entry, key, name, icon, value)
+                for key, (name, icon, value) in METRIC_SENSORS.items()
+            )
+            entities.append(AMTCommandLatencySensor(coordinator, entry))
+        
+        async_add_entities(entities)
     
-    async_add_entities(entities)
+    entry.async_on_unload(panels.async_add_panel_listener(async_add_panel))
+
+
+ZONE_MAP_NAMES: dict[str, str] = {
+    "aberta": "Mapa de Zonas Abertas",
+    "violada": "Mapa de Zonas Violadas",
+    "bypass": "Mapa de Zonas em Bypass",
+    "tamper": "Mapa de Zonas com Tamper",
+    "curto_circuito": "Mapa de Zonas em Curto-Circuito",
+    "bateria_baixa": "Mapa de Zonas com Bateria Baixa",
+}
+"""Tipo de zona -> nome do sensor de mapa de zonas (modo agregado)."""
 
+METRIC_SENSORS: dict[str, tuple[str, str, Callable[[ServerMetrics], int]]] = {
+    "frames_recebidos": ("Frames Recebidos", "mdi:download-network", lambda m: int(m.frames_received.total)),
+    "frames_enviados": ("Frames Enviados", "mdi:upload-network", lambda m: int(m.frames_sent.total)),
+    "heartbeats": ("Heartbeats Recebidos", "mdi:heart-pulse", lambda m: int(m.heartbeats.total)),
+    "nacks": ("Comandos Recusados", "mdi:close-network", lambda m: int(m.nacks.total)),
+    "timeouts": ("Timeouts de Comando", "mdi:timer-alert", lambda m: int(m.timeouts.total)),
+    "reconexoes": ("Reconexões", "mdi:lan-connect", lambda m: int(m.reconnects.total)),
+}
+"""Chave -> (nome, ícone, leitura do contador) dos sensores de métricas do servidor."""
 
-class AMTBaseSensor(CoordinatorEntity[AMTCoordinator], SensorEntity):
+METRICS_REFRESH_INTERVAL = timedelta(seconds=60)
+"""Intervalo de leitura dos sensores de métricas (independente do coordinator)."""
+
+LATENCY_WINDOW = timedelta(minutes=15)
+"""Janela da latência média (cobre o intervalo de consulta mais lento, 10 min)."""
+
+
+class AMTBaseSensor(AMTEntity, SensorEntity):
     """Base class para sensors da central."""
     
     _attr_has_entity_name = True
@@ -62,19 +117,9 @@ class AMTBaseSensor(CoordinatorEntity[AMTCoordinator], SensorEntity):
         """
         super().__init__(coordinator)
         self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_{unique_id_suffix}"
+        self._attr_unique_id = f"{coordinator.unique_prefix}_{unique_id_suffix}"
         self._attr_name = name
     
-    @property
-    def device_info(self):
-        """Informações do dispositivo."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": "Intelbras AMT 2018 / 4010",
-            "manufacturer": "Intelbras",
-            "model": "AMT 2018 / 4010",
-        }
-
 
 class AMTModelSensor(AMTBaseSensor):
     """Sensor para modelo da central."""
@@ -275,4 +320,173 @@ class AMTArmedStatusSensor(AMTBaseSensor):
         }
 
 
+class AMTZoneMapSensor(AMTBaseSensor):
+    """Sensor agregado com todas as zonas de uma categoria (modo agregado).
+    
+    O estado é o número de zonas ativas; a bitmask e a lista de zonas ficam
+    em atributos que não são gravados pelo recorder, então uma rajada de
+    mudanças gera uma linha por categoria em vez de uma por zona.
+    """
+    
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"bitmask", "zonas"})
+    
+    def __init__(
+        self,
+        coordinator: AMTCoordinator,
+        entry: ConfigEntry,
+        zone_type: str,
+        name: str,
+    ) -> None:
+        """Inicializa o sensor de mapa de zonas.
+        
+        Args:
+            coordinator: Coordinator do status.
+            entry: Config entry.
+            zone_type: Tipo de zona (chave de ``ZONE_TYPES``).
+            name: Nome do sensor.
+        """
+        super().__init__(coordinator, entry, f"mapa_zonas_{zone_type}", name)
+        self.zone_type = zone_type
+        self._attr_icon = "mdi:view-grid"
+        self._bitmaps = {
+            size: layout.zone_bitmap(ZONE_TYPES[zone_type])
+            for size, layout in STATUS_LAYOUTS.items()
+        }
+    
+    @property
+    def bitmask(self) -> int | None:
+        """Bitmask das zonas ativas (bit i = zona i + 1)."""
+        if not self.coordinator.data:
+            return None
+        raw = self.coordinator.data.raw_data
+        bitmap = self._bitmaps.get(len(raw))
+        return bitmap.mask(raw) if bitmap else None
+    
+    @property
+    def native_value(self) -> int | None:
+        """Retorna o número de zonas ativas."""
+        bitmask = self.bitmask
+        return None if bitmask is None else bitmask.bit_count()
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Bitmask (hex) e lista de zonas ativas."""
+        bitmask = self.bitmask
+        if bitmask is None:
+            return {}
+        return {
+            "bitmask": f"0x{bitmask:016X}",
+            "zonas": [zone + 1 for zone in range(bitmask.bit_length()) if bitmask >> zone & 1],
+        }
+    
+    def _state_fingerprint(self) -> tuple[bool, int | None]:
+        """A bitmask determina o estado e os atributos."""
+        return self.available, self.bitmask
+
+
+class AMTMetricSensor(AMTBaseSensor):
+    """Valor das métricas do servidor (diagnóstico, desabilitado por padrão).
+    
+    Lido de ``server.metrics`` a cada ``METRICS_REFRESH_INTERVAL``: os
+    contadores sobem com a central ociosa, quando o coordinator não notifica
+    as entidades (status inalterado). A série completa (por comando, código
+    de NACK etc) fica no endpoint OpenMetrics do servidor standalone.
+    """
+    
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    
+    def __init__(
+        self,
+        coordinator: AMTCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+        icon: str,
+        value: Callable[[ServerMetrics], float],
+    ) -> None:
+        """Inicializa o sensor de métrica.
+        
+        Args:
+            coordinator: Coordinator do status.
+            entry: Config entry.
+            key: Chave do sensor (sufixo do unique_id).
+            name: Nome do sensor.
+            icon: Ícone do sensor.
+            value: Leitura do valor em ``ServerMetrics``.
+        """
+        super().__init__(coordinator, entry, f"metrica_{key}", name)
+        self._attr_icon = icon
+        self._value = value
+    
+    async def async_added_to_hass(self) -> None:
+        """Registra a leitura periódica das métricas."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_refresh, METRICS_REFRESH_INTERVAL)
+        )
+    
+    @callback
+    def _async_refresh(self, now: datetime) -> None:
+        """Grava o valor atual das métricas, se mudou."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint != self._last_fingerprint:
+            self._last_fingerprint = fingerprint
+            self.async_write_ha_state()
+    
+    @property
+    def available(self) -> bool:
+        """Métricas do servidor existem mesmo sem central conectada."""
+        return True
+    
+    @property
+    def native_value(self) -> float | None:
+        """Retorna o valor lido das métricas."""
+        return self._value(self.coordinator.server.metrics)
+
 
+class AMTCommandLatencySensor(AMTMetricSensor):
+    """Latência média (RTT) dos comandos respondidos nos últimos ``LATENCY_WINDOW``.
+    
+    A cada leitura guarda a soma e a contagem do histograma de RTT; a média
+    é a diferença entre a leitura atual e a mais antiga da janela, então
+    reflete a latência recente e não a média desde o início.
+    """
+    
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+    
+    def __init__(self, coordinator: AMTCoordinator, entry: ConfigEntry) -> None:
+        """Inicializa o sensor de latência."""
+        super().__init__(
+            coordinator, entry, "latencia_comandos", "Latência Média de Comandos",
+            "mdi:timer-outline", lambda metrics: self._average,
+        )
+        self._average: float | None = None
+        self._readings: deque[tuple[float, int]] = deque(
+            maxlen=int(LATENCY_WINDOW / METRICS_REFRESH_INTERVAL) + 1
+        )
+        """(soma, contagem) do RTT em cada leitura, da mais antiga à atual."""
+    
+    async def async_added_to_hass(self) -> None:
+        """Guarda a leitura inicial da janela."""
+        self._read_rtt()
+        await super().async_added_to_hass()
+    
+    @callback
+    def _async_refresh(self, now: datetime) -> None:
+        """Atualiza a média da janela e grava o estado."""
+        self._read_rtt()
+        super()._async_refresh(now)
+    
+    def _read_rtt(self) -> None:
+        """Acrescenta a leitura atual e recalcula a média (None sem comandos na janela)."""
+        rtt = self.coordinator.server.metrics.command_rtt
+        self._readings.append((rtt.sum(), rtt.count()))
+        (first_sum, first_count), (last_sum, last_count) = self._readings[0], self._readings[-1]
+        count = last_count - first_count
+        self._average = (last_sum - first_sum) / count * 1000 if count else None
@@ -0,0 +1,55 @@
+"""Seleção das zonas que viram entidades no Home Assistant."""
+
+import re
+
+ZONE_RANGE_PATTERN = re.compile(r"^(\d+)\s*(?:-\s*(\d+))?$")
+"""Item de uma lista de zonas: número único ("12") ou intervalo ("1-8")."""
+
+MAX_ZONE_NUMBER = 64
+"""Maior número de zona aceito (AMT 4010)."""
+
+ZONE_TYPES: dict[str, str] = {
+    "aberta": "open_zones",
+    "violada": "violated_zones",
+    "bypass": "bypassed_zones",
+    "tamper": "tamper_zones",
+    "curto_circuito": "short_circuit_zones",
+    "bateria_baixa": "low_battery_zones",
+}
+"""Tipo de sensor de zona -> atributo de ``ZoneStatus``."""
+
+
+def parse_zone_list(text: str | None) -> set[int]:
+    """Converte uma lista de zonas digitada pelo usuário em números.
+    
+    Args:
+        text: Lista separada por vírgulas, com números ou intervalos
+            (ex: "1-8, 12, 20-22"). Vazio = nenhuma zona.
+        
+    Returns:
+        Conjunto com os números das zonas.
+        
+    Raises:
+        ValueError: Se algum item for inválido ou estiver fora de 1-64.
+    """
+    zones: set[int] = set()
+    if not text:
+        return zones
+    
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        
+        match = ZONE_RANGE_PATTERN.match(item)
+        if not match:
+            raise ValueError(f"Item inválido na lista de zonas: '{item}'")
+        
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if not 1 <= first <= last <= MAX_ZONE_NUMBER:
+            raise ValueError(f"Intervalo de zonas inválido: '{item}'")
+        
+        zones.update(range(first, last + 1))
+    
+    return zones